@@ -1,10 +1,21 @@
 # api/__init__.py
 import os
 import importlib
+import sys
 
 _api_registry = {}
 _apis_discovered = False # Added a discovery flag
 
+# Backend name -> module registering it. Only the selected backend's module, and so its SDK
+# (openai, google.generativeai and their grpc/httpx trees), is imported, on first use.
+API_MODULES = {
+    "deepseek": "api.deepseek_api",
+    "openai": "api.openai_api",
+    "google": "api.google_api",
+    "alibaba-qwen": "api.alibaba_qwen_api",
+    "mock": "api.mock_api",
+}
+
 
 def register_api(name):
     """
@@ -19,6 +30,8 @@ def _discover_apis(api_dir):
     """
     Discovers and imports all available API classes in the specified directory.
 
+    Only used for backends missing from API_MODULES, e.g. a module dropped into api_dir.
+
     Args:
         api_dir (str): The directory containing the API implementations.
     """
@@ -29,10 +42,12 @@ def _discover_apis(api_dir):
         if filename.endswith('.py') and filename != '__init__.py' and filename != "api.py":
             module_name = filename[:-3] # remove .py
             module_path = f"api.{module_name}"
+            if module_path in API_MODULES.values():
+              continue  # Imported on demand by create_api_instance
             try:
               importlib.import_module(module_path)
             except ModuleNotFoundError as e:
-              print(f"Warning: Could not import {module_path}. Error: {e}")
+              print(f"Warning: Could not import {module_path}. Error: {e}", file=sys.stderr)
     _apis_discovered = True
 
 
@@ -51,10 +66,19 @@ def create_api_instance(api_type, api_key=None, api_dir=None):
 
     Raises:
         ValueError: If the API type is invalid.
+        ImportError: If the backend's SDK is not installed.
     """
-    if not api_dir:
-       api_dir = os.path.join(os.path.dirname(__file__))
-    _discover_apis(api_dir)
+    if api_type not in _api_registry:
+        module_path = API_MODULES.get(api_type)
+        if module_path:
+            try:
+                importlib.import_module(module_path)
+            except ImportError as e:
+                raise ImportError(f"The {api_type} backend needs a package that is not installed: {e}") from e
+        else:
+            if not api_dir:
+               api_dir = os.path.join(os.path.dirname(__file__))
+            _discover_apis(api_dir)
     api_class = _api_registry.get(api_type)
     if not api_class:
         raise ValueError(f"Invalid API type: {api_type}")
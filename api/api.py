@@ -1,7 +1,6 @@
 # api/api.py
 import os
 from abc import ABC, abstractmethod
-from dotenv import load_dotenv
 
 
 class API(ABC):
@@ -62,6 +61,8 @@ class API(ABC):
         :return: The API key as a string.
         :raises ValueError: If the API key is not found in the environment variables.
         """
+        from dotenv import load_dotenv  # Only needed for keys from the environment
+
         dotenv_path = os.path.join(os.getcwd(), ".env")
         load_dotenv(dotenv_path)
 
@@ -75,6 +76,10 @@ class API(ABC):
         """
         Abstract method to generate text from a given prompt.
 
+        Runs on the application's LLM event loop (core.async_loop), shared by every call, so
+        implementations must not block it: await the provider's async client, or wrap a
+        synchronous SDK call in asyncio.to_thread.
+
         Args:
             prompt (str): The input prompt for text generation.
             **kwargs: Additional keyword arguments for the API call.
@@ -83,3 +88,21 @@ class API(ABC):
             str: The generated text.
         """
         pass
+
+    async def stream_text(self, prompt, **kwargs):
+        """
+        Async generator yielding the generated text piece by piece as the provider sends it.
+
+        Backends that support streaming override this; the default yields the whole
+        generate_text result once, so every backend can be streamed.
+
+        Args:
+            prompt (str): The input prompt for text generation.
+            **kwargs: Additional keyword arguments for the API call.
+
+        Yields:
+            str: Consecutive pieces of the generated text.
+        """
+        text = await self.generate_text(prompt, **kwargs)
+        if text:
+            yield text
@@ -45,12 +45,35 @@ class GoogleAPI(API):
         """
         model = genai.GenerativeModel(self.MODEL_NAME)
         try:
-            response = model.generate_content(prompt)
+            response = await model.generate_content_async(prompt)
             return extract_xml_from_markdown(response.text)
         except Exception as e:
             print(f"Error generating text with Google API: {e}")
             raise
 
+    async def stream_text(self, prompt, **kwargs):
+        """
+        Streams text from the Google API as it is generated.
+
+        Unlike generate_text, XML code blocks are not extracted: the pieces are passed on as they arrive.
+
+        Args:
+            prompt (str): The input prompt for text generation.
+            **kwargs: Additional keyword arguments for the API call.
+
+        Yields:
+            str: Text of each response chunk.
+        """
+        model = genai.GenerativeModel(self.MODEL_NAME)
+        response = await model.generate_content_async(prompt, stream=True, **kwargs)
+        async for chunk in response:
+            # chunk.text raises ValueError on chunks without text parts (safety blocks, the final
+            # finish_reason chunk), so the parts are read directly and such chunks are skipped.
+            for candidate in chunk.candidates[:1]:
+                for part in candidate.content.parts:
+                    if part.text:
+                        yield part.text
+
     def list_models(self):
         print("List of models that support generateContent:\n")
         for m in genai.list_models():
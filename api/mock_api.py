@@ -2,6 +2,7 @@
 from api.api import API
 from api import register_api
 import asyncio
+import re
 
 
 @register_api("mock")
@@ -10,13 +11,17 @@ class MockAPI(API):
     Mock implementation of the API class for testing without real API calls.
     """
 
-    def __init__(self, api_key=None):
+    STREAM_DELAY = 0.05  # Seconds between streamed words, to mimic a provider generating tokens
+
+    def __init__(self, api_key=None, stream_delay=None):
         """
         Initializes the MockAPI object.
 
         :param api_key: Can be either an actual API key string or a path to a file containing the API key.
+        :param stream_delay: Seconds between the pieces yielded by stream_text (default STREAM_DELAY).
         """
         super().__init__(api_key)
+        self.stream_delay = self.STREAM_DELAY if stream_delay is None else stream_delay
 
     async def generate_text(self, prompt, timeout=10, **kwargs):
         """
@@ -34,6 +39,21 @@ class MockAPI(API):
         except Exception as e:
             return f"An unexpected error occurred: {e}"
 
+    async def stream_text(self, prompt, delay=None, **kwargs):
+        """
+        Streams the mocked response word by word, sleeping between words.
+
+        :param prompt: The input prompt for the mock API.
+        :param delay: Seconds between words; overrides stream_delay for this call.
+        :param kwargs: Additional parameters passed on to generate_text.
+        :return: Async generator of the words of generate_text's response, with their trailing whitespace.
+        """
+        delay = self.stream_delay if delay is None else delay
+        text = await self.generate_text(prompt, **kwargs)
+        for word in re.findall(r"\S+\s*", text):
+            await asyncio.sleep(delay)
+            yield word
+
 
 if __name__ == "__main__":
     # Example usage of MockAPI
@@ -2,7 +2,7 @@
 import asyncio
 from api.api import API
 from api import register_api
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 
 @register_api("openai")
@@ -19,7 +19,7 @@ class OpenAIAPI(API):
                         a path to a file containing the API key.
         """
         super().__init__(api_key, api_env="OPENAI_API_KEY")
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = AsyncOpenAI(api_key=self.api_key)
         # If we don’t have a key or a client, raise an error.
         if not self.api_key or not self.client:
             raise ValueError(
@@ -62,7 +62,7 @@ class OpenAIAPI(API):
             messages = prompt
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=model,
                 messages=messages,
                 stream=False,
@@ -76,6 +76,43 @@ class OpenAIAPI(API):
             print(f"An error occurred while generating text: {e}")
             return None
 
+    async def stream_text(
+        self,
+        prompt,
+        model="chatgpt-4o-latest",
+        max_tokens=8192,
+        temperature=1.0,
+        **kwargs,
+    ):
+        """
+        Streams text from the OpenAI API as it is generated.
+
+        Args:
+            prompt (str | list): The input prompt, or messages in chat format.
+            model (str): The model to use.
+            max_tokens (int): The maximum number of tokens for the generated text.
+            temperature (float): The sampling temperature.
+            **kwargs: Additional keyword arguments for the API call.
+
+        Yields:
+            str: Content deltas of the response.
+        """
+        messages = [{"role": "system", "content": prompt}] if isinstance(prompt, str) else prompt
+        stream = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            stream=True,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs,
+        )
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            await stream.close()  # Also when the consumer stops early, e.g. a cancelled call
+
     def test_api(self):
         """
         A simple test method to verify the API setup by making a single request.
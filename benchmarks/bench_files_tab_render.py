@@ -0,0 +1,77 @@
+# benchmarks/bench_files_tab_render.py
+"""
+Compares filling the Files tab with one appendPlainText per file against rendering
+the whole text first and doing a single setPlainText with undo disabled.
+
+Each strategy fills a new editor that is shown at 800x600, and the timing includes the
+event processing that lays the text out, since that is where per-file appends pay.
+
+Needs PySide6; runs without a display through the offscreen platform:
+    python -m benchmarks.bench_files_tab_render [file_count]
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import shiboken6  # noqa: E402
+from PySide6.QtWidgets import QApplication, QPlainTextEdit  # noqa: E402
+
+from core.prompt_builder import set_plain_text_bulk  # noqa: E402
+from core.prompt_renderer import join_blocks, render_file_block  # noqa: E402
+
+
+def synthetic_files(count, lines_per_file=80):
+    body = "\n".join(f"def function_{i}(value):\n    return value * {i}" for i in range(lines_per_file // 2))
+    return [(f"/project/pkg/module_{i}.py", body) for i in range(count)]
+
+
+def per_file_append(text_edit, files):
+    for file_path, content in files:
+        text_edit.appendPlainText(render_file_block(file_path, content, line_numbers=True))
+
+
+def single_update(text_edit, files):
+    blocks = [render_file_block(file_path, content, line_numbers=True) for file_path, content in files]
+    set_plain_text_bulk(text_edit, join_blocks(blocks))
+
+
+def time_fill(app, fill, files):
+    """Fills a new, shown editor (as the Files tab is) and returns (seconds including layout, resulting text)."""
+    text_edit = QPlainTextEdit()
+    text_edit.resize(800, 600)
+    text_edit.show()
+    app.processEvents()
+    start = time.perf_counter()
+    fill(text_edit, files)
+    app.processEvents()  # Layout and painting of the new text happen here
+    elapsed = time.perf_counter() - start
+    text = text_edit.toPlainText()
+    text_edit.close()
+    shiboken6.delete(text_edit)  # Destroyed now, not during interpreter teardown after the QApplication
+    return elapsed, text
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    app = QApplication.instance() or QApplication(sys.argv)
+    files = synthetic_files(count)
+
+    results = {}
+    for name, fill in (("appendPlainText per file", per_file_append), ("single setPlainText", single_update)):
+        results[name] = time_fill(app, fill, files)
+
+    (slow_name, (slow_time, slow_text)), (fast_name, (fast_time, fast_text)) = results.items()
+    print(f"{count} files")
+    print(f"{slow_name:26}: {slow_time * 1000:8.1f} ms")
+    print(f"{fast_name:26}: {fast_time * 1000:8.1f} ms")
+    print(f"speedup                   : {slow_time / fast_time:8.1f}x (same text: {slow_text == fast_text})")
+    sys.stdout.flush()
+    # Thousands of PySide calls returning None can leave None's refcount short with some PySide6
+    # builds, which aborts interpreter finalization (none_dealloc); the results are out, so skip it.
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
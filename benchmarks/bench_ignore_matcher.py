@@ -0,0 +1,56 @@
+# benchmarks/bench_ignore_matcher.py
+"""
+Compares the compiled IgnoreMatcher against the former per-pattern fnmatch loop
+used by core.project_tree_view._is_ignored.
+
+Run from the repository root:
+    python -m benchmarks.bench_ignore_matcher
+"""
+import fnmatch
+import os
+import time
+
+from core.ignore_matcher import IgnoreMatcher, read_ignore_file
+
+
+def legacy_is_ignored(project_root, ignore_patterns, path):
+    for pattern in ignore_patterns:
+        path_from_root = path.replace(project_root, "").lstrip(os.sep).replace(os.sep, "/")
+        if fnmatch.fnmatch(path_from_root, pattern) or fnmatch.fnmatch(os.path.basename(path), pattern):
+            return True
+    return False
+
+
+def synthetic_paths(root, dirs=200, files_per_dir=50):
+    extensions = (".py", ".ts", ".md", ".json", ".pyc", ".lock", ".png", ".txt")
+    paths = []
+    for d in range(dirs):
+        dir_path = os.path.join(root, f"pkg_{d % 20}", f"module_{d}")
+        paths.append((dir_path, True))
+        for f in range(files_per_dir):
+            paths.append((os.path.join(dir_path, f"file_{f}{extensions[f % len(extensions)]}"), False))
+    return paths
+
+
+def main():
+    root = os.path.abspath(os.sep + os.path.join("tmp", "bench_project"))
+    patterns = read_ignore_file(".ignore") + ["*.pyc", "*.png", "build/", "docs/**/*.txt", "!keep.png"]
+    paths = synthetic_paths(root)
+
+    start = time.perf_counter()
+    legacy = [legacy_is_ignored(root, patterns, p) for p, _ in paths]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = IgnoreMatcher(patterns, root)
+    compiled = [matcher.is_ignored(p, is_dir) for p, is_dir in paths]
+    compiled_time = time.perf_counter() - start
+
+    print(f"{len(paths)} paths x {len(patterns)} patterns")
+    print(f"legacy fnmatch loop: {legacy_time * 1000:8.1f} ms ({sum(legacy)} ignored)")
+    print(f"IgnoreMatcher:       {compiled_time * 1000:8.1f} ms ({sum(compiled)} ignored, incl. compile)")
+    print(f"speedup:             {legacy_time / compiled_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
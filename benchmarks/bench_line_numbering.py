@@ -0,0 +1,56 @@
+# benchmarks/bench_line_numbering.py
+"""
+Microbenchmarks for the line enumerator used by the Files and Context tabs.
+
+Run from the repository root:
+    python -m benchmarks.bench_line_numbering [line_count]
+"""
+import sys
+import timeit
+
+from core import prompt_renderer
+from core.prompt_renderer import number_lines
+
+
+def legacy_number_lines(content):
+    numbered_prompt = ""
+    for i, line in enumerate(content.splitlines()):
+        numbered_prompt += f"{i+1}→{line}\n"
+    return numbered_prompt
+
+
+def fstring_join_number_lines(content):
+    # Previous number_lines: one f-string per line, joined once.
+    return "".join([f"{number}→{line}\n" for number, line in enumerate(content.splitlines(), 1)])
+
+
+def cold_number_lines(content):
+    prompt_renderer._number_columns.clear()
+    return number_lines(content)
+
+
+def main():
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    content = "\n".join(f"    result_{i} = compute(value_{i}, factor={i % 7})  # generated" for i in range(line_count))
+    assert legacy_number_lines(content) == fstring_join_number_lines(content) == number_lines(content)
+    small_files = ["\n".join(content.splitlines()[:200])] * 250
+
+    print(f"{line_count} lines, best of 5")
+    for name, func in (
+        ("legacy str +=", legacy_number_lines),
+        ("f-string join", fstring_join_number_lines),
+        ("number_lines (cold)", cold_number_lines),
+        ("number_lines", number_lines),
+        ("number_lines width=6", lambda text: number_lines(text, width=6)),
+    ):
+        best = min(timeit.repeat(lambda: func(content), number=1, repeat=5))
+        print(f"{name:22}: {best * 1000:8.1f} ms")
+
+    print(f"{len(small_files)} files of 200 lines, best of 5")
+    for name, func in (("legacy str +=", legacy_number_lines), ("number_lines", number_lines)):
+        best = min(timeit.repeat(lambda: [func(text) for text in small_files], number=1, repeat=5))
+        print(f"{name:22}: {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# benchmarks/bench_startup.py
+"""
+Measures startup costs in fresh interpreters: importing the main window, loading its form
+at runtime (loadUiType) versus from the generated module (ui/forms.py), importing the LLM
+handler, and creating a backend with lazy (API_MODULES) versus eager (import every backend) loading.
+
+Each scenario runs in a new process, so nothing is cached between runs; the median of
+the repeats is reported with the SDK modules the scenario pulled in, and checked against
+its target in TARGETS_MS if it has one. Scenarios whose dependencies are missing (e.g.
+PySide6, openai) are reported as skipped.
+    python -m benchmarks.bench_startup [repeats]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("PySide6", "openai", "google.generativeai", "grpc", "httpx")
+
+# Emulates the old create_api_instance, which imported every module of the api package first.
+_EAGER_DISCOVERY = """
+import importlib
+import api
+for module_path in api.API_MODULES.values():
+    try:
+        importlib.import_module(module_path)
+    except ImportError:
+        pass
+api.create_api_instance("mock", api_key="benchmark")
+"""
+
+# Startup targets. On the reference machine (one vCPU) runtime loadUiType took ~220 ms and the
+# generated module ~50 ms, most of it PySide6 creating the Qt classes the form imports.
+TARGETS_MS = {
+    "import ui.main_window": 400,
+    "main window form, generated module": 100,
+}
+
+# (name, untimed setup, timed code)
+SCENARIOS = [
+    ("import ui.main_window", "", "import ui.main_window"),
+    (
+        "main window form, loadUiType (before)",
+        "import PySide6.QtWidgets",
+        'from PySide6.QtUiTools import loadUiType\nloadUiType("ui/ui_main_window.ui")',
+    ),
+    (
+        "main window form, generated module",
+        "import PySide6.QtWidgets",
+        'from ui.forms import load_form\n'
+        'load_form("ui/ui_main_window.ui", "ui.ui_main_window", "Ui_MainWindow", PySide6.QtWidgets.QMainWindow)',
+    ),
+    ("import core.llm_handler", "", "import core.llm_handler"),
+    ("mock backend, eager discovery (before)", "", _EAGER_DISCOVERY),
+    ("mock backend, lazy registry", "", 'import api\napi.create_api_instance("mock", api_key="benchmark")'),
+]
+
+_RUNNER = """
+import json, sys, time
+elapsed = 0.0
+try:
+    exec(compile(sys.argv[1], "<setup>", "exec"))
+    start = time.perf_counter()
+    exec(compile(sys.argv[2], "<scenario>", "exec"))
+    elapsed = time.perf_counter() - start
+    error = None
+except Exception as e:
+    error = f"{type(e).__name__}: {e}"
+heavy = [name for name in json.loads(sys.argv[3]) if name in sys.modules]
+print(json.dumps({"elapsed": elapsed, "error": error, "heavy": heavy}))
+"""
+
+
+def run_scenario(setup, code, repeats):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = []
+    for _ in range(repeats):
+        completed = subprocess.run(
+            [sys.executable, "-c", _RUNNER, setup, code, json.dumps(HEAVY_MODULES)],
+            cwd=root,  # ui.main_window loads its .ui file relative to the working directory
+            capture_output=True,
+            text=True,
+            env=dict(os.environ, QT_QPA_PLATFORM="offscreen"),
+        )
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        if result["error"]:
+            return result
+        results.append(result)
+    return {
+        "elapsed": statistics.median(result["elapsed"] for result in results),
+        "error": None,
+        "heavy": results[-1]["heavy"],
+    }
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"Median of {repeats} fresh interpreter(s) per scenario:")
+    for name, setup, code in SCENARIOS:
+        result = run_scenario(setup, code, repeats)
+        if result["error"]:
+            print(f"  {name:<42} skipped ({result['error']})")
+            continue
+        heavy = ", ".join(result["heavy"]) or "none"
+        line = f"  {name:<42} {result['elapsed'] * 1000:8.1f} ms   heavy modules: {heavy}"
+        if name in TARGETS_MS:
+            met = result["elapsed"] * 1000 <= TARGETS_MS[name]
+            line += f"   target {TARGETS_MS[name]} ms: {'met' if met else 'MISSED'}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+# cli.py
+"""
+Headless prompt composer for scripts and CI jobs.
+
+    python -m cli compose project.json > prompt.txt
+    python -m cli tree project.json
+    python -m cli deps project.json path/to/file.py
+    python -m cli deps --reverse project.json path/to/file.py
+    python -m cli count README.md src/*.py
+
+A project argument is a project file saved by the application, or a project folder
+(default settings). Only Qt-free core modules are imported, never PySide6 or the LLM
+SDKs; modules a subcommand does not need are imported inside that subcommand.
+"""
+import argparse
+import json
+import os
+import sys
+
+from core.file_handler import FileHandler
+from core.ignore_matcher import IgnoreMatcher, read_ignore_file
+from core.project_index import ProjectIndex
+from core.prompt_renderer import LINE_NUMBER_SEPARATOR, render_file_block
+
+READ_BATCH_FILES = 64  # Files read (concurrently) per step while streaming the Files section
+
+
+class ConsoleMessages:
+    """Stands in for ui.utils.dialogs.WarningBox: messages go to stderr."""
+
+    def message_box(self, title, message):
+        print(f"{title}: {message}", file=sys.stderr)
+
+
+def load_project(path):
+    """Returns the data of a saved project file, or default settings for a project folder."""
+    if os.path.isdir(path):
+        return {"project_path": path}
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise SystemExit(f"error: cannot load project {path}: {e}")
+
+
+def project_root(project_data):
+    root = project_data.get("project_path")
+    if not root or not os.path.isdir(root):
+        raise SystemExit(f"error: project folder not found: {root!r}")
+    return os.path.normpath(os.path.abspath(root))
+
+
+def scan_project(project_data):
+    """Indexes the project like the file tree: saved ignore patterns, else the project's .ignore file."""
+    root = project_root(project_data)
+    patterns = project_data.get("ignore_patterns")
+    ignore_path = os.path.join(root, ".ignore")
+    if not patterns and os.path.exists(ignore_path):
+        patterns = read_ignore_file(ignore_path)
+    return ProjectIndex.from_scan(root, IgnoreMatcher(patterns or [], root).is_ignored)
+
+
+def make_file_handler(project_data):
+    file_handler = FileHandler(ConsoleMessages())
+    file_handler.max_read_workers = project_data.get("max_read_workers", file_handler.max_read_workers)
+    file_handler.max_file_bytes = project_data.get("max_file_bytes", file_handler.max_file_bytes)
+    file_handler.max_total_bytes = project_data.get("max_total_bytes", file_handler.max_total_bytes)
+    return file_handler
+
+
+def render_options(project_data):
+    """Same keyword arguments as MainWindow.file_render_options, from the saved settings."""
+    return {
+        "output_type": project_data.get("output_type", "xml"),
+        "line_numbers": project_data.get("line_enumerator_checked", False),
+        "line_number_width": project_data.get("line_number_width", 0),
+        "line_number_separator": project_data.get("line_number_separator", LINE_NUMBER_SEPARATOR),
+    }
+
+
+def make_tokenizer(project_data, vocab_path=None):
+    from core.tokenizer import load_tokenizer
+
+    return load_tokenizer(vocab_path or project_data.get("tokenizer_vocab_path", ""))
+
+
+def find_dependencies(project_data, file_path, args, reverse=False):
+    """
+    Dependency closure of file_path with the saved limits, overridden by the command-line options.
+
+    With reverse, returns the files that import file_path instead, from an import graph of the whole project.
+    """
+    from core.dependency_analyzer import BYTES_PER_TOKEN, DependencyAnalyzer
+    from core.dynamic_import_rules import DEFAULT_DYNAMIC_IMPORT_RULES
+    from core.import_cache import ImportCache
+
+    import_cache = ImportCache()
+    analyzer = DependencyAnalyzer(
+        project_root(project_data),
+        import_cache=import_cache,
+        dynamic_import_rules=project_data.get("dynamic_import_rules", DEFAULT_DYNAMIC_IMPORT_RULES),
+    )
+    max_depth = args.max_depth if args.max_depth is not None else project_data.get("dependency_max_depth")
+    max_tokens = args.max_tokens if args.max_tokens is not None else project_data.get("dependency_max_tokens")
+    exclude = project_data.get("dependency_exclude", []) + (args.exclude or [])
+    try:
+        if not reverse:
+            return analyzer.find_dependencies(file_path, max_depth=max_depth, max_tokens=max_tokens, exclude=exclude)
+        from core.import_graph import ImportGraph
+
+        graph = ImportGraph.build(analyzer, scan_project(project_data).iter_files())
+        return graph.find_dependents(
+            file_path,
+            max_depth=max_depth,
+            max_bytes=max_tokens * BYTES_PER_TOKEN if max_tokens is not None else None,
+            is_excluded=analyzer.exclusion_matcher(exclude),
+        )
+    finally:
+        import_cache.close()
+
+
+def iter_rendered_blocks(file_paths, file_handler, options):
+    """
+    Reads and renders files a batch at a time, so memory does not grow with the number of files.
+
+    Yields:
+        tuple: (file path, rendered block); unreadable and empty files are left out.
+    """
+    for start in range(0, len(file_paths), READ_BATCH_FILES):
+        batch = file_paths[start:start + READ_BATCH_FILES]
+        for file_path, file_content in zip(batch, file_handler.read_many(batch)):
+            if file_content:
+                yield file_path, render_file_block(file_path, file_content, **options)
+
+
+def compose(args):
+    from core.prompt_stream import iter_joined_blocks, iter_prompt_chunks, joined_block_chunks, write_prompt
+
+    project_data = load_project(args.project)
+    file_handler = make_file_handler(project_data)
+    options = render_options(project_data)
+    distances = {
+        os.path.normpath(os.path.abspath(path)): distance
+        for path, distance in project_data.get("files_tab_distances", {}).items()
+    }
+
+    file_paths = {os.path.normpath(os.path.abspath(path)) for path in project_data.get("files_tab_paths", [])}
+    candidates = set()
+    if args.all_files:
+        candidates.update(os.path.normpath(path) for path in scan_project(project_data).iter_files())
+    for start_file in args.with_deps or []:
+        found, _ = find_dependencies(project_data, start_file, args)
+        for path, distance in found.items():
+            path = os.path.normpath(os.path.abspath(path))
+            candidates.add(path)
+            distances[path] = min(distances.get(path, distance), distance)
+    if candidates - file_paths:
+        accepted, skipped = file_handler.filter_prompt_files(sorted(candidates - file_paths))
+        file_handler.report_skipped(skipped)
+        file_paths.update(accepted)
+    # Same order as the Files tab
+    file_paths = sorted(file_paths, key=lambda x: (os.path.dirname(x).lower(), os.path.basename(x).lower()))
+
+    # Saved tabs in tab order; the Files tab is rebuilt from its paths and patches are not saved.
+    sections = [
+        (tab_text, text.strip())
+        for tab_text, text in project_data.get("prompts", {}).items()
+        if tab_text not in ("Files", "Patch Comparison") and text.strip()
+    ]
+    limit = args.limit if args.limit is not None else project_data.get("context_token_limit", 0)
+    report = None
+    if limit or args.report:
+        from core.prompt_budget import TRIM_STRATEGIES, budget_prompt_sections
+
+        # Budgeting needs every file's count before anything is written, so the blocks are held in memory.
+        tokenizer = make_tokenizer(project_data, args.vocab)
+        files = [
+            (file_path, block, tokenizer.count(block), distances.get(file_path, 0))
+            for file_path, block in iter_rendered_blocks(file_paths, file_handler, options)
+        ]
+        files_index = None
+        if files:
+            sections.append(("Files", joined_block_chunks([block for _, block, _, _ in files])))
+            files_index = len(sections) - 1
+        sections, report = budget_prompt_sections(
+            sections,
+            files_index,
+            files,
+            tokenizer.count,
+            file_handler.read_many,
+            options,
+            limit=limit,
+            strategies=project_data.get("prompt_trim_strategies", TRIM_STRATEGIES),
+        )
+    elif file_paths:
+        blocks = (block for _, block in iter_rendered_blocks(file_paths, file_handler, options))
+        sections.append(("Files", iter_joined_blocks(blocks)))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            write_prompt(iter_prompt_chunks(sections), f)
+    else:
+        write_prompt(iter_prompt_chunks(sections), sys.stdout)
+        sys.stdout.flush()
+    if report is not None:
+        print(report.format_summary(), file=sys.stderr)
+    return 1 if report is not None and report.over_budget else 0
+
+
+def tree(args):
+    project_data = load_project(args.project)
+    sys.stdout.write(make_file_handler(project_data).get_file_tree_string(scan_project(project_data)))
+    return 0
+
+
+def deps(args):
+    project_data = load_project(args.project)
+    distances, omitted = find_dependencies(project_data, args.file, args, reverse=args.reverse)
+    if not distances:
+        print(f"error: {args.file} is not a project file of a supported language", file=sys.stderr)
+        return 1
+    root = project_root(project_data)
+    for path, distance in sorted(distances.items(), key=lambda item: (item[1], item[0])):
+        print(f"{distance}\t{os.path.relpath(path, root)}")
+    if omitted:
+        kind = "dependent" if args.reverse else "dependency"
+        print(f"{len(omitted)} {kind} file(s) left out by the token budget", file=sys.stderr)
+    return 0
+
+
+def count(args):
+    from ui.utils.text_processor import TextProcessor
+
+    text_processor = TextProcessor(make_tokenizer({}, args.vocab))
+    totals = [0, 0, 0]
+    rows = []
+    for path in args.files or ["-"]:
+        if path == "-":
+            text = sys.stdin.read()
+        else:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    text = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"error: cannot read {path}: {e}", file=sys.stderr)
+                continue
+        counts = text_processor.count_text_properties(text)
+        rows.append((path, counts))
+        totals = [total + value for total, value in zip(totals, counts)]
+    print(f"tokenizer: {text_processor.tokenizer.name}")
+    for path, (tokens, characters, lines) in rows:
+        print(f"{tokens:>10} {characters:>12} {lines:>8}  {path}")
+    if len(rows) > 1:
+        print(f"{totals[0]:>10} {totals[1]:>12} {totals[2]:>8}  total")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m cli", description="Compose LLM prompts without the GUI.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_dependency_options(subparser):
+        subparser.add_argument("--max-depth", type=int, help="import distance limit (default: project setting)")
+        subparser.add_argument("--max-tokens", type=int, help="token budget of the closure (default: project setting)")
+        subparser.add_argument("--exclude", action="append", metavar="GLOB", help="gitignore-style exclusion")
+
+    compose_parser = subparsers.add_parser("compose", help="write the compiled prompt to stdout or a file")
+    compose_parser.add_argument("project", help="saved project file or project folder")
+    compose_parser.add_argument("-o", "--output", help="write to this file instead of stdout")
+    compose_parser.add_argument("--all-files", action="store_true", help="add every project file to the Files tab")
+    compose_parser.add_argument(
+        "--with-deps", action="append", metavar="FILE", help="add FILE and its dependencies to the Files tab"
+    )
+    compose_parser.add_argument("--limit", type=int, help="context limit in tokens (default: project setting)")
+    compose_parser.add_argument("--report", action="store_true", help="print the token breakdown to stderr")
+    compose_parser.add_argument("--vocab", help="tiktoken-format vocab file for token counts")
+    add_dependency_options(compose_parser)
+    compose_parser.set_defaults(handler=compose)
+
+    tree_parser = subparsers.add_parser("tree", help="print the project file tree")
+    tree_parser.add_argument("project", help="saved project file or project folder")
+    tree_parser.set_defaults(handler=tree)
+
+    deps_parser = subparsers.add_parser("deps", help="list a file's dependencies with their import distance")
+    deps_parser.add_argument("project", help="saved project file or project folder")
+    deps_parser.add_argument("file", help="file to start from")
+    deps_parser.add_argument(
+        "--reverse", action="store_true", help="list the files that import FILE instead (whole-project import graph)"
+    )
+    add_dependency_options(deps_parser)
+    deps_parser.set_defaults(handler=deps)
+
+    count_parser = subparsers.add_parser("count", help="count tokens, characters and lines")
+    count_parser.add_argument("files", nargs="*", help="files to count; '-' or none reads stdin")
+    count_parser.add_argument("--vocab", help="tiktoken-format vocab file")
+    count_parser.set_defaults(handler=count)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8")  # File blocks may hold any text, e.g. the line number arrow
+    try:
+        return args.handler(args)
+    except BrokenPipeError:  # Output piped into e.g. head, which exited early
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+# core/async_loop.py
+import asyncio
+import threading
+
+
+class AsyncLoopThread:
+    """
+    One asyncio event loop running for the life of the application in a daemon thread.
+
+    Coroutines are submitted from any thread and come back as concurrent.futures.Future
+    objects: callers wait on them, attach done callbacks or cancel them, which cancels the
+    running task (and with it the backend's HTTP request). Reusing one loop keeps the
+    backends' async clients and their connection pools alive between calls, where
+    asyncio.run would create and tear down a loop on every call.
+    """
+
+    def __init__(self, name="asyncio-loop"):
+        self.name = name
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Starts the loop thread if it is not running yet."""
+        with self._lock:
+            if self.running:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            # Cancel what is left so pending tasks do not warn on exit, then close the loop.
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+
+    def submit(self, coro):
+        """
+        Schedules a coroutine on the loop, starting the thread on first use.
+
+        Returns:
+            concurrent.futures.Future: Result of the coroutine; cancel() cancels its task.
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def stop(self, timeout=5.0):
+        """Cancels pending work, stops the loop and waits up to timeout seconds for the thread."""
+        with self._lock:
+            if not self.running:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+            self._thread = None
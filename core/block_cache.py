@@ -0,0 +1,67 @@
+# core/block_cache.py
+import os
+from collections import OrderedDict
+
+
+class RenderedBlockCache:
+    """
+    LRU cache of formatted file blocks with a memory budget.
+
+    Entries are keyed by (normalized path, mtime_ns, size, *render options) where the render
+    options are the output type and line numbering settings, so an edited file or a formatting
+    change simply misses the cache and no explicit invalidation is needed. Stale entries age
+    out through LRU eviction once max_bytes is exceeded.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._blocks = OrderedDict()
+
+    @staticmethod
+    def make_key(file_path, *render_options):
+        """Builds the cache key for a file from its current stat, or returns None if it cannot be stat'ed."""
+        file_path = os.path.normpath(os.path.abspath(file_path))
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (file_path, stat.st_mtime_ns, stat.st_size) + render_options
+
+    @staticmethod
+    def _block_size(block):
+        # str stores up to 4 bytes per character; len() is a cheap, stable approximation.
+        return len(block)
+
+    def get(self, key):
+        block = self._blocks.get(key)
+        if block is None:
+            self.misses += 1
+            return None
+        self._blocks.move_to_end(key)
+        self.hits += 1
+        return block
+
+    def put(self, key, block):
+        if key is None or block is None:
+            return
+        size = self._block_size(block)
+        if size > self.max_bytes:
+            return  # Never cache a block that would evict everything else
+        previous = self._blocks.pop(key, None)
+        if previous is not None:
+            self.total_bytes -= self._block_size(previous)
+        self._blocks[key] = block
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, evicted = self._blocks.popitem(last=False)
+            self.total_bytes -= self._block_size(evicted)
+
+    def clear(self):
+        self._blocks.clear()
+        self.total_bytes = 0
+
+    def __len__(self):
+        return len(self._blocks)
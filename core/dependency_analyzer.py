@@ -1,139 +1,266 @@
 # core/dependency_analyzer.py
-import ast
+import hashlib
 import os
 
+from core.ignore_matcher import IgnoreMatcher
+from core.dynamic_import_rules import (
+    DEFAULT_DYNAMIC_IMPORT_RULES,
+    expand_dynamic_import_rules,
+    parse_dynamic_import_rules,
+)
+from core.language_analyzers import language_for
+
+# Rough bytes per token of source code, used to turn a token budget into a byte budget without reading files.
+BYTES_PER_TOKEN = 4
+
+
+def read_import_specs(file_path):
+    """
+    Reads and parses one file for the import cache.
+
+    Module-level and free of analyzer state so it can run in worker processes.
+
+    Returns:
+        tuple | None: (mtime_ns, size, content hash, specs), or None if the file cannot be read
+            or its language is not supported.
+    """
+    language = language_for(file_path)
+    if language is None:
+        return None
+    try:
+        stat = os.stat(file_path)
+        with open(file_path, "rb") as f:
+            content = f.read()
+    except OSError:
+        return None
+    content_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+    return stat.st_mtime_ns, stat.st_size, content_hash, language.parse_specs(content, file_path)
+
+
+def bounded_closure(start, direct_dependencies, size_of, max_depth=None, max_bytes=None, is_excluded=None):
+    """
+    Breadth-first dependency closure with a depth limit, a size budget and exclusions.
+
+    Files are admitted level by level; within a level the smallest files go first, and a
+    file that does not fit the remaining budget is skipped (smaller ones may still fit).
+    Only admitted files are expanded, so nothing is parsed or read beyond the budget. The
+    start file is always included.
+
+    Args:
+        start (str): Normalized path of the start file.
+        direct_dependencies (callable): file -> iterable of the files it loads.
+        size_of (callable): file -> size in bytes.
+        max_depth (int | None): Maximum import distance from start; None for unlimited.
+        max_bytes (int | None): Total size budget of the closure; None for unlimited.
+        is_excluded (callable | None): file -> True to leave it (and what only it imports) out.
+
+    Returns:
+        tuple: ({file: distance} in admission order, set of files left out by the budget)
+    """
+    distances = {start: 0}
+    omitted = set()
+    total = size_of(start) if max_bytes is not None else 0
+    level = [start]
+    depth = 0
+    while level and (max_depth is None or depth < max_depth):
+        depth += 1
+        candidates = set()
+        for file_path in level:
+            for dep_path in direct_dependencies(file_path):
+                if dep_path not in distances and not (is_excluded and is_excluded(dep_path)):
+                    candidates.add(dep_path)
+        if max_bytes is None:
+            level = sorted(candidates)
+        else:
+            sizes = {dep_path: size_of(dep_path) for dep_path in candidates}
+            level = []
+            for dep_path in sorted(candidates, key=lambda path: (sizes[path], path)):
+                if total + sizes[dep_path] > max_bytes:
+                    omitted.add(dep_path)
+                    continue
+                total += sizes[dep_path]
+                level.append(dep_path)
+        for dep_path in level:
+            distances[dep_path] = depth
+    omitted.difference_update(distances)
+    return distances, omitted
+
+
+def file_size(file_path):
+    """Size in bytes, or 0 if the file cannot be stat'ed."""
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return 0
+
 
 class DependencyAnalyzer:
-    def __init__(self, project_root):
+    """
+    Follows the imports of a file to collect its project-local dependencies.
+
+    Import extraction and resolution are delegated to the language analyzer registered for
+    the file's extension (Python, JavaScript/TypeScript, Go, C/C++; see
+    core.language_analyzers), while caching, the graph build and the BFS are shared.
+
+    Files loaded without an import statement (plugin discovery by directory listing and the
+    like) are linked through dynamic import rules, see core.dynamic_import_rules; they are
+    expanded once and reused for every file of the analysis.
+
+    Filesystem lookups are memoized on the instance: every directory is listed once with
+    os.scandir and file checks become set lookups, and each import is resolved once per base
+    directory no matter how many files contain it. The memo reflects the filesystem at
+    the time of the lookup, so an analyzer reused across analyses must be told about changes
+    through invalidate() (or clear_caches()).
+    """
+
+    def __init__(self, project_root, import_cache=None, dynamic_import_rules=None):
         self.project_root = self._normalize_path(project_root)
+        self.import_cache = import_cache  # Optional core.import_cache.ImportCache shared across analyses
+        if dynamic_import_rules is None:
+            dynamic_import_rules = DEFAULT_DYNAMIC_IMPORT_RULES
+        self.dynamic_import_rules = parse_dynamic_import_rules(dynamic_import_rules)
+        self._dir_files = {}  # directory -> {normcased file name: file name} of the files it contains
+        self._resolved = {}  # Resolution memo of the language analyzers, see memoized()
+        self._dynamic_targets = None  # source file -> files loaded dynamically, expanded on first use
+
+    def clear_caches(self):
+        self._dir_files.clear()
+        self._resolved.clear()
+        self._dynamic_targets = None
+
+    def invalidate(self, paths):
+        """Forgets the listings affected by changed paths (files or directories)."""
+        for path in paths:
+            path = self._normalize_path(path)
+            self._dir_files.pop(os.path.dirname(path), None)
+            self._dir_files.pop(path, None)
+        # A new or deleted file can change how any module resolves or which files a rule matches.
+        self._resolved.clear()
+        self._dynamic_targets = None
 
     def _normalize_path(self, path):
         return os.path.normpath(os.path.abspath(path))
 
-    def _is_project_file(self, file_path):
+    def list_files(self, dir_path):
+        files = self._dir_files.get(dir_path)
+        if files is None:
+            try:
+                with os.scandir(dir_path) as entries:
+                    files = {os.path.normcase(entry.name): entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                files = {}
+            self._dir_files[dir_path] = files
+        return files
+
+    def is_project_file(self, file_path):
         if not file_path:
             return False
         abs_file_path = self._normalize_path(file_path)
-        return (
-            abs_file_path.startswith(self.project_root)
-            and os.path.exists(abs_file_path)
-            and os.path.isfile(abs_file_path)
-        )
+        return abs_file_path.startswith(self.project_root) and os.path.normcase(
+            os.path.basename(abs_file_path)
+        ) in self.list_files(os.path.dirname(abs_file_path))
 
-    def _resolve_module_path(self, module_name_parts, base_dir):
-        # Try as a .py file
-        potential_path_py = os.path.join(base_dir, *module_name_parts) + ".py"
-        if self._is_project_file(potential_path_py):
-            return self._normalize_path(potential_path_py)
+    def memoized(self, key, compute):
+        """Returns the memoized result for key, calling compute() once; dropped by invalidate()/clear_caches()."""
+        try:
+            return self._resolved[key]
+        except KeyError:
+            value = self._resolved[key] = compute()
+            return value
 
-        # Try as a package (directory with __init__.py)
-        potential_path_pkg = os.path.join(base_dir, *module_name_parts, "__init__.py")
-        if self._is_project_file(potential_path_pkg):
-            return self._normalize_path(potential_path_pkg)
+    def _extract_imports_from_file(self, file_path):
+        language = language_for(file_path)
+        if language is None:
+            return set()
+        return self.resolve_imports(file_path, self._get_import_specs(file_path, language))
 
-        return None
+    def resolve_imports(self, file_path, specs):
+        """Resolves the import specs of a file (see core.language_analyzers) to the project files they import."""
+        language = language_for(file_path)
+        if language is None:
+            return set()
+        imports = set(language.implicit_dependencies(self, file_path))
+        for spec in specs:
+            imports.update(language.resolve(self, file_path, tuple(spec)))
+        return imports
 
-    def _resolve_import(self, module_str, level, current_file_path):
-        current_file_dir = os.path.dirname(current_file_path)
+    def dynamic_dependencies(self, file_path):
+        """Returns the project files the dynamic import rules say a file loads."""
+        if self._dynamic_targets is None:
+            self._dynamic_targets = expand_dynamic_import_rules(self.project_root, self.dynamic_import_rules)
+        return self._dynamic_targets.get(file_path, [])
 
-        if level > 0:  # Relative import
-            base_relative_dir = current_file_dir
-            for _ in range(level - 1):
-                base_relative_dir = os.path.dirname(base_relative_dir)
+    def _get_import_specs(self, file_path, language):
+        """Returns the import specs of a file, from the import cache when it is unchanged."""
+        try:
+            stat = os.stat(file_path)
+            if self.import_cache is not None:
+                cached = self.import_cache.lookup(file_path, stat.st_mtime_ns, stat.st_size)
+                if cached is not None:
+                    return cached
+            with open(file_path, "rb") as f:
+                content = f.read()
+        except Exception:
+            return []
 
-            if not module_str:
-                return None
+        content_hash = None
+        if self.import_cache is not None:
+            content_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+            cached = self.import_cache.lookup_hash(file_path, content_hash, stat.st_mtime_ns, stat.st_size)
+            if cached is not None:
+                return cached
 
-            module_parts = module_str.split(".")
-            return self._resolve_module_path(module_parts, base_relative_dir)
-        else:  # Absolute import
-            if not module_str:
-                return None
-            module_parts = module_str.split(".")
+        specs = language.parse_specs(content, file_path)
+        if self.import_cache is not None:
+            self.import_cache.store(file_path, stat.st_mtime_ns, stat.st_size, content_hash, specs)
+        return specs
 
-            path_from_proj_root = self._resolve_module_path(module_parts, self.project_root)
-            if path_from_proj_root:
-                return path_from_proj_root
-        return None
+    def _direct_dependencies(self, file_path):
+        dependencies = list(self.dynamic_dependencies(file_path))
+        dependencies.extend(
+            dep_path for dep_path in self._extract_imports_from_file(file_path) if self.is_project_file(dep_path)
+        )
+        return dependencies
 
-    def _extract_imports_from_file(self, file_path):
-        imports = set()
-        if not file_path.endswith(".py"):
-            return imports
+    def exclusion_matcher(self, exclude_patterns):
+        """Returns an is_excluded(path) callable for gitignore-style globs relative to the project root, or None."""
+        if not exclude_patterns:
+            return None
+        return IgnoreMatcher(exclude_patterns, self.project_root).is_excluded
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-        except Exception:
-            return imports
+    def find_dependencies(self, start_file_path, max_depth=None, max_bytes=None, max_tokens=None, exclude=None):
+        """
+        Returns the dependency closure of a file within the given limits, see bounded_closure.
 
-        try:
-            tree = ast.parse(content, filename=file_path)
-        except SyntaxError:
-            return imports
-
-        for node in ast.walk(tree):
-            resolved_path = None
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    resolved_path = self._resolve_import(alias.name, 0, file_path)
-                    if resolved_path:
-                        imports.add(resolved_path)
-            elif isinstance(node, ast.ImportFrom):
-                module_name_from_node = node.module
-
-                if node.level > 0 and not module_name_from_node:  # e.g., `from . import foo`
-                    for alias in node.names:
-                        resolved_path = self._resolve_import(alias.name, node.level, file_path)
-                        if resolved_path:
-                            imports.add(resolved_path)
-                elif module_name_from_node:  # e.g., `from .foo import bar` or `from package import baz`
-                    resolved_path = self._resolve_import(module_name_from_node, node.level, file_path)
-                    if resolved_path:
-                        imports.add(resolved_path)
-        return imports
+        Args:
+            start_file_path (str): File to start from.
+            max_depth (int | None): Maximum import distance; 1 means direct imports only.
+            max_bytes (int | None): Size budget of the whole closure in bytes.
+            max_tokens (int | None): Token budget, estimated from file sizes (BYTES_PER_TOKEN); the
+                tighter of the two budgets applies.
+            exclude (list | None): Gitignore-style globs of files to leave out.
 
-    def find_all_dependencies(self, start_file_path):
+        Returns:
+            tuple: ({file: distance from the start file}, set of files left out by the budget)
+        """
         norm_start_file_path = self._normalize_path(start_file_path)
-        if not self._is_project_file(norm_start_file_path):
-            return set()
+        if not self.is_project_file(norm_start_file_path):
+            return {}, set()
+        if max_tokens is not None:
+            token_bytes = max_tokens * BYTES_PER_TOKEN
+            max_bytes = token_bytes if max_bytes is None else min(max_bytes, token_bytes)
 
-        processing_pipeline = [norm_start_file_path]
-        all_found_deps = set()
-        queued_for_processing = {norm_start_file_path}
-
-        head = 0
-        while head < len(processing_pipeline):
-            current_file = processing_pipeline[head]
-            head += 1
-
-            if current_file in all_found_deps:
-                continue
-
-            all_found_deps.add(current_file)
-
-            # Special handling for your project's api/__init__.py dynamic imports
-            api_init_path_check = self._normalize_path(os.path.join(self.project_root, "api", "__init__.py"))
-            if current_file == api_init_path_check:
-                api_dir = os.path.dirname(current_file)
-                try:
-                    for item_name in os.listdir(api_dir):
-                        # Mimic the logic in your api/__init__.py _discover_apis
-                        if item_name.endswith(".py") and item_name != "__init__.py" and item_name != "api.py":
-                            dynamic_dep_path = self._normalize_path(os.path.join(api_dir, item_name))
-                            if (
-                                self._is_project_file(dynamic_dep_path)
-                                and dynamic_dep_path not in queued_for_processing
-                            ):
-                                processing_pipeline.append(dynamic_dep_path)
-                                queued_for_processing.add(dynamic_dep_path)
-                except FileNotFoundError:
-                    pass
-
-            direct_imports = self._extract_imports_from_file(current_file)
-            for dep_path in direct_imports:
-                if self._is_project_file(dep_path) and dep_path not in queued_for_processing:
-                    processing_pipeline.append(dep_path)
-                    queued_for_processing.add(dep_path)
-
-        return all_found_deps
+        result = bounded_closure(
+            norm_start_file_path,
+            self._direct_dependencies,
+            file_size,
+            max_depth=max_depth,
+            max_bytes=max_bytes,
+            is_excluded=self.exclusion_matcher(exclude),
+        )
+        if self.import_cache is not None:
+            self.import_cache.commit()
+        return result
+
+    def find_all_dependencies(self, start_file_path):
+        return set(self.find_dependencies(start_file_path)[0])
@@ -0,0 +1,65 @@
+# core/dynamic_import_rules.py
+import glob
+import os
+import sys
+
+# Mirrors api/__init__.py, which imports the backend modules of the api package by name (API_MODULES).
+DEFAULT_DYNAMIC_IMPORT_RULES = [
+    {"source": "api/__init__.py", "imports": ["api/*.py"], "exclude": ["api/api.py"]},
+]
+
+
+def _expand(project_root, patterns):
+    paths = set()
+    for pattern in patterns:
+        # Only the rule is a pattern: a root like "proj[old]" must match literally.
+        full_pattern = os.path.join(glob.escape(project_root), *pattern.split("/"))
+        for path in glob.glob(full_pattern, recursive=True):
+            if os.path.isfile(path):
+                paths.add(os.path.normpath(path))
+    return paths
+
+
+def parse_dynamic_import_rules(rules):
+    """
+    Validates dynamic import rules loaded from a project file.
+
+    Each rule is a dict with "source" (a glob of the files doing the dynamic loading),
+    "imports" (globs of the files they load) and an optional "exclude" list of globs; all
+    globs are relative to the project root, use '/' separators and support '**'.
+
+    Returns:
+        list: The valid rules, normalized to lists of patterns; malformed ones are skipped with a warning.
+    """
+    parsed = []
+    for rule in rules or []:
+        if not isinstance(rule, dict) or not isinstance(rule.get("source"), str) or not rule.get("imports"):
+            print(f"Warning: ignoring malformed dynamic import rule: {rule!r}", file=sys.stderr)
+            continue
+        imports = rule["imports"]
+        exclude = rule.get("exclude", [])
+        parsed.append({
+            "source": rule["source"],
+            "imports": [imports] if isinstance(imports, str) else list(imports),
+            "exclude": [exclude] if isinstance(exclude, str) else list(exclude),
+        })
+    return parsed
+
+
+def expand_dynamic_import_rules(project_root, rules):
+    """
+    Evaluates the rules against the filesystem once.
+
+    Returns:
+        dict: {source file: sorted files it loads}, normalized absolute paths. A source never
+            lists itself, so a package rule like "pkg/*.py" can include its own __init__.py.
+    """
+    dependencies = {}
+    for rule in rules:
+        sources = _expand(project_root, [rule["source"]])
+        if not sources:
+            continue
+        targets = _expand(project_root, rule["imports"]) - _expand(project_root, rule["exclude"])
+        for source in sources:
+            dependencies.setdefault(source, set()).update(targets - {source})
+    return {source: sorted(targets) for source, targets in dependencies.items()}
@@ -1,12 +1,54 @@
 # core/file_handler.py
+import codecs
 import os
-from PySide6.QtWidgets import QFileDialog
-from PySide6.QtCore import Qt
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from core.ignore_matcher import read_ignore_file
+
+
+SNIFF_BYTES = 8192
+# Control characters other than tab, newline, form feed and carriage return
+_CONTROL_BYTES = bytes(set(range(32)) - {9, 10, 12, 13})
+
+
+def sniff_file(file_path, max_file_bytes=None):
+    """
+    Checks whether a file can be added to a prompt without reading all of it.
+
+    Only the first SNIFF_BYTES are read: NUL bytes, invalid UTF-8 or a high share of
+    control characters mark the file as binary.
+
+    Returns:
+        tuple: (size, reason) where reason is None for text files under the size limit,
+               or a short explanation of why the file should be skipped.
+    """
+    try:
+        with open(file_path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if max_file_bytes is not None and size > max_file_bytes:
+                return size, f"larger than {max_file_bytes // 1024} KB ({size // 1024} KB)"
+            head = file.read(SNIFF_BYTES)
+    except OSError as e:
+        return 0, f"cannot be opened ({e.strerror or e})"
+    if b"\0" in head:
+        return size, "binary content"
+    try:
+        # The sample may end in the middle of a multi-byte character, hence final=False.
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return size, "not UTF-8 text"
+    if head and len(head.translate(None, _CONTROL_BYTES)) < len(head) * 0.9:
+        return size, "binary content"
+    return size, None
 
 
 class FileHandler:
-    def __init__(self, warning_message):
+    def __init__(self, warning_message, max_read_workers=8, max_file_bytes=2 * 1024 * 1024,
+                 max_total_bytes=50 * 1024 * 1024):
         self.warning_message = warning_message
+        self.max_read_workers = max_read_workers  # Concurrency of read_many
+        self.max_file_bytes = max_file_bytes  # Per-file size cap for files added to prompts
+        self.max_total_bytes = max_total_bytes  # Cap on the combined size of one add operation
 
     def load_from_combobox(self, folder, combobox, text_edit):
         selected_item = combobox.currentText()
@@ -17,6 +59,8 @@ class FileHandler:
             self._load_file_content(file_path, text_edit)
 
     def load_specific_file(self, text_edit):
+        from PySide6.QtWidgets import QFileDialog  # Imported on use: the command line never loads Qt
+
         file_path, _ = QFileDialog.getOpenFileName(
             None, "Load File", "", "All Files (*)"
         )
@@ -37,29 +81,101 @@ class FileHandler:
 
     def read_file_content(self, file_path):
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                return file.read()
-        except FileNotFoundError:
-            self.warning_message.message_box("Error", f"File not found: {file_path}")
-            return None
-        except PermissionError:
-            self.warning_message.message_box("Error", f"Permission denied: {file_path}")
-            return None
+            return self._read_text(file_path)
         except Exception as e:
-            self.warning_message.message_box("Error", f"Error reading file: {e}")
+            self.warning_message.message_box("Error", self._describe_read_error(file_path, e))
             return None
 
+    def read_many(self, file_paths, max_workers=None, silent=False):
+        """
+        Reads several files concurrently with a bounded thread pool.
+
+        Args:
+            file_paths (list): Paths to read.
+            max_workers (int, optional): Thread count; defaults to self.max_read_workers.
+            silent (bool): Skip the error report; failed reads are still returned as None.
+
+        Returns:
+            list: File contents in the same order as file_paths, None for files that could not be read.
+                  All failures are reported together in a single message box.
+        """
+        file_paths = list(file_paths)
+        workers = min(max_workers or self.max_read_workers, len(file_paths))
+        if workers <= 1:
+            results = [self._try_read_text(file_path) for file_path in file_paths]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._try_read_text, file_paths))
+
+        errors = [error for _, error in results if error]
+        if errors and not silent:
+            self.report_errors(f"{len(errors)} file(s) could not be read", errors)
+        return [content for content, _ in results]
+
+    def filter_prompt_files(self, file_paths):
+        """
+        Sniffs file_paths (concurrently) and keeps the text files that fit the size limits.
+
+        Files are accepted in the given order until max_total_bytes is reached.
+
+        Returns:
+            tuple: (accepted paths, list of "path: reason" strings for the skipped files)
+        """
+        file_paths = list(file_paths)
+        workers = min(self.max_read_workers, len(file_paths))
+        sniff = partial(sniff_file, max_file_bytes=self.max_file_bytes)
+        if workers <= 1:
+            results = [sniff(file_path) for file_path in file_paths]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(sniff, file_paths))
+
+        accepted, skipped = [], []
+        total_bytes = 0
+        for file_path, (size, reason) in zip(file_paths, results):
+            if reason is None and self.max_total_bytes is not None and total_bytes + size > self.max_total_bytes:
+                reason = f"total size limit of {self.max_total_bytes // (1024 * 1024)} MB reached"
+            if reason:
+                skipped.append(f"{file_path}: {reason}")
+            else:
+                accepted.append(file_path)
+                total_bytes += size
+        return accepted, skipped
+
+    def report_skipped(self, skipped):
+        if skipped:
+            self.report_errors(f"Skipped {len(skipped)} file(s)", skipped, box_title="Files Skipped")
+
+    def report_errors(self, title, messages, limit=20, box_title="Error"):
+        """Shows a list of error messages in one message box instead of one box per failure."""
+        shown = "\n".join(messages[:limit])
+        if len(messages) > limit:
+            shown += f"\n... and {len(messages) - limit} more"
+        self.warning_message.message_box(box_title, f"{title}:\n{shown}")
+
+    def _try_read_text(self, file_path):
+        try:
+            return self._read_text(file_path), None
+        except Exception as e:
+            return None, self._describe_read_error(file_path, e)
+
+    def _read_text(self, file_path):
+        with open(file_path, "r", encoding="utf-8") as file:
+            return file.read()
+
+    def _describe_read_error(self, file_path, error):
+        if isinstance(error, FileNotFoundError):
+            return f"File not found: {file_path}"
+        if isinstance(error, PermissionError):
+            return f"Permission denied: {file_path}"
+        return f"Error reading file: {error}"
+
     def load_default_ignore(self, project_path, silent=True):
         ignore_patterns = []
         ignore_path = os.path.join(project_path, ".ignore")
         if os.path.exists(ignore_path):
             try:
-                with open(ignore_path, "r") as f:
-                    ignore_patterns = [
-                        line.strip()
-                        for line in f
-                        if line.strip() and not line.startswith("#")
-                    ]
+                ignore_patterns = read_ignore_file(ignore_path)
                 if not silent:
                     self.warning_message.message_box(
                         "ignore file Loaded",
@@ -73,12 +189,7 @@ class FileHandler:
     def load_ignore(self, file_path, silent=True):
         ignore_patterns = []
         try:
-            with open(file_path, "r") as f:
-                ignore_patterns = [
-                    line.strip()
-                    for line in f
-                    if line.strip() and not line.startswith("#")
-                ]
+            ignore_patterns = read_ignore_file(file_path)
             if not silent:
                 self.warning_message.message_box(
                     "ignore Loaded", f".ignore filters added from {file_path}"
@@ -87,22 +198,21 @@ class FileHandler:
             self.warning_message.message_box("Error", f"Error loading .ignore: {e}")
         return ignore_patterns
 
-    def get_file_tree_string(self, parent, indent, is_last_sibling=False):
+    def get_file_tree_string(self, project_index, dir_path=None, indent=0, is_last_sibling=False):
         tree_string = ""
-        if parent is None:
+        if project_index is None or not project_index.root_path:
             return ""
 
-        # Sort children: directories first, then files
-        children = []
-        for i in range(parent.childCount()):
-            child = parent.child(i)
-            file_path = child.data(0, Qt.ItemDataRole.UserRole)
-            children.append((os.path.isdir(file_path), file_path, child))
-        
+        # Start from the project root folder itself, then list scanned directories
+        if dir_path is None:
+            children = [(os.path.basename(project_index.root_path), project_index.root_path, True)]
+        else:
+            children = project_index.list_dir(dir_path) or []
+
         # Sort by: is_directory descending (directories first), then by name
-        children.sort(key=lambda x: (not x[0], os.path.basename(x[1])))
+        children = sorted(children, key=lambda x: (not x[2], x[0]))
 
-        for index, (is_dir, file_path, child) in enumerate(children):
+        for index, (name, file_path, is_dir) in enumerate(children):
             is_last = index == len(children) - 1
 
             # Constructing the prefix string
@@ -113,9 +223,9 @@ class FileHandler:
                 prefix = ""  # No prefix at root level
 
             if is_dir:
-                tree_string += f"{prefix}{os.path.basename(file_path)}/\n"
-                tree_string += self.get_file_tree_string(child, indent + 1, is_last)
+                tree_string += f"{prefix}{name}/\n"
+                tree_string += self.get_file_tree_string(project_index, file_path, indent + 1, is_last)
             else:
-                tree_string += f"{prefix}{os.path.basename(file_path)}\n"
+                tree_string += f"{prefix}{name}\n"
 
         return tree_string
@@ -0,0 +1,198 @@
+# core/ignore_matcher.py
+import os
+import re
+
+
+def parse_ignore_lines(lines):
+    """Returns the pattern lines of an ignore file, skipping blanks and comments."""
+    return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+
+
+def read_ignore_file(file_path):
+    with open(file_path, "r") as f:
+        return parse_ignore_lines(f)
+
+
+def _translate_glob(pattern):
+    """Translates a gitignore glob (without leading '!' or trailing '/') into a regex string."""
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        if pattern.startswith("**/", i) and (i == 0 or pattern[i - 1] == "/"):
+            parts.append("(?:.*/)?")  # zero or more leading directories
+            i += 3
+        elif pattern.startswith("**", i) and i + 2 == n and (i == 0 or pattern[i - 1] == "/"):
+            parts.append(".*")  # everything inside
+            i += 2
+        else:
+            c = pattern[i]
+            i += 1
+            if c == "*":
+                while i < n and pattern[i] == "*":
+                    i += 1
+                parts.append("[^/]*")
+            elif c == "?":
+                parts.append("[^/]")
+            elif c == "\\" and i < n:
+                parts.append(re.escape(pattern[i]))
+                i += 1
+            elif c == "[":
+                j = pattern.find("]", i + 1 if i < n and pattern[i] in "!^" else i)
+                if j == -1 or j == i:
+                    parts.append("\\[")
+                else:
+                    body = pattern[i:j].replace("\\", "\\\\")
+                    if body[0] in "!^":
+                        body = "^" + body[1:]
+                    parts.append(f"[{body}]")
+                    i = j + 1
+            else:
+                parts.append(re.escape(c))
+    return "".join(parts)
+
+
+_GLOB_CHARS = re.compile(r"[*?\[\\]")
+
+
+class _RuleGroup:
+    """
+    A run of consecutive rules sharing the same polarity, compiled into lookup structures.
+
+    Basename rules are split into an exact-name hash set, a literal suffix tuple (for
+    patterns like '*.pyc') and one combined regex; path rules share another combined regex.
+    Directory-only rules (trailing '/') get their own structures, consulted for directories only.
+    """
+
+    __slots__ = ("negated", "names", "suffixes", "name_regex", "path_regex",
+                 "dir_names", "dir_suffixes", "dir_name_regex", "dir_path_regex")
+
+    def __init__(self, negated, rules):
+        self.negated = negated
+        compiled = {}
+        for dir_only in (False, True):
+            names, suffixes, name_globs, path_globs = set(), [], [], []
+            for glob, anchored, rule_dir_only in rules:
+                if rule_dir_only != dir_only:
+                    continue
+                if anchored:
+                    path_globs.append(_translate_glob(glob))
+                elif not _GLOB_CHARS.search(glob):
+                    names.add(glob)
+                elif glob.startswith("*") and not _GLOB_CHARS.search(glob, 1):
+                    suffixes.append(glob[1:])
+                else:
+                    name_globs.append(_translate_glob(glob))
+            compiled[dir_only] = (
+                frozenset(names),
+                tuple(suffixes),
+                re.compile("|".join(f"(?:{g})" for g in name_globs)) if name_globs else None,
+                re.compile("|".join(f"(?:{g})" for g in path_globs)) if path_globs else None,
+            )
+        self.names, self.suffixes, self.name_regex, self.path_regex = compiled[False]
+        self.dir_names, self.dir_suffixes, self.dir_name_regex, self.dir_path_regex = compiled[True]
+
+    def matches(self, rel_path, name, is_dir):
+        if (
+            name in self.names
+            or (self.suffixes and name.endswith(self.suffixes))
+            or (self.name_regex is not None and self.name_regex.fullmatch(name))
+            or (self.path_regex is not None and self.path_regex.fullmatch(rel_path))
+        ):
+            return True
+        if is_dir:
+            return bool(
+                name in self.dir_names
+                or (self.dir_suffixes and name.endswith(self.dir_suffixes))
+                or (self.dir_name_regex is not None and self.dir_name_regex.fullmatch(name))
+                or (self.dir_path_regex is not None and self.dir_path_regex.fullmatch(rel_path))
+            )
+        return False
+
+
+class IgnoreMatcher:
+    """
+    Compiled matcher for a list of gitignore-style patterns, built once per pattern list.
+
+    Supported syntax: '#' comments (dropped by the loaders), '!' negation with last match
+    winning, a leading or middle '/' anchoring the pattern to the project root, '**' for any
+    number of directories, and a trailing '/' restricting the pattern to directories.
+    Patterns without a '/' match the entry name at any depth.
+
+    Matching is done per entry: callers walking a tree are expected to prune ignored
+    directories (see core.project_index.scan_directory), which is how gitignore excludes
+    everything below an ignored directory.
+    """
+
+    def __init__(self, patterns, root_path=""):
+        self.patterns = list(patterns)
+        self.root_path = root_path
+        self._root_prefix = root_path.replace(os.sep, "/").rstrip("/") + "/" if root_path else ""
+        self._groups = []
+        current_rules, current_negated = [], None
+        for pattern in self.patterns:
+            rule = self._parse_pattern(pattern)
+            if rule is None:
+                continue
+            negated, rule = rule
+            if negated != current_negated and current_rules:
+                self._groups.append(_RuleGroup(current_negated, current_rules))
+                current_rules = []
+            current_negated = negated
+            current_rules.append(rule)
+        if current_rules:
+            self._groups.append(_RuleGroup(current_negated, current_rules))
+        # Later rules override earlier ones, so groups are checked from the last one backwards.
+        self._groups.reverse()
+
+    @staticmethod
+    def _parse_pattern(pattern):
+        pattern = pattern.strip()
+        if not pattern or pattern.startswith("#"):
+            return None
+        negated = pattern.startswith("!")
+        if negated:
+            pattern = pattern[1:]
+        elif pattern.startswith("\\!") or pattern.startswith("\\#"):
+            pattern = pattern[1:]
+        dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        if not pattern:
+            return None
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        return negated, (pattern, anchored, dir_only)
+
+    def __bool__(self):
+        return bool(self._groups)
+
+    def relative_path(self, path):
+        """Returns path relative to the matcher root using '/' separators."""
+        if os.sep != "/":
+            path = path.replace(os.sep, "/")
+        if self._root_prefix and path.startswith(self._root_prefix):
+            path = path[len(self._root_prefix):]
+        return path
+
+    def match_relative(self, rel_path, is_dir=False):
+        """Matches a '/' separated path relative to the root. Ancestors are not checked."""
+        name = rel_path.rsplit("/", 1)[-1]
+        for group in self._groups:
+            if group.matches(rel_path, name, is_dir):
+                return not group.negated
+        return False
+
+    def is_ignored(self, path, is_dir=False):
+        """Matches an absolute (or root-relative) path. Ancestors are not checked."""
+        if not self._groups:
+            return False
+        return self.match_relative(self.relative_path(path), is_dir)
+
+    def is_excluded(self, path, is_dir=False):
+        """Like is_ignored, but also excludes paths below an ignored directory (for unpruned event paths)."""
+        if not self._groups:
+            return False
+        parts = self.relative_path(path).split("/")
+        for i in range(1, len(parts)):
+            if self.match_relative("/".join(parts[:i]), True):
+                return True
+        return self.match_relative("/".join(parts), is_dir)
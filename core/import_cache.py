@@ -0,0 +1,121 @@
+# core/import_cache.py
+import json
+import os
+import sqlite3
+import sys
+
+SCHEMA_VERSION = 2  # 2: specs include literal import_module() calls
+
+
+def default_cache_dir():
+    base = (
+        os.environ.get("LOCALAPPDATA")
+        or os.environ.get("XDG_CACHE_HOME")
+        or os.path.join(os.path.expanduser("~"), ".cache")
+    )
+    return os.path.join(base, "IsolatePromptComposer")
+
+
+class ImportCache:
+    """
+    Persistent SQLite cache of the import statements found in each source file.
+
+    Rows are keyed by the normalized file path and validated with mtime_ns and size; when
+    those changed, the content hash decides whether the file really has to be parsed again.
+    Only the parse result is stored (the import specs, e.g. (module, level) pairs for Python),
+    not the resolved target paths: resolution depends on which other files exist and is
+    cheap, so it is redone on every analysis and never goes stale.
+
+    Any SQLite error disables the cache for the rest of the session instead of failing the
+    dependency analysis.
+    """
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            db_path = os.path.join(default_cache_dir(), "import_graph.sqlite")
+        self.db_path = db_path
+        self._pending_writes = 0
+        try:
+            if db_path != ":memory:":
+                os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            self._conn = sqlite3.connect(db_path)
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS imports")
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS imports ("
+                "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, hash TEXT, specs TEXT)"
+            )
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: import cache disabled ({db_path}): {e}", file=sys.stderr)
+            self._conn = None
+
+    def lookup(self, file_path, mtime_ns, size):
+        """Returns the cached specs if the file is unchanged since it was parsed, else None."""
+        row = self._fetch(file_path)
+        if row is None or row[0] != mtime_ns or row[1] != size:
+            return None
+        return self._decode(row[3])
+
+    def lookup_hash(self, file_path, content_hash, mtime_ns, size):
+        """Returns the cached specs if the content is unchanged (e.g. only touched), refreshing its stat."""
+        row = self._fetch(file_path)
+        if row is None or row[2] != content_hash:
+            return None
+        self._execute("UPDATE imports SET mtime_ns = ?, size = ? WHERE path = ?", (mtime_ns, size, file_path))
+        return self._decode(row[3])
+
+    def store(self, file_path, mtime_ns, size, content_hash, specs):
+        self._execute(
+            "INSERT OR REPLACE INTO imports (path, mtime_ns, size, hash, specs) VALUES (?, ?, ?, ?, ?)",
+            (file_path, mtime_ns, size, content_hash, json.dumps(specs)),
+        )
+
+    def commit(self):
+        """Writes are batched; call once per analysis."""
+        if self._conn is not None and self._pending_writes:
+            try:
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._disable(e)
+            self._pending_writes = 0
+
+    def close(self):
+        if self._conn is not None:
+            self.commit()
+            self._conn.close()
+            self._conn = None
+
+    def _fetch(self, file_path):
+        if self._conn is None:
+            return None
+        try:
+            return self._conn.execute(
+                "SELECT mtime_ns, size, hash, specs FROM imports WHERE path = ?", (file_path,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._disable(e)
+            return None
+
+    def _execute(self, sql, params):
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(sql, params)
+            self._pending_writes += 1
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def _decode(self, specs_json):
+        # JSON turns tuples into lists; callers unpack them either way.
+        return [tuple(spec) for spec in json.loads(specs_json)]
+
+    def _disable(self, error):
+        print(f"Warning: import cache disabled ({self.db_path}): {error}", file=sys.stderr)
+        try:
+            self._conn.close()
+        except sqlite3.Error:
+            pass
+        self._conn = None
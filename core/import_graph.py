@@ -0,0 +1,201 @@
+# core/import_graph.py
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from core.dependency_analyzer import bounded_closure, file_size, read_import_specs
+from core.language_analyzers import language_for
+
+# Below this many files to parse, starting worker processes costs more than it saves.
+MIN_PARALLEL_FILES = 64
+
+
+class ImportGraph:
+    """
+    In-memory import graph of a whole project.
+
+    Built once from every supported source file, after which dependency ("what does this need?"),
+    reverse-dependency ("who imports this?") and import-cycle queries are plain graph walks
+    without touching the filesystem. Nodes are normalized absolute paths.
+    """
+
+    def __init__(self, edges):
+        self._edges = edges  # file -> frozenset of the project files it imports
+        self._reverse = {file_path: set() for file_path in edges}
+        for file_path, targets in edges.items():
+            for target in targets:
+                self._reverse[target].add(file_path)
+
+    @classmethod
+    def build(cls, analyzer, file_paths, max_workers=None, is_cancelled=None):
+        """
+        Parses the given files (and any project file they reach) and links their imports.
+
+        Files missing from the analyzer's import cache are parsed across a process pool, since
+        parsing is CPU-bound; resolution stays in this process to share the analyzer's memo.
+
+        Args:
+            analyzer (DependencyAnalyzer): Resolves imports; its import cache is used and updated.
+            file_paths (iterable): Project files to start from; files of unsupported languages are ignored.
+            max_workers (int | None): Worker processes; None uses the CPU count, 1 parses in-process.
+            is_cancelled (callable | None): Checked between parsing rounds; when it returns True, build stops.
+
+        Returns:
+            ImportGraph: The graph over every reached file, or None if cancelled.
+        """
+        pending = {
+            os.path.normpath(os.path.abspath(file_path)) for file_path in file_paths if language_for(file_path)
+        }
+        edges = {}
+        while pending:  # Later rounds pick up imported files that were not in file_paths
+            if is_cancelled is not None and is_cancelled():
+                return None
+            specs_by_file = _load_import_specs(analyzer, sorted(pending), max_workers)
+            for file_path, specs in specs_by_file.items():
+                targets = analyzer.resolve_imports(file_path, specs)
+                targets.update(analyzer.dynamic_dependencies(file_path))
+                edges[file_path] = frozenset(targets)
+            for file_path in pending.difference(specs_by_file):
+                # Gone since it was listed or resolved (stat failed): a node without imports, so the loop ends.
+                edges[file_path] = frozenset()
+            pending = {target for targets in edges.values() for target in targets if target not in edges}
+        if analyzer.import_cache is not None:
+            analyzer.import_cache.commit()
+        return cls(edges)
+
+    def __contains__(self, file_path):
+        return os.path.normpath(os.path.abspath(file_path)) in self._edges
+
+    def __len__(self):
+        return len(self._edges)
+
+    def imports(self, file_path):
+        """Direct project imports of a file."""
+        return set(self._edges.get(os.path.normpath(os.path.abspath(file_path)), ()))
+
+    def find_dependencies(self, file_path, max_depth=None, max_bytes=None, is_excluded=None):
+        """Limited closure with distances, like DependencyAnalyzer.find_dependencies (see bounded_closure)."""
+        file_path = os.path.normpath(os.path.abspath(file_path))
+        if file_path not in self._edges:
+            return {}, set()
+        return bounded_closure(
+            file_path,
+            self._edges.__getitem__,
+            file_size,
+            max_depth=max_depth,
+            max_bytes=max_bytes,
+            is_excluded=is_excluded,
+        )
+
+    def find_dependents(self, file_path, max_depth=None, max_bytes=None, is_excluded=None):
+        """
+        Reverse of find_dependencies: the files that import file_path directly (distance 1) or transitively.
+
+        Returns:
+            tuple: ({file: distance}, including file_path at 0; set of files left out by max_bytes)
+        """
+        file_path = os.path.normpath(os.path.abspath(file_path))
+        if file_path not in self._reverse:
+            return {}, set()
+        return bounded_closure(
+            file_path,
+            self._reverse.__getitem__,
+            file_size,
+            max_depth=max_depth,
+            max_bytes=max_bytes,
+            is_excluded=is_excluded,
+        )
+
+    def strongly_connected_components(self, include_trivial=False):
+        """
+        Returns the strongly connected components of the graph (iterative Tarjan).
+
+        Args:
+            include_trivial (bool): Also return single files that do not import themselves.
+
+        Returns:
+            list: Sets of files; without include_trivial these are exactly the import cycles.
+        """
+        index_of = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+        for root in self._edges:
+            if root in index_of:
+                continue
+            index_of[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self._edges[root]))]
+            while work:
+                node, targets = work[-1]
+                for target in targets:
+                    if target not in index_of:
+                        index_of[target] = lowlink[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(self._edges[target])))
+                        break
+                    if target in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[target])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+                    if lowlink[node] == index_of[node]:
+                        component = set()
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.add(member)
+                            if member == node:
+                                break
+                        if include_trivial or len(component) > 1 or node in self._edges[node]:
+                            components.append(component)
+        return components
+
+
+def _load_import_specs(analyzer, file_paths, max_workers):
+    """Returns {file: specs}, reading unchanged files from the import cache and parsing the rest."""
+    import_cache = analyzer.import_cache
+    specs_by_file = {}
+    to_parse = []
+    for file_path in file_paths:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            continue
+        if import_cache is not None:
+            cached = import_cache.lookup(file_path, stat.st_mtime_ns, stat.st_size)
+            if cached is not None:
+                specs_by_file[file_path] = cached
+                continue
+        to_parse.append(file_path)
+
+    for file_path, result in zip(to_parse, _parse_files(to_parse, max_workers)):
+        if result is None:
+            specs_by_file[file_path] = []
+            continue
+        mtime_ns, size, content_hash, specs = result
+        specs_by_file[file_path] = specs
+        if import_cache is not None:
+            import_cache.store(file_path, mtime_ns, size, content_hash, specs)
+    return specs_by_file
+
+
+def _parse_files(file_paths, max_workers):
+    if max_workers == 1 or len(file_paths) < MIN_PARALLEL_FILES:
+        return [read_import_specs(file_path) for file_path in file_paths]
+    workers = max_workers or os.cpu_count() or 1
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(read_import_specs, file_paths, chunksize=max(1, len(file_paths) // (workers * 4))))
+    except (OSError, BrokenProcessPool) as e:  # e.g. process creation not permitted
+        print(f"Warning: parsing imports in-process, worker processes failed: {e}", file=sys.stderr)
+        return [read_import_specs(file_path) for file_path in file_paths]
@@ -0,0 +1,46 @@
+# core/import_graph_builder.py
+from PySide6.QtCore import QThread, Signal
+from core.dependency_analyzer import DependencyAnalyzer
+from core.import_cache import ImportCache
+from core.import_graph import ImportGraph
+
+
+class ImportGraphBuilder(QThread):
+    """
+    Builds the whole-project ImportGraph in a worker thread, like ProjectScanner does for the listing.
+
+    The build gets its own DependencyAnalyzer and ImportCache connection (SQLite connections
+    belong to the thread that opened them), so the GUI thread keeps using its analyzer
+    meanwhile. graph_ready carries the graph and its import cycles; nothing is emitted
+    when the build is cancelled.
+    """
+
+    graph_ready = Signal(object, list)
+
+    def __init__(self, project_root, file_paths, dynamic_import_rules=None, cache_path=None, parent=None):
+        super().__init__(parent)
+        self.project_root = project_root
+        self.file_paths = list(file_paths)  # Copied here: the project index may change while the build runs
+        self.dynamic_import_rules = dynamic_import_rules
+        self.cache_path = cache_path
+        self._cancelled = False
+
+    def cancel(self):
+        """Requests the build to stop; the parsing round in progress still completes."""
+        self._cancelled = True
+        self.requestInterruption()
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        import_cache = ImportCache(self.cache_path)
+        try:
+            analyzer = DependencyAnalyzer(
+                self.project_root, import_cache=import_cache, dynamic_import_rules=self.dynamic_import_rules
+            )
+            graph = ImportGraph.build(analyzer, self.file_paths, is_cancelled=self.is_cancelled)
+        finally:
+            import_cache.close()
+        if graph is not None and not self._cancelled:
+            self.graph_ready.emit(graph, graph.strongly_connected_components())
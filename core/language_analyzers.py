@@ -0,0 +1,472 @@
+# core/language_analyzers.py
+import ast
+import bisect
+import json
+import os
+import re
+import sys
+
+_language_registry = {}
+
+
+def register_language(cls):
+    """
+    Decorator to register a LanguageAnalyzer for its file extensions.
+    """
+    instance = cls()
+    for extension in cls.extensions:
+        _language_registry[extension] = instance
+    return cls
+
+
+def language_for(file_path):
+    """Returns the registered analyzer for a file's extension, or None if the language is not supported."""
+    return _language_registry.get(os.path.splitext(file_path)[1].lower())
+
+
+class LanguageAnalyzer:
+    """
+    Import extraction and resolution for one language.
+
+    parse_specs turns raw file content into a list of JSON-serializable spec tuples, which
+    the import cache stores per file. resolve maps one spec to project files through the
+    DependencyAnalyzer's memoized helpers (is_project_file, list_files, memoized), so every
+    language shares the same filesystem memo, import cache, graph build and BFS.
+    """
+
+    name = ""
+    extensions = ()
+
+    def parse_specs(self, content, file_path):
+        """Returns the import specs found in content (bytes)."""
+        raise NotImplementedError
+
+    def resolve(self, analyzer, file_path, spec):
+        """Returns the project files one spec of file_path refers to (possibly none)."""
+        raise NotImplementedError
+
+    def implicit_dependencies(self, analyzer, file_path):
+        """Project files a file depends on without importing them (e.g. the rest of its Go package)."""
+        return []
+
+
+def _literal_bounds(pattern, content):
+    """Flattened [start, end, start, end, ...] spans of the literals/comments matched by pattern."""
+    bounds = []
+    for literal in pattern.finditer(content):
+        bounds.extend(literal.span())
+    return bounds
+
+
+def _inside(bounds, position):
+    return bisect.bisect_right(bounds, position) % 2 == 1
+
+
+# --- Python -------------------------------------------------------------------------------
+
+# Comments and string literals (any prefix, single or triple quoted), used to discard
+# import-looking lines inside docstrings. Matched left to right, so a quote inside a
+# comment or a '#' inside a string is consumed by the enclosing token.
+_STRING_OR_COMMENT = re.compile(
+    rb'#[^\r\n]*'
+    rb'|"""(?:[^"\\]|\\.|"(?!""))*"""'
+    rb"|'''(?:[^'\\]|\\.|'(?!''))*'''"
+    rb'|"(?:[^"\\\r\n]|\\.)*"'
+    rb"|'(?:[^'\\\r\n]|\\.)*'",
+    re.S,
+)
+# Start of a statement beginning with import/from: at the start of a line, or after ';' or a
+# one-line block header such as "if TYPE_CHECKING: import x".
+_IMPORT_STATEMENT = re.compile(rb"(?:^[ \t]*|[;:][ \t]*)(import|from)[ \t\\(.]", re.M)
+_MAX_IMPORT_STATEMENT_LINES = 50
+# importlib.import_module("pkg.mod") / __import__("mod") with a string literal; leading dots are a relative import.
+_IMPORT_CALL = re.compile(rb"""\b(?:import_module|__import__)\(\s*(['"])(\.*)([\w.]*)\1\s*[,)]""")
+_IMPORT_CALL_NAMES = ("import_module", "__import__")
+
+
+def _specs_from_nodes(nodes):
+    specs = []
+    for node in nodes:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                specs.append((alias.name, 0))
+        elif isinstance(node, ast.ImportFrom):
+            module_name_from_node = node.module
+
+            if node.level > 0 and not module_name_from_node:  # e.g., `from . import foo`
+                for alias in node.names:
+                    specs.append((alias.name, node.level))
+            elif module_name_from_node:  # e.g., `from .foo import bar` or `from package import baz`
+                specs.append((module_name_from_node, node.level))
+        elif isinstance(node, ast.Call) and node.args:  # e.g., `importlib.import_module("pkg.plugin")`
+            func = node.func
+            name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+            argument = node.args[0]
+            if name in _IMPORT_CALL_NAMES and isinstance(argument, ast.Constant) and isinstance(argument.value, str):
+                module_name = argument.value.lstrip(".")
+                if module_name:
+                    specs.append((module_name, len(argument.value) - len(module_name)))
+    return specs
+
+
+def scan_import_specs(content):
+    """
+    Extracts the (module, level) import specs of Python source without parsing the whole file.
+
+    Import statements are located with a line-anchored regex, candidates inside comments or
+    string literals are dropped, and only each remaining statement (extended over parenthesized
+    or backslash continuation lines until it parses) goes through ast.parse. Imports nested in
+    functions or blocks are found as well, and so are import_module()/__import__() calls
+    with a string literal module name.
+
+    Args:
+        content (bytes): Raw file content.
+
+    Returns:
+        list | None: The specs, or None if a statement could not be isolated and the caller
+            should fall back to parsing the full file.
+    """
+    if b"import" not in content:
+        return []
+    literal_bounds = _literal_bounds(_STRING_OR_COMMENT, content)
+    specs = []
+    for match in _IMPORT_STATEMENT.finditer(content):
+        start = match.start(1)
+        if _inside(literal_bounds, start):
+            continue  # Inside a docstring, string or comment
+
+        end = start
+        for _ in range(_MAX_IMPORT_STATEMENT_LINES):
+            newline = content.find(b"\n", end)
+            end = len(content) if newline == -1 else newline + 1
+            try:
+                statement = ast.parse(content[start:end])
+            except SyntaxError:
+                if newline == -1:
+                    return None
+                continue
+            except ValueError:
+                return None
+            specs.extend(_specs_from_nodes(statement.body[:1]))
+            break
+        else:
+            return None
+    for match in _IMPORT_CALL.finditer(content):
+        if match.group(3) and not _inside(literal_bounds, match.start()):
+            specs.append((match.group(3).decode("ascii"), len(match.group(2))))
+    return specs
+
+
+def parse_import_specs(content, file_path="<unknown>"):
+    """Returns the (module, level) import specs of Python source, or [] if it cannot be parsed."""
+    specs = scan_import_specs(content)
+    if specs is not None:
+        return specs
+    # Statement could not be isolated (unusual formatting or a syntax error): parse it all.
+    try:
+        tree = ast.parse(content, filename=file_path)
+    except (SyntaxError, ValueError):
+        return []
+    return _specs_from_nodes(ast.walk(tree))
+
+
+@register_language
+class PythonAnalyzer(LanguageAnalyzer):
+    """Specs are (module, level) pairs; level > 0 is a relative import."""
+
+    name = "python"
+    extensions = (".py",)
+
+    def parse_specs(self, content, file_path):
+        return parse_import_specs(content, file_path)
+
+    def resolve(self, analyzer, file_path, spec):
+        module_str, level = spec
+        if not module_str:
+            return []
+        if level > 0:  # Relative import
+            base_dir = os.path.dirname(file_path)
+            for _ in range(level - 1):
+                base_dir = os.path.dirname(base_dir)
+        else:  # Absolute import
+            base_dir = analyzer.project_root
+        return analyzer.memoized(
+            (self.name, base_dir, module_str),
+            lambda: self._resolve_module_path(analyzer, module_str.split("."), base_dir),
+        )
+
+    @staticmethod
+    def _resolve_module_path(analyzer, module_name_parts, base_dir):
+        # Try as a .py file
+        potential_path_py = os.path.join(base_dir, *module_name_parts) + ".py"
+        if analyzer.is_project_file(potential_path_py):
+            return [os.path.normpath(potential_path_py)]
+
+        # Try as a package (directory with __init__.py)
+        potential_path_pkg = os.path.join(base_dir, *module_name_parts, "__init__.py")
+        if analyzer.is_project_file(potential_path_pkg):
+            return [os.path.normpath(potential_path_pkg)]
+        return []
+
+
+# --- JavaScript / TypeScript --------------------------------------------------------------
+
+_JS_STRING_OR_COMMENT = re.compile(
+    rb"//[^\r\n]*|/\*.*?\*/"
+    rb'|"(?:[^"\\\r\n]|\\.)*"'
+    rb"|'(?:[^'\\\r\n]|\\.)*'"
+    rb"|`(?:[^`\\]|\\.)*`",
+    re.S,
+)
+# ES module imports and re-exports, dynamic import() and CommonJS require() with a literal specifier.
+_JS_IMPORT = re.compile(
+    rb"(?:\bimport\s+(?:[\w$*{}\s,]+?\s+from\s+)?"
+    rb"|\bexport\s+(?:type\s+)?(?:\*(?:\s+as\s+[\w$]+)?|\{[^}]*\})\s+from\s+"
+    rb"|\b(?:import|require)\s*\(\s*)"
+    rb"""(['"])([^'"\r\n]+)\1"""
+)
+_JS_EXTENSIONS = (".ts", ".tsx", ".d.ts", ".js", ".jsx", ".mjs", ".cjs", ".mts", ".cts", ".vue", ".svelte", ".json")
+# TypeScript sources imported by the name of their emitted JavaScript file ("./util.js" -> util.ts).
+_JS_EMITTED_EXTENSIONS = {".js": (".ts", ".tsx"), ".jsx": (".tsx",), ".mjs": (".mts",), ".cjs": (".cts",)}
+# Strings are kept, comments dropped and trailing commas removed to read tsconfig.json as JSON.
+_JSONC_NOISE = re.compile(r'("(?:[^"\\]|\\.)*")|//[^\n]*|/\*.*?\*/|,(\s*[}\]])', re.S)
+
+
+def _load_jsonc(file_path):
+    with open(file_path, "r", encoding="utf-8") as f:
+        text = f.read()
+    return json.loads(_JSONC_NOISE.sub(lambda m: m.group(1) or m.group(2) or "", text))
+
+
+def _read_compiler_options(config_path, depth=0):
+    """Returns {"baseUrl": abs dir or None, "paths": {pattern: [abs target patterns]}} following relative "extends"."""
+    try:
+        config = _load_jsonc(config_path)
+    except (OSError, ValueError) as e:
+        print(f"Warning: could not read {config_path}: {e}", file=sys.stderr)
+        return {"baseUrl": None, "paths": {}}
+    options = {"baseUrl": None, "paths": {}}
+    config_dir = os.path.dirname(config_path)
+    parent = config.get("extends")
+    if isinstance(parent, str) and parent.startswith(".") and depth < 5:
+        parent_path = os.path.normpath(os.path.join(config_dir, parent))
+        if not parent_path.endswith(".json"):
+            parent_path += ".json"
+        options = _read_compiler_options(parent_path, depth + 1)
+    compiler_options = config.get("compilerOptions") or {}
+    if "baseUrl" in compiler_options:
+        options["baseUrl"] = os.path.normpath(os.path.join(config_dir, compiler_options["baseUrl"]))
+    if "paths" in compiler_options:
+        paths_base = options["baseUrl"] or config_dir
+        options["paths"] = {
+            pattern: [os.path.normpath(os.path.join(paths_base, target)) for target in targets]
+            for pattern, targets in compiler_options["paths"].items()
+        }
+    return options
+
+
+def load_tsconfig_paths(project_root):
+    """Reads baseUrl and the path aliases from the project's tsconfig.json (or jsconfig.json)."""
+    for config_name in ("tsconfig.json", "jsconfig.json"):
+        config_path = os.path.join(project_root, config_name)
+        if os.path.isfile(config_path):
+            return _read_compiler_options(config_path)
+    return {"baseUrl": None, "paths": {}}
+
+
+@register_language
+class JavaScriptAnalyzer(LanguageAnalyzer):
+    """
+    ES modules, CommonJS and TypeScript; specs are 1-tuples holding the import specifier.
+
+    Relative and root-relative ("/src/x", as served by Vite) specifiers are resolved like a
+    bundler does (extensions, index files, .js -> .ts); bare ones through the root tsconfig
+    baseUrl and path aliases. Package imports (node_modules) resolve to nothing.
+    """
+
+    name = "javascript"
+    extensions = (".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx", ".mts", ".cts", ".vue", ".svelte")
+
+    def parse_specs(self, content, file_path):
+        if b"import" not in content and b"require" not in content:
+            return []
+        literal_bounds = _literal_bounds(_JS_STRING_OR_COMMENT, content)
+        return [
+            (match.group(2).decode("utf-8", "replace"),)
+            for match in _JS_IMPORT.finditer(content)
+            if not _inside(literal_bounds, match.start())
+        ]
+
+    def resolve(self, analyzer, file_path, spec):
+        specifier = spec[0].split("?", 1)[0]  # Drop Vite query suffixes such as ?raw or ?url
+        if specifier.startswith("."):
+            candidates = [os.path.join(os.path.dirname(file_path), specifier)]
+        elif specifier.startswith("/"):
+            candidates = [os.path.join(analyzer.project_root, specifier.lstrip("/"))]
+        else:
+            candidates = self._alias_candidates(analyzer, specifier)
+        for candidate in candidates:
+            candidate = os.path.normpath(candidate)
+            resolved = analyzer.memoized((self.name, candidate), lambda: self._resolve_file(analyzer, candidate))
+            if resolved:
+                return resolved
+        return []
+
+    def _alias_candidates(self, analyzer, specifier):
+        config = analyzer.memoized((self.name, "tsconfig"), lambda: load_tsconfig_paths(analyzer.project_root))
+        best_prefix, targets = -1, []
+        for pattern, pattern_targets in config["paths"].items():
+            if "*" not in pattern:
+                if pattern == specifier:  # Exact aliases win over wildcards
+                    best_prefix, targets = len(pattern) + 1, pattern_targets
+                continue
+            prefix, _, suffix = pattern.partition("*")
+            if (
+                len(prefix) > best_prefix
+                and specifier.startswith(prefix)
+                and specifier.endswith(suffix)
+                and len(specifier) >= len(prefix) + len(suffix)
+            ):
+                wildcard = specifier[len(prefix):len(specifier) - len(suffix)]
+                best_prefix, targets = len(prefix), [target.replace("*", wildcard, 1) for target in pattern_targets]
+        candidates = list(targets)
+        if config["baseUrl"]:
+            candidates.append(os.path.join(config["baseUrl"], specifier))
+        return candidates
+
+    @staticmethod
+    def _resolve_file(analyzer, base_path):
+        if analyzer.is_project_file(base_path):
+            return [base_path]
+        stem, extension = os.path.splitext(base_path)
+        for source_extension in _JS_EMITTED_EXTENSIONS.get(extension, ()):
+            if analyzer.is_project_file(stem + source_extension):
+                return [stem + source_extension]
+        for extension in _JS_EXTENSIONS:
+            if analyzer.is_project_file(base_path + extension):
+                return [base_path + extension]
+        for extension in _JS_EXTENSIONS:
+            index_path = os.path.join(base_path, "index" + extension)
+            if analyzer.is_project_file(index_path):
+                return [index_path]
+        return []
+
+
+# --- Go -----------------------------------------------------------------------------------
+
+_GO_IMPORT_BLOCK = re.compile(rb"^import\s*\((.*?)\)", re.M | re.S)
+_GO_IMPORT_LINE = re.compile(rb'^import\s+(?:[\w.]+\s+)?"([^"\r\n]+)"', re.M)
+_GO_BLOCK_SPEC = re.compile(rb'^\s*(?:[\w.]+\s+)?"([^"\r\n]+)"', re.M)
+_GO_LINE_COMMENT = re.compile(rb"//[^\r\n]*")
+_GO_MODULE = re.compile(r'^module\s+"?([^"\s]+)"?', re.M)
+
+
+def load_go_module_path(project_root):
+    """Returns the module path declared in the project's go.mod, or None."""
+    try:
+        with open(os.path.join(project_root, "go.mod"), "r", encoding="utf-8") as f:
+            match = _GO_MODULE.search(f.read())
+    except OSError:
+        return None
+    return match.group(1) if match else None
+
+
+@register_language
+class GoAnalyzer(LanguageAnalyzer):
+    """
+    Go imports; specs are 1-tuples holding the import path.
+
+    Imports below the module path of the root go.mod resolve to the non-test .go files of
+    the package directory, and a file also depends on the other files of its own package.
+    """
+
+    name = "go"
+    extensions = (".go",)
+
+    def parse_specs(self, content, file_path):
+        specs = [(match.group(1).decode("utf-8", "replace"),) for match in _GO_IMPORT_LINE.finditer(content)]
+        for block in _GO_IMPORT_BLOCK.finditer(content):
+            block_content = _GO_LINE_COMMENT.sub(b"", block.group(1))
+            specs.extend(
+                (match.group(1).decode("utf-8", "replace"),) for match in _GO_BLOCK_SPEC.finditer(block_content)
+            )
+        return specs
+
+    def resolve(self, analyzer, file_path, spec):
+        import_path = spec[0]
+        module_path = analyzer.memoized((self.name, "go.mod"), lambda: load_go_module_path(analyzer.project_root))
+        if not module_path or not (import_path == module_path or import_path.startswith(module_path + "/")):
+            return []  # Standard library or another module
+        package_dir = os.path.join(analyzer.project_root, *import_path[len(module_path):].strip("/").split("/"))
+        return self._package_files(analyzer, os.path.normpath(package_dir))
+
+    def implicit_dependencies(self, analyzer, file_path):
+        return [path for path in self._package_files(analyzer, os.path.dirname(file_path)) if path != file_path]
+
+    def _package_files(self, analyzer, package_dir):
+        return analyzer.memoized(
+            (self.name, package_dir),
+            lambda: [
+                os.path.join(package_dir, name)
+                for name in sorted(analyzer.list_files(package_dir).values())
+                if name.endswith(".go") and not name.endswith("_test.go")
+            ],
+        )
+
+
+# --- C / C++ ------------------------------------------------------------------------------
+
+_C_INCLUDE = re.compile(rb'^[ \t]*#[ \t]*include[ \t]*([<"])([^>"\r\n]+)[>"]', re.M)
+# Conventional header locations searched after the including file's directory.
+_C_INCLUDE_DIRS = ("", "include", "src")
+
+
+def load_include_dirs(project_root):
+    """Returns the include search path: conventional dirs plus -I flags from compile_flags.txt."""
+    include_dirs = [os.path.normpath(os.path.join(project_root, name)) for name in _C_INCLUDE_DIRS]
+    try:
+        with open(os.path.join(project_root, "compile_flags.txt"), "r", encoding="utf-8") as f:
+            flags = f.read().split()
+    except OSError:
+        return include_dirs
+    for i, flag in enumerate(flags):
+        include_dir = flag[2:] if flag.startswith("-I") and len(flag) > 2 else None
+        if flag == "-I" and i + 1 < len(flags):
+            include_dir = flags[i + 1]
+        if include_dir:
+            include_dir = os.path.normpath(os.path.join(project_root, include_dir))
+            if include_dir not in include_dirs:
+                include_dirs.append(include_dir)
+    return include_dirs
+
+
+@register_language
+class CAnalyzer(LanguageAnalyzer):
+    """
+    C/C++ #include directives; specs are (header, angled) with angled 1 for <...> includes.
+
+    Quoted includes are looked up next to the including file first, then (like angled ones)
+    on the project include path; system headers resolve to nothing.
+    """
+
+    name = "c"
+    extensions = (".c", ".h", ".cc", ".cpp", ".cxx", ".hh", ".hpp", ".hxx", ".inl", ".ipp", ".m", ".mm")
+
+    def parse_specs(self, content, file_path):
+        return [
+            (match.group(2).decode("utf-8", "replace"), 1 if match.group(1) == b"<" else 0)
+            for match in _C_INCLUDE.finditer(content)
+        ]
+
+    def resolve(self, analyzer, file_path, spec):
+        header, angled = spec
+        local_dir = None if angled else os.path.dirname(file_path)
+        return analyzer.memoized((self.name, local_dir, header), lambda: self._find_header(analyzer, header, local_dir))
+
+    def _find_header(self, analyzer, header, local_dir):
+        include_dirs = analyzer.memoized((self.name, "include dirs"), lambda: load_include_dirs(analyzer.project_root))
+        for include_dir in ([local_dir] if local_dir else []) + include_dirs:
+            candidate = os.path.normpath(os.path.join(include_dir, header))
+            if analyzer.is_project_file(candidate):
+                return [candidate]
+        return []
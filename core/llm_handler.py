@@ -1,9 +1,9 @@
 # core/llm_handler.py
 import json
 from datetime import datetime
-from api import create_api_instance
+from api import API_MODULES, create_api_instance
+from core.async_loop import AsyncLoopThread
 import re
-import asyncio
 
 class LLMHandler:
     def __init__(self, warning_message):
@@ -13,7 +13,8 @@ class LLMHandler:
         self.enable_logging = True
         self.api = None
         self.current_api = ""
-        self.available_apis = ["deepseek", "openai", "google", "alibaba-qwen", "mock"]
+        self.available_apis = list(API_MODULES)
+        self.loop_thread = AsyncLoopThread("llm-api")  # Started by the first call, see submit_api_call
 
     def load_api_key(self, api:str, key:str):
         # If the requested API is already loaded successfully, simply
@@ -28,6 +29,11 @@ class LLMHandler:
         try:
             self.api = create_api_instance(api, api_key=key)
             self.current_api = api
+        except ImportError as e:
+            self.api = None
+            self.current_api = ""
+            self.warning_message.message_box("Error", f"Could not load the {api} API: {e}")
+            return False
         except FileNotFoundError:
             self.api = None
             self.current_api = ""
@@ -72,9 +78,8 @@ class LLMHandler:
             ).strip()  # Return the XML content, stripped of extra whitespace
         return text
 
-    # Make API call using google.generativeai
-    def call_api(self, user_input, role_data, structure_data):
-        prompt = f"""
+    def build_prompt(self, user_input, role_data, structure_data):
+        return f"""
         You are a prompt enhancement agent. Your role is defined as follows:
         {role_data}
 
@@ -86,15 +91,68 @@ class LLMHandler:
         Please enhance the user input based on your role and provide the structured output in JSON format.
         Do not include any markdown or text formatting in the JSON. 
         """
+
+    def parse_response(self, response):
+        """Returns the JSON object of an LLM response; raises ValueError (with response_text) if it is not JSON."""
+        structured_response_text = self.remove_markdown(response or "")
         try:
-            response = asyncio.run(self.api.generate_text(prompt))
-            structured_response_text = self.remove_markdown(response)
-            try:
-                response_json = json.loads(structured_response_text)
-                return None, response_json
-            except json.JSONDecodeError as e:
-                self.log_output({"error": f"Could not decode json output from LLM: {structured_response_text}, error: {e}"}, self.LOG_FILE)
-                raise ValueError(f"Could not decode JSON: {e}")
+            return json.loads(structured_response_text)
+        except json.JSONDecodeError as e:
+            error = ValueError(f"Could not decode JSON: {e}")
+            error.response_text = structured_response_text
+            raise error from e
+
+    async def enhance_input(self, user_input, role_data, structure_data, on_text=None):
+        """
+        Coroutine of one enhancement call.
+
+        Args:
+            on_text (callable, optional): Streams the response: called on the loop thread with each
+                piece of text as it arrives. Without it the whole response is awaited at once.
+
+        Returns:
+            tuple: (thought process, always None for now; response JSON)
+        """
+        prompt = self.build_prompt(user_input, role_data, structure_data)
+        if on_text is None:
+            return None, self.parse_response(await self.api.generate_text(prompt))
+        pieces = []
+        stream = self.api.stream_text(prompt)
+        try:
+            async for piece in stream:
+                pieces.append(piece)
+                on_text(piece)
+        finally:
+            await stream.aclose()  # Closes the provider's stream right away when the call is cancelled
+        return None, self.parse_response("".join(pieces))
+
+    def submit_api_call(self, user_input, role_data, structure_data, on_text=None):
+        """
+        Starts an enhancement call on the LLM loop thread without waiting for it.
+
+        Returns:
+            concurrent.futures.Future: Resolves to enhance_input's result; cancel() aborts the request.
+        """
+        return self.loop_thread.submit(self.enhance_input(user_input, role_data, structure_data, on_text))
+
+    def log_api_error(self, error):
+        """Logs a failed call; called on the caller's thread since logging failures show a message box."""
+        response_text = getattr(error, "response_text", None)
+        if response_text is not None:
+            self.log_output(
+                {"error": f"Could not decode json output from LLM: {response_text}, error: {error}"}, self.LOG_FILE
+            )
+        else:
+            self.log_output({"error": str(error)}, self.LOG_FILE)
+
+    def call_api(self, user_input, role_data, structure_data):
+        """Blocking enhancement call for scripts; the GUI uses submit_api_call."""
+        try:
+            return self.submit_api_call(user_input, role_data, structure_data).result()
         except Exception as e:
-            self.log_output({"error": str(e)}, self.LOG_FILE)
+            self.log_api_error(e)
             raise
+
+    def shutdown(self):
+        """Cancels running calls and stops the loop thread."""
+        self.loop_thread.stop()
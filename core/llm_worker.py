@@ -0,0 +1,72 @@
+# core/llm_worker.py
+from collections import deque
+from PySide6.QtCore import QObject, QTimer, Signal
+
+TEXT_FLUSH_MS = 50  # Streamed text reaches the GUI at most this often, however fast the tokens come
+
+
+class LLMRequest(QObject):
+    """
+    Delivers the result of an LLM call running on the loop thread (see core.async_loop) to the GUI thread.
+
+    Watches the concurrent.futures.Future returned by LLMHandler.submit_api_call, given to
+    start. Exactly one of finished (the call's result), failed (the exception) or cancelled
+    is emitted, on the thread this object lives in, so receivers can touch widgets. Keep a
+    reference to the request until then: a collected request delivers nothing.
+
+    For a streamed call, pass add_text as the on_text callback. Pieces are buffered and
+    text_received carries what arrived since the last one, every TEXT_FLUSH_MS, so the GUI
+    handles a few updates per second instead of one event per token; the rest of the text
+    is flushed before finished.
+    """
+
+    text_received = Signal(str)
+    finished = Signal(object)
+    failed = Signal(object)
+    cancelled = Signal()
+    _done = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.future = None
+        self._pending_text = deque()  # Appended on the loop thread, drained on this object's thread
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(TEXT_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_text)
+        # Emitted from the loop thread, so the queued connection runs _deliver on this object's thread.
+        self._done.connect(self._deliver)
+
+    def start(self, future):
+        self.future = future
+        self._flush_timer.start()
+        future.add_done_callback(lambda _: self._done.emit())
+
+    def add_text(self, text):
+        """on_text callback of a streamed call; safe to call from any thread."""
+        self._pending_text.append(text)
+
+    def _flush_text(self):
+        pieces = []
+        while self._pending_text:
+            pieces.append(self._pending_text.popleft())
+        if pieces:
+            self.text_received.emit("".join(pieces))
+
+    def cancel(self):
+        """Cancels the call; cancelled is emitted unless the result was already in."""
+        if self.future is not None:
+            self.future.cancel()
+
+    def is_running(self):
+        return self.future is not None and not self.future.done()
+
+    def _deliver(self):
+        self._flush_timer.stop()
+        if self.future.cancelled():
+            self._pending_text.clear()
+            self.cancelled.emit()
+        elif self.future.exception() is not None:
+            self.failed.emit(self.future.exception())
+        else:
+            self._flush_text()
+            self.finished.emit(self.future.result())
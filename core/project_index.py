@@ -0,0 +1,243 @@
+# core/project_index.py
+import os
+import sys
+from array import array
+from collections import deque
+
+_DIR = 1
+_LISTED = 2
+
+
+def scan_directory(root_path, is_ignored=None, is_cancelled=None):
+    """
+    Walks root_path breadth-first with os.scandir, yielding one batch per directory.
+
+    Each batch is a (dir_path, entries) tuple where entries is a list of
+    (name, path, is_dir, size, mtime_ns) tuples. The type information comes from
+    the cached DirEntry data; size and mtime come from DirEntry.stat(), which is
+    cached as well (and free on Windows), and is only requested for entries that
+    passed the ignore check.
+    Directories are always yielded after their parent, which lets a consumer
+    attach children to nodes it has already created.
+
+    Args:
+        root_path (str): Directory to scan.
+        is_ignored (callable, optional): is_ignored(path, is_dir) -> bool. Ignored entries are skipped
+                                         and ignored directories are never descended into.
+        is_cancelled (callable, optional): Polled between directories; stops the walk when it returns True.
+    """
+    pending = deque([root_path])
+    while pending:
+        if is_cancelled and is_cancelled():
+            return
+        dir_path = pending.popleft()
+        entries = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_ignored and is_ignored(entry.path, is_dir):
+                        continue
+                    try:
+                        stat = entry.stat()
+                        size, mtime_ns = stat.st_size, stat.st_mtime_ns
+                    except OSError:
+                        size, mtime_ns = 0, 0
+                    entries.append((entry.name, entry.path, is_dir, size, mtime_ns))
+                    if is_dir:
+                        pending.append(entry.path)
+        except OSError:
+            # Unreadable directory (permissions, removed mid-scan): keep going with the rest.
+            continue
+        yield dir_path, entries
+
+
+class ProjectIndex:
+    """
+    Compact in-memory listing of the scanned project and the single source of truth for file-set queries.
+
+    Nodes are stored column-wise in parallel arrays indexed by node id: interned name,
+    parent id, file/dir flags, and the size and mtime_ns captured by the scanner, so
+    no file-set query needs a stat call. Directories keep a name -> node id map of their
+    children. Node 0 is the project root; removed nodes are unlinked from their
+    parent and left in the arrays. The tree widget is only a view over this index:
+    it may be populated lazily while the index always holds the full (ignore-filtered)
+    project.
+    """
+
+    __slots__ = (
+        "root_path", "complete", "_root_norm",
+        "_names", "_parents", "_flags", "_sizes", "_mtimes", "_children", "_file_count",
+    )
+
+    def __init__(self, root_path=""):
+        self.root_path = root_path
+        self.complete = False
+        self._root_norm = os.path.normpath(root_path) if root_path else ""
+        self._names = []
+        self._parents = array("i")
+        self._flags = bytearray()
+        self._sizes = array("q")
+        self._mtimes = array("q")
+        self._children = {}  # dir node id -> {name: child node id}
+        self._file_count = 0
+        if root_path:
+            self._add_node(-1, root_path, True, 0, 0)
+
+    @classmethod
+    def from_scan(cls, root_path, is_ignored=None):
+        """Scans root_path synchronously (see scan_directory) and returns the complete index."""
+        index = cls(root_path)
+        for dir_path, entries in scan_directory(root_path, is_ignored):
+            index.add_batch(dir_path, entries)
+        index.complete = True
+        return index
+
+    def _add_node(self, parent, name, is_dir, size, mtime_ns):
+        node = len(self._names)
+        self._names.append(sys.intern(name))
+        self._parents.append(parent)
+        self._flags.append(_DIR if is_dir else 0)
+        self._sizes.append(size)
+        self._mtimes.append(mtime_ns)
+        if is_dir:
+            self._children[node] = {}
+        else:
+            self._file_count += 1
+        return node
+
+    def node_id(self, path):
+        """Returns the node id for a path, or None if it is not in the index."""
+        if not self._root_norm or not path:
+            return None
+        path = os.path.normpath(path)
+        if path == self._root_norm:
+            return 0
+        if not path.startswith(self._root_norm):
+            return None
+        rel = path[len(self._root_norm):]
+        if not rel.startswith(os.sep) and not self._root_norm.endswith(os.sep):
+            return None
+        node = 0
+        for name in rel.strip(os.sep).split(os.sep):
+            children = self._children.get(node)
+            node = children.get(name) if children else None
+            if node is None:
+                return None
+        return node
+
+    def path(self, node):
+        names = []
+        while node > 0:
+            names.append(self._names[node])
+            node = self._parents[node]
+        return os.path.join(self.root_path, *reversed(names))
+
+    def add_batch(self, dir_path, entries):
+        """
+        Records the listing of a scanned directory.
+
+        Args:
+            dir_path (str): Directory the entries belong to; must already be in the index.
+            entries (list): (name, path, is_dir, size, mtime_ns) tuples from the scanner.
+
+        Returns:
+            list: Node ids of the added entries.
+        """
+        parent = self.node_id(dir_path)
+        if parent is None or not self._flags[parent] & _DIR:
+            return []
+        self._flags[parent] |= _LISTED
+        children = self._children[parent]
+        added = []
+        for name, _, is_dir, size, mtime_ns in entries:
+            if name in children:
+                continue
+            node = self._add_node(parent, name, is_dir, size, mtime_ns)
+            children[name] = node
+            added.append(node)
+        return added
+
+    def add_entry(self, dir_path, entry):
+        """Adds one (name, path, is_dir, size, mtime_ns) entry to an already listed directory."""
+        parent = self.node_id(dir_path)
+        if parent is None or not self._flags[parent] & _LISTED or entry[0] in self._children[parent]:
+            return None
+        name, _, is_dir, size, mtime_ns = entry
+        node = self._add_node(parent, name, is_dir, size, mtime_ns)
+        self._children[parent][name] = node
+        return node
+
+    def remove(self, path):
+        """Drops a path (and everything below it) from the index. Returns False if it was not indexed."""
+        node = self.node_id(path)
+        if not node:  # Unknown path, or the root itself
+            return False
+        del self._children[self._parents[node]][self._names[node]]
+        pending = [node]
+        while pending:
+            current = pending.pop()
+            if self._flags[current] & _DIR:
+                pending.extend(self._children.pop(current).values())
+            else:
+                self._file_count -= 1
+        return True
+
+    def update_stat(self, path, size, mtime_ns):
+        node = self.node_id(path)
+        if node is not None:
+            self._sizes[node] = size
+            self._mtimes[node] = mtime_ns
+
+    def is_listed(self, dir_path):
+        node = self.node_id(dir_path)
+        return node is not None and bool(self._flags[node] & _LISTED)
+
+    def list_dir(self, dir_path):
+        """Returns the (name, path, is_dir) entries of a scanned directory, or None if not scanned yet."""
+        node = self.node_id(dir_path)
+        if node is None or not self._flags[node] & _LISTED:
+            return None
+        return [
+            (name, os.path.join(dir_path, name), bool(self._flags[child] & _DIR))
+            for name, child in self._children[node].items()
+        ]
+
+    def contains(self, path):
+        return self.node_id(path) is not None
+
+    def is_dir(self, path):
+        node = self.node_id(path)
+        return node is not None and bool(self._flags[node] & _DIR)
+
+    def is_file(self, path):
+        node = self.node_id(path)
+        return node is not None and not self._flags[node] & _DIR
+
+    def stat(self, path):
+        """Returns (size, mtime_ns) as captured at scan time, or None if the path is not indexed."""
+        node = self.node_id(path)
+        if node is None:
+            return None
+        return self._sizes[node], self._mtimes[node]
+
+    def iter_files(self, dir_path=None):
+        """Yields every file path below dir_path (the project root by default)."""
+        start = 0 if dir_path is None else self.node_id(dir_path)
+        if start is None or start not in self._children:
+            return
+        pending = [(start, self.path(start))]
+        while pending:
+            node, node_path = pending.pop()
+            for name, child in self._children[node].items():
+                child_path = os.path.join(node_path, name)
+                if self._flags[child] & _DIR:
+                    pending.append((child, child_path))
+                else:
+                    yield child_path
+
+    def file_count(self):
+        return self._file_count
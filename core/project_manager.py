@@ -2,6 +2,10 @@
 import os
 import json
 from PySide6.QtWidgets import QFileDialog, QPlainTextEdit
+from core.dynamic_import_rules import DEFAULT_DYNAMIC_IMPORT_RULES
+from core.prompt_budget import TRIM_STRATEGIES
+from core.prompt_stream import MAX_CLIPBOARD_CHARS, PREVIEW_MAX_CHARS
+from core.prompt_renderer import LINE_NUMBER_SEPARATOR
 
 
 class ProjectManager:
@@ -21,6 +25,21 @@ class ProjectManager:
                 "files_tab_paths": list(main_window.files_added_to_files_tab),  # Save the master set
                 "output_type": main_window.output_type,  # Save output type
                 "line_enumerator_checked": main_window.actionLine_Enumerator.isChecked(),  # Save line enum state
+                "line_number_width": main_window.line_number_width,
+                "line_number_separator": main_window.line_number_separator,
+                "max_read_workers": main_window.file_handler.max_read_workers,
+                "max_file_bytes": main_window.file_handler.max_file_bytes,
+                "max_total_bytes": main_window.file_handler.max_total_bytes,
+                "dynamic_import_rules": main_window.dynamic_import_rules,
+                "dependency_max_depth": main_window.dependency_max_depth,
+                "dependency_max_tokens": main_window.dependency_max_tokens,
+                "dependency_exclude": main_window.dependency_exclude,
+                "tokenizer_vocab_path": main_window.tokenizer_vocab_path,
+                "context_token_limit": main_window.context_token_limit,
+                "prompt_trim_strategies": main_window.prompt_trim_strategies,
+                "files_tab_distances": main_window.files_tab_distances,
+                "max_clipboard_chars": main_window.max_clipboard_chars,
+                "prompt_preview_max_chars": main_window.prompt_preview_max_chars,
             }
             for i in range(main_window.prompt_tab.count()):
                 tab_name = main_window.prompt_tab.tabText(i)
@@ -87,6 +106,29 @@ class ProjectManager:
                     main_window.output_type = project_data.get("output_type", "xml")
                     main_window.actionXML_JSON_Formatting.setChecked(main_window.output_type == "json")
                     main_window.actionLine_Enumerator.setChecked(project_data.get("line_enumerator_checked", False))
+                    main_window.line_number_width = project_data.get("line_number_width", 0)
+                    main_window.line_number_separator = project_data.get(
+                        "line_number_separator", LINE_NUMBER_SEPARATOR
+                    )
+                    file_handler = main_window.file_handler
+                    file_handler.max_read_workers = project_data.get("max_read_workers", file_handler.max_read_workers)
+                    file_handler.max_file_bytes = project_data.get("max_file_bytes", file_handler.max_file_bytes)
+                    file_handler.max_total_bytes = project_data.get("max_total_bytes", file_handler.max_total_bytes)
+                    main_window.dynamic_import_rules = project_data.get(
+                        "dynamic_import_rules", list(DEFAULT_DYNAMIC_IMPORT_RULES)
+                    )
+                    main_window.dependency_max_depth = project_data.get("dependency_max_depth")
+                    main_window.dependency_max_tokens = project_data.get("dependency_max_tokens")
+                    main_window.dependency_exclude = project_data.get("dependency_exclude", [])
+                    main_window.tokenizer_vocab_path = project_data.get("tokenizer_vocab_path", "")
+                    main_window.context_token_limit = project_data.get("context_token_limit", 0)
+                    main_window.prompt_trim_strategies = project_data.get(
+                        "prompt_trim_strategies", list(TRIM_STRATEGIES)
+                    )
+                    main_window.max_clipboard_chars = project_data.get("max_clipboard_chars", MAX_CLIPBOARD_CHARS)
+                    main_window.prompt_preview_max_chars = project_data.get(
+                        "prompt_preview_max_chars", PREVIEW_MAX_CHARS
+                    )
 
                     # Restore and rebuild "Files" tab
                     if "files_tab_paths" in project_data:
@@ -94,6 +136,10 @@ class ProjectManager:
                             os.path.normpath(os.path.abspath(p)) for p in project_data["files_tab_paths"]
                         )
                         # main_window._rebuild_files_tab_content() # Called by main_window.open_project() wrapper
+                    main_window.files_tab_distances = {
+                        os.path.normpath(os.path.abspath(p)): distance
+                        for p, distance in project_data.get("files_tab_distances", {}).items()
+                    }
 
                     main_window.project_data = project_data
                     self.warning_message.message_box("Project Loaded", f"Project loaded from {file_path}")
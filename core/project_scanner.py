@@ -0,0 +1,50 @@
+# core/project_scanner.py
+from PySide6.QtCore import QThread, Signal
+from core.project_index import scan_directory
+
+
+class ProjectScanner(QThread):
+    """
+    Scans a project folder in a worker thread and streams the results back to the GUI thread.
+
+    batch_ready carries a list of (dir_path, entries) batches as produced by scan_directory,
+    grouped so that at least batch_size entries are delivered per signal.
+    progress carries the number of directories and entries scanned so far.
+    """
+
+    batch_ready = Signal(list)
+    progress = Signal(int, int)
+
+    def __init__(self, root_path, is_ignored=None, batch_size=500, parent=None):
+        super().__init__(parent)
+        self.root_path = root_path
+        self.is_ignored = is_ignored
+        self.batch_size = batch_size
+        self._cancelled = False
+
+    def cancel(self):
+        """Requests the scan to stop. Batches already queued may still be delivered."""
+        self._cancelled = True
+        self.requestInterruption()
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        pending_batches = []
+        pending_entries = 0
+        dir_count = 0
+        entry_count = 0
+        for dir_path, entries in scan_directory(self.root_path, self.is_ignored, self.is_cancelled):
+            pending_batches.append((dir_path, entries))
+            pending_entries += len(entries)
+            dir_count += 1
+            entry_count += len(entries)
+            if pending_entries >= self.batch_size:
+                self.batch_ready.emit(pending_batches)
+                self.progress.emit(dir_count, entry_count)
+                pending_batches = []
+                pending_entries = 0
+        if pending_batches and not self._cancelled:
+            self.batch_ready.emit(pending_batches)
+            self.progress.emit(dir_count, entry_count)
@@ -1,8 +1,12 @@
 # core/project_tree_view.py
 import os
+from stat import S_ISDIR
 from PySide6.QtWidgets import QTreeWidgetItem
 from PySide6.QtCore import Qt
-import fnmatch
+from core.ignore_matcher import IgnoreMatcher
+from core.project_index import ProjectIndex, scan_directory
+from core.project_scanner import ProjectScanner
+from core.project_watcher import ProjectWatcher
 
 
 def populate_comboboxes(main_window, folder_path, combobox):
@@ -19,35 +23,210 @@ def populate_comboboxes(main_window, folder_path, combobox):
 
 
 def update_tree_view(main_window, folder_path: str):
+    cancel_project_scan(main_window)
+    stop_project_watcher(main_window)
     main_window.treeView.clear()
+    main_window.project_index = ProjectIndex(folder_path)
     if not folder_path:
         return
     root_item = QTreeWidgetItem(main_window.treeView, [os.path.basename(folder_path)])
     root_item.setData(0, Qt.ItemDataRole.UserRole, folder_path)
-    _add_tree_items(main_window, root_item, folder_path)
     main_window.treeView.addTopLevelItem(root_item)
+    main_window.tree_items = {folder_path: root_item}  # Every created item by path, for incremental updates
+
+    # Compiled once per scan; the scanner must not touch widgets from its thread.
+    main_window.ignore_matcher = IgnoreMatcher(main_window.ignore_patterns, folder_path)
+    # Folders whose children are created as soon as their batch arrives.
+    # In lazy mode only the root is populated up front, the rest on itemExpanded.
+    lazy = main_window.actionLazy_Tree_Loading.isChecked()
+    tree_items = {folder_path: root_item}
+    if lazy:
+        _add_placeholder(root_item)
+
+    scanner = ProjectScanner(folder_path, main_window.ignore_matcher.is_ignored, parent=main_window)
+    scanner.batch_ready.connect(
+        lambda batches: _add_tree_items(main_window, scanner, tree_items, batches, lazy)
+    )
+    scanner.progress.connect(
+        lambda dirs, entries: main_window.statusbar.showMessage(
+            f"Scanning project: {dirs} folder(s), {entries} item(s)..."
+        )
+    )
+    scanner.finished.connect(lambda: _on_scan_finished(main_window, scanner))
+    main_window.project_scanner = scanner
+    scanner.start()
     root_item.setExpanded(True)
 
 
-def _add_tree_items(main_window, parent_item: QTreeWidgetItem, path: str):
-    for item in os.listdir(path):
-        item_path = os.path.join(path, item)
-        if not _is_ignored(main_window, item_path):
-            tree_item = QTreeWidgetItem(parent_item, [item])
-            tree_item.setData(0, Qt.ItemDataRole.UserRole, item_path)
-            if os.path.isdir(item_path):
-                _add_tree_items(main_window, tree_item, item_path)
+def cancel_project_scan(main_window):
+    scanner = getattr(main_window, "project_scanner", None)
+    if scanner is not None:
+        scanner.cancel()
+        main_window.project_scanner = None
 
 
-def _is_ignored(main_window, path):
-    for pattern in main_window.ignore_patterns:
-        path_from_root = (
-            path.replace(main_window.project_path_lineedit.text(), "")
-            .lstrip(os.sep)
-            .replace(os.sep, "/")
-        )
-        if fnmatch.fnmatch(path_from_root, pattern) or fnmatch.fnmatch(
-            os.path.basename(path), pattern
-        ):
-            return True
-    return False
+def expand_tree_item(main_window, item: QTreeWidgetItem):
+    """Replaces the placeholder child of a lazily loaded folder with its listing."""
+    if not _has_placeholder(item):
+        return
+    dir_path = item.data(0, Qt.ItemDataRole.UserRole)
+    if not main_window.project_index.is_listed(dir_path):
+        # The background scan has not reached this folder yet: list just this level now.
+        _, entries = next(scan_directory(dir_path, main_window.ignore_matcher.is_ignored), (dir_path, []))
+        main_window.project_index.add_batch(dir_path, entries)
+    item.takeChild(0)
+    _create_child_items(main_window, item, dir_path, None, lazy=True)
+
+
+def _add_placeholder(parent_item: QTreeWidgetItem):
+    placeholder = QTreeWidgetItem(parent_item, ["..."])
+    placeholder.setFlags(Qt.ItemFlag.NoItemFlags)
+
+
+def _has_placeholder(item: QTreeWidgetItem):
+    return item.childCount() == 1 and item.child(0).data(0, Qt.ItemDataRole.UserRole) is None
+
+
+def _create_child_items(main_window, parent_item, dir_path, tree_items, lazy):
+    # Tree items are a view over the project index listing.
+    for name, item_path, is_dir in main_window.project_index.list_dir(dir_path) or ():
+        _create_item(main_window, parent_item, name, item_path, is_dir, tree_items, lazy)
+
+
+def _create_item(main_window, parent_item, name, item_path, is_dir, tree_items, lazy):
+    tree_item = QTreeWidgetItem(parent_item, [name])
+    tree_item.setData(0, Qt.ItemDataRole.UserRole, item_path)
+    main_window.tree_items[item_path] = tree_item
+    if is_dir:
+        if lazy:
+            _add_placeholder(tree_item)
+        elif tree_items is not None:
+            tree_items[item_path] = tree_item  # Filled when the scanner delivers its batch
+        else:
+            _create_child_items(main_window, tree_item, item_path, None, lazy)
+    return tree_item
+
+
+def _add_tree_items(main_window, scanner, tree_items, batches, lazy):
+    if scanner is not main_window.project_scanner:
+        return  # Late batch from a cancelled scan
+    for dir_path, entries in batches:
+        if main_window.project_index.is_listed(dir_path):
+            continue  # Already listed on demand by expand_tree_item
+        main_window.project_index.add_batch(dir_path, entries)
+        parent_item = tree_items.pop(dir_path, None)
+        if parent_item is None:
+            continue
+        if lazy:
+            parent_item.takeChild(0)
+        _create_child_items(main_window, parent_item, dir_path, tree_items, lazy)
+
+
+def _on_scan_finished(main_window, scanner):
+    scanner.deleteLater()
+    if scanner is not main_window.project_scanner:
+        return
+    main_window.project_scanner = None
+    main_window.project_index.complete = True
+    message = f"Project scan complete: {main_window.project_index.file_count()} file(s)."
+    if main_window.actionWatch_Project_Files.isChecked():
+        watcher = start_project_watcher(main_window)
+        if watcher is not None:
+            message += f" Watching for changes ({watcher.backend})."
+    main_window.statusbar.showMessage(message, 5000)
+
+
+def start_project_watcher(main_window):
+    """
+    Watches the scanned project and applies changes to the index and tree as they happen.
+
+    Returns:
+        ProjectWatcher: The started watcher, or None while the project scan is still running.
+    """
+    stop_project_watcher(main_window)
+    index = main_window.project_index
+    if not index.root_path or not index.complete:
+        return None  # Started by _on_scan_finished once the index is complete
+    watcher = ProjectWatcher(index.root_path, main_window.ignore_matcher, parent=main_window)
+    watcher.changes_ready.connect(main_window.apply_project_changes)
+    main_window.project_watcher = watcher
+    watcher.start()
+    # Polling misses changes for up to poll_interval and costs a rescan each time, so say which one runs.
+    main_window.statusbar.showMessage(f"Watching project files ({watcher.backend}).", 5000)
+    return watcher
+
+
+def stop_project_watcher(main_window):
+    watcher = getattr(main_window, "project_watcher", None)
+    if watcher is not None:
+        watcher.stop()
+        watcher.deleteLater()
+        main_window.project_watcher = None
+
+
+def apply_project_changes(main_window, paths):
+    """
+    Applies a set of touched paths to the project index and the tree view.
+
+    Each path is classified against the index and the file system, so events can be
+    coalesced or duplicated freely.
+
+    Returns:
+        tuple: (modified, removed) sets of file paths that were in the index.
+    """
+    index = main_window.project_index
+    matcher = main_window.ignore_matcher
+    lazy = main_window.actionLazy_Tree_Loading.isChecked()
+    modified, removed = set(), set()
+    # Parents first, so a new folder is indexed before the events of its content are looked at.
+    for path in sorted(paths, key=len):
+        node_is_file = index.is_file(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+
+        if stat is None:
+            if index.contains(path):
+                if node_is_file:
+                    removed.add(path)
+                else:
+                    removed.update(index.iter_files(path))
+                index.remove(path)
+                _remove_item(main_window, path)
+            continue
+
+        is_dir = S_ISDIR(stat.st_mode)
+        if index.contains(path):
+            if node_is_file and index.stat(path) != (stat.st_size, stat.st_mtime_ns):
+                index.update_stat(path, stat.st_size, stat.st_mtime_ns)
+                modified.add(path)
+            continue
+
+        parent_path = os.path.dirname(path)
+        if not index.is_listed(parent_path) or matcher.is_excluded(path, is_dir):
+            continue
+        entry = (os.path.basename(path), path, is_dir, stat.st_size, stat.st_mtime_ns)
+        if index.add_entry(parent_path, entry) is None:
+            continue
+        if is_dir:
+            for dir_path, entries in scan_directory(path, matcher.is_ignored):
+                index.add_batch(dir_path, entries)
+        parent_item = main_window.tree_items.get(parent_path)
+        if parent_item is not None and not _has_placeholder(parent_item):
+            _create_item(main_window, parent_item, entry[0], path, is_dir, None, lazy)
+    return modified, removed
+
+
+def _remove_item(main_window, path):
+    item = main_window.tree_items.pop(path, None)
+    if item is None:
+        return
+    pending = [item]
+    while pending:
+        current = pending.pop()
+        for i in range(current.childCount()):
+            child = current.child(i)
+            main_window.tree_items.pop(child.data(0, Qt.ItemDataRole.UserRole), None)
+            pending.append(child)
+    item.parent().removeChild(item)
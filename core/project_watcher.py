@@ -0,0 +1,132 @@
+# core/project_watcher.py
+import threading
+from PySide6.QtCore import QObject, QThread, QTimer, Signal
+from core.project_index import scan_directory
+
+try:  # Optional: native change notifications (inotify, FSEvents, ReadDirectoryChangesW)
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+
+def snapshot_directory(root_path, is_ignored=None, is_cancelled=None):
+    """Returns {path: (is_dir, size, mtime_ns)} for everything scan_directory finds below root_path."""
+    snapshot = {}
+    for _, entries in scan_directory(root_path, is_ignored, is_cancelled):
+        for _, path, is_dir, size, mtime_ns in entries:
+            snapshot[path] = (is_dir, size, mtime_ns)
+    return snapshot
+
+
+class _PollingThread(QThread):
+    """Fallback backend: rescans the project periodically and diffs mtime/size snapshots."""
+
+    paths_changed = Signal(object)
+
+    def __init__(self, root_path, is_ignored, interval, parent=None):
+        super().__init__(parent)
+        self.root_path = root_path
+        self.is_ignored = is_ignored
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        self._stop_event.set()
+
+    def run(self):
+        previous = snapshot_directory(self.root_path, self.is_ignored, self._stop_event.is_set)
+        while not self._stop_event.wait(self.interval):
+            current = snapshot_directory(self.root_path, self.is_ignored, self._stop_event.is_set)
+            if self._stop_event.is_set():
+                return
+            changed = {path for path, state in current.items() if previous.get(path) != state}
+            changed.update(path for path in previous if path not in current)
+            if changed:
+                self.paths_changed.emit(changed)
+            previous = current
+
+
+class _WatchdogHandler(FileSystemEventHandler):
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+
+    def on_any_event(self, event):
+        paths = {event.src_path}
+        dest_path = getattr(event, "dest_path", "")
+        if dest_path:  # Renames are reported as removal of the source and creation of the destination
+            paths.add(dest_path)
+        self.callback(paths)
+
+
+class ProjectWatcher(QObject):
+    """
+    Watches a project folder and reports changed paths in debounced batches.
+
+    Uses watchdog when it is installed and falls back to polling otherwise. Backend
+    notifications are collected on the GUI thread and changes_ready is emitted once no
+    new change arrived for debounce_ms, so bursts (e.g. a git checkout touching thousands
+    of files) coalesce into a single update. The reported set only says which paths were
+    touched; the receiver compares them against the project index to classify them.
+    """
+
+    changes_ready = Signal(object)
+    _paths_received = Signal(object)
+
+    def __init__(self, root_path, ignore_matcher, debounce_ms=500, poll_interval=2.0, parent=None):
+        super().__init__(parent)
+        self.root_path = root_path
+        self.ignore_matcher = ignore_matcher
+        self.poll_interval = poll_interval
+        self._pending = set()
+        self._observer = None
+        self._poller = None
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(debounce_ms)
+        self._debounce_timer.timeout.connect(self._flush)
+        self._paths_received.connect(self._queue_paths)
+
+    @property
+    def backend(self):
+        return "watchdog" if Observer is not None else "polling"
+
+    def start(self):
+        if Observer is not None:
+            self._observer = Observer()
+            self._observer.schedule(_WatchdogHandler(self._on_native_event), self.root_path, recursive=True)
+            self._observer.daemon = True
+            self._observer.start()
+        else:
+            self._poller = _PollingThread(self.root_path, self.ignore_matcher.is_ignored, self.poll_interval, self)
+            self._poller.paths_changed.connect(self._queue_paths)
+            self._poller.start()
+
+    def stop(self):
+        self._debounce_timer.stop()
+        self._pending.clear()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._poller is not None:
+            self._poller.stop()
+            self._poller.wait()
+            self._poller = None
+
+    def _on_native_event(self, paths):
+        # Called from the watchdog thread: drop ignored paths there, then hop to the GUI thread.
+        paths = {path for path in paths if not self.ignore_matcher.is_excluded(path)}
+        if paths:
+            self._paths_received.emit(paths)
+
+    def _queue_paths(self, paths):
+        self._pending.update(paths)
+        self._debounce_timer.start()
+
+    def _flush(self):
+        paths, self._pending = self._pending, set()
+        if paths:
+            self.changes_ready.emit(paths)
@@ -0,0 +1,211 @@
+# core/prompt_budget.py
+# Qt-free token budgeting for the compiled prompt: per-section breakdown and Files tab trimming.
+import os
+import sys
+from core.prompt_renderer import render_file_block
+from core.prompt_stream import PROMPTS_CLOSING, PROMPTS_OPENING, joined_block_chunks, prompt_section_tags
+
+# Applied in this order until the prompt fits; see plan_files_trim.
+TRIM_STRATEGIES = ("distance", "elide", "largest")
+# Elision never shrinks a file below this many tokens; smaller files are left whole.
+ELIDE_MIN_TOKENS = 400
+# Renders per elided file at most: the first line count is an estimate, later ones correct it.
+ELIDE_ATTEMPTS = 3
+
+
+class FileBudgetEntry:
+    __slots__ = ("path", "tokens", "distance", "action", "target_tokens")
+
+    def __init__(self, path, tokens, distance=0):
+        self.path = path
+        self.tokens = tokens
+        self.distance = distance  # Import distance from the selected file; 0 for files added directly
+        self.action = "kept"  # kept, dropped (distance), dropped (largest) or elided
+        self.target_tokens = tokens
+
+
+def plan_files_trim(entries, available_tokens, strategies=TRIM_STRATEGIES):
+    """
+    Decides which Files tab entries to drop or elide so they fit in available_tokens.
+
+    Strategies run in the given order, each only as far as needed:
+        "distance": drop the files furthest from the selected file first (never distance 0).
+        "elide": shorten the largest files by eliding their middle, down to ELIDE_MIN_TOKENS.
+        "largest": drop the largest remaining files.
+
+    Entries are updated in place (action, target_tokens).
+
+    Returns:
+        int: Token total of the Files tab after the planned trimming (elided sizes are targets).
+    """
+    total = sum(entry.tokens for entry in entries)
+    for strategy in strategies:
+        if total <= available_tokens:
+            break
+        kept = [entry for entry in entries if entry.action == "kept"]
+        if strategy == "distance":
+            for entry in sorted(kept, key=lambda e: (-e.distance, -e.tokens)):
+                if total <= available_tokens or entry.distance == 0:
+                    break
+                entry.action = "dropped (distance)"
+                total -= entry.tokens
+        elif strategy == "elide":
+            for entry in sorted(kept, key=lambda e: -e.tokens):
+                if total <= available_tokens or entry.tokens <= ELIDE_MIN_TOKENS:
+                    break
+                entry.target_tokens = max(ELIDE_MIN_TOKENS, entry.tokens - (total - available_tokens))
+                entry.action = "elided"
+                total -= entry.tokens - entry.target_tokens
+        elif strategy == "largest":
+            for entry in sorted(entries, key=lambda e: -e.target_tokens):
+                if total <= available_tokens:
+                    break
+                if entry.action.startswith("dropped"):
+                    continue
+                entry.action = "dropped (largest)"
+                total -= entry.target_tokens
+        else:
+            print(f"Warning: unknown prompt trim strategy {strategy!r}", file=sys.stderr)
+    return total
+
+
+def render_trimmed_blocks(entries, blocks, read_many, render_options, count_tokens):
+    """
+    Returns the blocks left by plan_files_trim, re-rendering elided files with their middle elided.
+
+    Args:
+        entries (list): FileBudgetEntry list planned by plan_files_trim; elided entries get their actual counts.
+        blocks (dict): path -> rendered block of every entry.
+        read_many (callable): Reads a list of paths, returning contents (None if unreadable) in order.
+        render_options (dict): render_file_block keyword arguments.
+        count_tokens (callable): Token count of a rendered block.
+
+    Returns:
+        tuple: (kept and elided blocks in entry order, their token total)
+    """
+    elided = [entry for entry in entries if entry.action == "elided"]
+    elided_blocks = {}
+    for entry, file_content in zip(elided, read_many([entry.path for entry in elided])):
+        if not file_content:  # Unreadable now: keep the block as shown
+            entry.action, entry.target_tokens = "kept", entry.tokens
+            continue
+        # Lines are kept in proportion to the token target, then reduced while the exact count is over it.
+        line_count = file_content.count("\n") + 1
+        max_lines = max(1, line_count * entry.target_tokens // max(1, entry.tokens))
+        for _ in range(ELIDE_ATTEMPTS):
+            block = render_file_block(entry.path, file_content, max_lines=max_lines, **render_options)
+            tokens = count_tokens(block)
+            if tokens <= entry.target_tokens or max_lines == 1:
+                break
+            max_lines = max(1, min(max_lines - 1, max_lines * entry.target_tokens // tokens))
+        elided_blocks[entry.path] = block
+        entry.target_tokens = tokens
+
+    kept_blocks = []
+    total = 0
+    for entry in entries:
+        if entry.action == "kept":
+            kept_blocks.append(blocks[entry.path])
+            total += entry.tokens
+        elif entry.action == "elided":
+            kept_blocks.append(elided_blocks[entry.path])
+            total += entry.target_tokens
+    return kept_blocks, total
+
+
+class PromptBudgetReport:
+    """Token breakdown of a compiled prompt: per tab, per Files tab file and per patch."""
+
+    def __init__(self, limit=0):
+        self.limit = limit  # Model context limit in tokens; 0 disables the budget
+        self.sections = []  # (tab name, tokens)
+        self.files = []  # FileBudgetEntry, in Files tab order
+        self.patches = []  # (patch number, tokens)
+        self.total = 0
+
+    @property
+    def over_budget(self):
+        return bool(self.limit) and self.total > self.limit
+
+    def trimmed_files(self):
+        return [entry for entry in self.files if entry.action != "kept"]
+
+    def format_summary(self, max_files=10):
+        """Short multi-line text for the compile message box."""
+        header = f"Total: {self.total} tokens"
+        if self.limit:
+            header += f" of {self.limit} ({self.total * 100 // self.limit}%)"
+        lines = [header]
+        lines.extend(f"  {name}: {tokens}" for name, tokens in self.sections)
+        if self.patches:
+            lines.append("Patches: " + ", ".join(f"#{number} {tokens}" for number, tokens in self.patches))
+        if self.files:
+            largest = sorted(self.files, key=lambda entry: -entry.tokens)[:max_files]
+            lines.append(f"Largest files ({len(self.files)} in the Files tab):")
+            lines.extend(f"  {os.path.basename(entry.path)}: {entry.tokens}" for entry in largest)
+        trimmed = self.trimmed_files()
+        if trimmed:
+            lines.append(f"Trimmed to fit ({len(trimmed)} file(s)):")
+            lines.extend(
+                f"  {os.path.basename(entry.path)}: {entry.action}, {entry.tokens} -> "
+                f"{entry.target_tokens if entry.action == 'elided' else 0}"
+                for entry in trimmed[:max_files]
+            )
+            if len(trimmed) > max_files:
+                lines.append(f"  ... and {len(trimmed) - max_files} more")
+        if self.over_budget:
+            lines.append(f"Warning: the prompt is still {self.total - self.limit} tokens over the limit.")
+        return "\n".join(lines)
+
+
+def budget_prompt_sections(sections, files_index, files, count_tokens, read_many, render_options,
+                           limit=0, strategies=TRIM_STRATEGIES, patches=()):
+    """
+    Counts a prompt per tab, per file and per patch, trimming its Files section to fit limit.
+
+    Args:
+        sections (list): (tab name, content) pairs in prompt order, see core.prompt_stream.iter_prompt_chunks.
+        files_index (int | None): Index of the section rendered from files; None if there is none.
+        files (list): (path, block, tokens, distance) of that section's files, in order.
+        count_tokens (callable): Token count of a text: other sections, tags, patches and elided blocks.
+        read_many (callable): Reads elided files, see render_trimmed_blocks.
+        render_options (dict): render_file_block keyword arguments of the blocks.
+        limit (int): Model context size in tokens; 0 only reports.
+        strategies (sequence): Trim strategies, see plan_files_trim.
+        patches (sequence): Patches of a "Patch Comparison" section, reported one by one.
+
+    Returns:
+        tuple: (sections, trimmed copy if needed, PromptBudgetReport)
+    """
+    report = PromptBudgetReport(limit)
+    overhead = count_tokens(PROMPTS_OPENING) + count_tokens(PROMPTS_CLOSING)
+    section_tokens = []
+    for index, (tab_text, content) in enumerate(sections):
+        overhead += sum(count_tokens(tag) for tag in prompt_section_tags(tab_text))
+        section_tokens.append(0 if index == files_index else count_tokens(content))
+        if tab_text == "Patch Comparison":
+            report.patches = [(number, count_tokens(patch)) for number, patch in enumerate(patches, 1)]
+
+    if files_index is not None:
+        report.files = [FileBudgetEntry(path, tokens, distance) for path, _, tokens, distance in files]
+        files_tokens = sum(entry.tokens for entry in report.files)
+        other_tokens = overhead + sum(section_tokens)
+        if limit and other_tokens + files_tokens > limit:
+            plan_files_trim(report.files, max(0, limit - other_tokens), strategies)
+            kept_blocks, files_tokens = render_trimmed_blocks(
+                report.files, {path: block for path, block, _, _ in files}, read_many, render_options, count_tokens
+            )
+            sections = list(sections)
+            if kept_blocks:
+                sections[files_index] = (sections[files_index][0], joined_block_chunks(kept_blocks))
+            else:
+                files_tab_text, _ = sections.pop(files_index)
+                del section_tokens[files_index]
+                overhead -= sum(count_tokens(tag) for tag in prompt_section_tags(files_tab_text))
+                files_index = None
+        if files_index is not None:
+            section_tokens[files_index] = files_tokens
+
+    report.sections = [(tab_text, tokens) for (tab_text, _), tokens in zip(sections, section_tokens)]
+    report.total = overhead + sum(section_tokens)
+    return sections, report
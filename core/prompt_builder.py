@@ -1,24 +1,21 @@
 # core/prompt_builder.py
 import os
-import json
 from PySide6.QtWidgets import QApplication, QPlainTextEdit
-from PySide6.QtCore import Qt
+from core.prompt_renderer import join_blocks, render_file_block
+from core.prompt_stream import iter_prompt_chunks, prompt_length
 
 
-def format_file_text(file_path, content, output_type="xml"):
-    # Assuming numbered_prompt is your processed text with line numbers
-    if output_type == "json":
-        content = json.dumps(
-            {"file_name": os.path.basename(file_path), "content": content},
-            ensure_ascii=False,
-            indent=2,
-        )
-    elif output_type == "markdown":
-        content = f"File: {os.path.basename(file_path)}\n```\n{content}\n```\n"
-    else:
-        # Use XML as default.
-        content = f'<file name="{os.path.basename(file_path)}">{content}</file>'
-    return content
+def set_plain_text_bulk(text_edit: QPlainTextEdit, text):
+    """Replaces the widget content in one update, without recording an undo step for the bulk load."""
+    text_edit.setUndoRedoEnabled(False)
+    text_edit.setPlainText(text)
+    text_edit.setUndoRedoEnabled(True)
+
+
+def append_plain_text_bulk(text_edit: QPlainTextEdit, blocks):
+    """Appends rendered blocks with a single appendPlainText call."""
+    if blocks:
+        text_edit.appendPlainText(join_blocks(blocks))
 
 
 class PromptBuilder:
@@ -46,99 +43,57 @@ class PromptBuilder:
         self.warning_message.message_box("Info", "This specific action might be deprecated or handled by 'Add Selected (+Deps)'.")
 
 
-    def _add_file_content_with_line_numbers(
-        self,
-        text_edit: QPlainTextEdit,
-        file_path,
-        file_content,
-        output_type="xml",
-        silent=True, # silent is now always true as MainWindow manages messages
-    ):
-        numbered_prompt = ""
-        for i, line in enumerate(file_content.splitlines()):
-            numbered_prompt += f"{i+1}→{line}\n"
-        text_edit.appendPlainText(format_file_text(os.path.basename(file_path), numbered_prompt, output_type))
-        # MainWindow handles success messages now.
-
-    def _add_file_content_without_line_numbers(
-        self,
-        text_edit: QPlainTextEdit,
-        file_path,
-        file_content,
-        output_type="xml",
-        silent=True, # silent is now always true
-    ):
-        text_edit.appendPlainText(format_file_text(os.path.basename(file_path), file_content, output_type))
-        # MainWindow handles success messages now.
-
-
     def add_folder_files_content_to_prompt(self, folder_path):
         # This method populates the "Context" tab (self.main_window.tab_context)
         # It is distinct from the "Files" tab (tedit_tab5) logic.
+        file_paths = []
         for root, _, files in os.walk(folder_path):
             for file_name in files:
-                full_file_path = os.path.join(root, file_name)
-                # Consider ignoring binary files here too if not desired in context
-                file_content = self.main_window.file_handler.read_file_content(full_file_path)
-                if file_content:
-                    # For context, line numbers might not be desired, or could be an option
-                    # For now, adding without line numbers to context tab.
-                    self._add_file_content_without_line_numbers(
-                        self.main_window.tab_context, # Target "Context" tab
-                        full_file_path,
-                        file_content,
-                        output_type=self.main_window.output_type,
-                        silent=True, 
-                    )
+                file_paths.append(os.path.join(root, file_name))
+        # Binary and oversized files are skipped before anything is read in full
+        file_paths, skipped = self.main_window.file_handler.filter_prompt_files(file_paths)
+        self.main_window.file_handler.report_skipped(skipped)
+        # Same rendering as the Files tab, line numbers follow the Line Enumerator setting
+        blocks = self._render_files(file_paths)
+        append_plain_text_bulk(self.main_window.tab_context, blocks)  # Target "Context" tab
 
     def get_all_project_files_for_prompt(self):
+        # Reads the project index rather than the tree widget, which may be lazily populated.
+        # The index only holds entries that passed the ignore patterns.
+        excluded_extensions = (
+            ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp", ".svg", ".ico",
+            ".mp4", ".mov", ".avi", ".mkv", ".mp3", ".wav", ".ogg",
+        )
         collected_files = set()
-        root = self.main_window.treeView.invisibleRootItem()
-        self._collect_all_files_recursive_for_paths(root, collected_files)
+        for file_path in self.main_window.project_index.iter_files():
+            if not file_path.lower().endswith(excluded_extensions):
+                collected_files.add(os.path.normpath(file_path))  # Ensure normalized
         return collected_files
 
-    def _collect_all_files_recursive_for_paths(self, parent_item, collected_files_set):
-        if parent_item is None:
-            return
-
-        for i in range(parent_item.childCount()):
-            child = parent_item.child(i)
-            # UserRole data should be absolute path from tree population
-            file_path = child.data(0, Qt.ItemDataRole.UserRole) 
-
-            if os.path.isfile(file_path):
-                excluded_extensions = (
-                    ".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".webp", ".svg", ".ico",
-                    ".mp4", ".mov", ".avi", ".mkv", ".mp3", ".wav", ".ogg",
-                )
-                if not file_path.lower().endswith(excluded_extensions):
-                    collected_files_set.add(os.path.normpath(file_path)) # Ensure normalized
-            elif os.path.isdir(file_path):
-                # Respect ignore patterns if necessary (current tree view build already does)
-                # Or specific folder names like "media"
-                # Current tree view already filters by .ignore, so items in tree are "valid"
-                # We might want to add an additional explicit check here if needed
-                # e.g. if os.path.basename(file_path).lower() not in self.main_window.ignore_patterns_for_folders_like_media:
-                self._collect_all_files_recursive_for_paths(child, collected_files_set)
-
-
     def add_files_to_context(self, file_paths):
         # This method populates the "Context" tab (self.main_window.tab_context)
         if file_paths:
-            for file_path in file_paths:
-                file_content = self.main_window.file_handler.read_file_content(file_path)
-                if file_content:
-                    # Adding to context tab, usually without line numbers
-                    self.main_window.tab_context.appendPlainText(
-                        format_file_text(
-                            os.path.basename(file_path),
-                            file_content,
-                            output_type=self.main_window.output_type,
-                        )
-                    )
-
-    def compile_prompt(self):
-        prompt_parts = []
+            file_paths, skipped = self.main_window.file_handler.filter_prompt_files(file_paths)
+            self.main_window.file_handler.report_skipped(skipped)
+            append_plain_text_bulk(self.main_window.tab_context, self._render_files(file_paths))
+
+    def _render_files(self, file_paths):
+        """Reads file_paths concurrently and returns their rendered blocks in the same order."""
+        render_options = self.main_window.file_render_options()
+        contents = self.main_window.file_handler.read_many(file_paths)
+        return [
+            render_file_block(file_path, file_content, **render_options)
+            for file_path, file_content in zip(file_paths, contents)
+            if file_content
+        ]
+
+    def collect_prompt_sections(self):
+        """
+        Returns the (tab name, stripped content) pairs of the non-empty prompt tabs, in tab order.
+
+        An unedited Files tab is returned as its block chunks (see core.prompt_stream), without copying the text.
+        """
+        sections = []
         for i in range(self.main_window.prompt_tab.count()):
             tab_text = self.main_window.prompt_tab.tabText(i)
             tab_widget = self.main_window.prompt_tab.widget(i)
@@ -153,19 +108,42 @@ class PromptBuilder:
                         "If there is a mix of ideas between patches, suggest tasks to further refine the best patch\n"
                         f"{patches_xml}"
                     )
-                    prompt_parts.append(f'<prompt type="{tab_text}">\n{patch_prompt}\n</prompt>')
+                    sections.append((tab_text, patch_prompt))
                 continue
 
             text_edits = tab_widget.findChildren(QPlainTextEdit)
             if text_edits:
                 text_edit = text_edits[0]
+                if text_edit is self.main_window.tedit_tab5 and not text_edit.document().isModified():
+                    if self.main_window.files_tab_chunks:
+                        sections.append((tab_text, self.main_window.files_tab_chunks))
+                    continue
                 text_content = text_edit.toPlainText().strip()
                 if text_content:
-                    prompt_parts.append(f'<prompt type="{tab_text}">\n{text_content}\n</prompt>')
-        
-        final_prompt = "\n".join(prompt_parts)
-        final_prompt = f"<prompts>\n{final_prompt}\n</prompts>"
-        
-        QApplication.clipboard().setText(final_prompt)
-        self.warning_message.message_box("Prompt Copied", "The compiled prompt has been copied to your clipboard.")
-        return final_prompt
\ No newline at end of file
+                    sections.append((tab_text, text_content))
+        return sections
+
+    def compile_prompt(self, sections=None, report_text="", max_clipboard_chars=None):
+        """
+        Copies the compiled prompt to the clipboard; report_text is appended to the message.
+
+        Returns:
+            str | None: The compiled prompt, or None when it exceeds max_clipboard_chars and was not built.
+        """
+        if sections is None:
+            sections = self.collect_prompt_sections()
+        total_chars = prompt_length(sections)
+        if max_clipboard_chars is not None and total_chars > max_clipboard_chars:
+            final_prompt = None
+            message = (
+                f"The compiled prompt has {total_chars} characters, more than the clipboard limit of "
+                f"{max_clipboard_chars}. Use File > Compile Prompt to File to save it."
+            )
+        else:
+            final_prompt = "".join(iter_prompt_chunks(sections))
+            QApplication.clipboard().setText(final_prompt)
+            message = "The compiled prompt has been copied to your clipboard."
+        if report_text:
+            message = f"{message}\n\n{report_text}"
+        self.warning_message.message_box("Prompt Copied" if final_prompt is not None else "Prompt Too Large", message)
+        return final_prompt
@@ -0,0 +1,119 @@
+# core/prompt_renderer.py
+# Qt-free rendering of file blocks and tab text. Widgets only receive the final string.
+import os
+import json
+from itertools import repeat
+
+
+def format_file_text(file_path, content, output_type="xml"):
+    # Assuming numbered_prompt is your processed text with line numbers
+    if output_type == "json":
+        content = json.dumps(
+            {"file_name": os.path.basename(file_path), "content": content},
+            ensure_ascii=False,
+            indent=2,
+        )
+    elif output_type == "markdown":
+        content = f"File: {os.path.basename(file_path)}\n```\n{content}\n```\n"
+    else:
+        # Use XML as default.
+        content = f'<file name="{os.path.basename(file_path)}">{content}</file>'
+    return content
+
+
+LINE_NUMBER_SEPARATOR = "→"
+# Formatted numbers are kept between calls, per width, for files up to this many lines.
+_NUMBER_CACHE_MAX_LINES = 1_000_000
+_number_columns = {}  # width -> ["0", "1", ...] right-aligned to width
+
+
+def _number_column(start, count, width):
+    """Returns the formatted numbers start .. start + count - 1, reusing earlier calls' strings."""
+    end = start + count
+    column = _number_columns.get(width)
+    if column is None or len(column) < end:
+        first = start if end > _NUMBER_CACHE_MAX_LINES else 0
+        numbers = map(str, range(first, max(end, 1024)))
+        column = list(map(str.rjust, numbers, repeat(width)) if width else numbers)
+        if first:
+            return column[:count]
+        _number_columns[width] = column  # Replaced whole, so concurrent readers see a complete list
+    return column[start:end]
+
+
+def number_lines(content, start=1, width=0, separator=LINE_NUMBER_SEPARATOR):
+    """
+    Prefixes every line of content with its number, in linear time.
+
+    The number, separator, line and newline columns are interleaved in one list and joined once;
+    numbers come formatted from a cache, so only splitting and joining depend on the content.
+
+    Args:
+        content (str): Text to number; lines are split with str.splitlines.
+        start (int): Number of the first line.
+        width (int): Right-align numbers to this width (0 disables padding).
+        separator (str): Text between the number and the line.
+
+    Returns:
+        str: The numbered text, every line terminated by a newline.
+    """
+    lines = content.splitlines()
+    line_count = len(lines)
+    parts = [separator] * (4 * line_count)
+    parts[0::4] = _number_column(start, line_count, width)
+    parts[2::4] = lines
+    parts[3::4] = ["\n"] * line_count
+    return "".join(parts)
+
+
+def elide_middle(file_content, max_lines, line_numbers=False, line_number_width=0,
+                 line_number_separator=LINE_NUMBER_SEPARATOR):
+    """
+    Keeps the first and last lines of file_content, replacing the middle with a one-line marker.
+
+    Args:
+        file_content (str): Text to shorten.
+        max_lines (int): Lines to keep, split between head and tail.
+        line_numbers (bool): Number the kept lines with their original line numbers.
+
+    Returns:
+        str: The shortened (and optionally numbered) text; unchanged if it has at most max_lines lines.
+    """
+    lines = file_content.splitlines()
+    if len(lines) <= max_lines:
+        if line_numbers:
+            return number_lines(file_content, width=line_number_width, separator=line_number_separator)
+        return file_content
+    head_count = (max_lines + 1) // 2
+    tail_start = len(lines) - max_lines // 2
+    marker = f"... {tail_start - head_count} line(s) elided ..."
+    if not line_numbers:
+        return "\n".join(lines[:head_count] + [marker] + lines[tail_start:])
+    head = number_lines("\n".join(lines[:head_count]), width=line_number_width, separator=line_number_separator)
+    tail = number_lines(
+        "\n".join(lines[tail_start:]), start=tail_start + 1, width=line_number_width, separator=line_number_separator
+    )
+    return f"{head}{marker}\n{tail}"
+
+
+def render_file_block(file_path, file_content, output_type="xml", line_numbers=False,
+                      line_number_width=0, line_number_separator=LINE_NUMBER_SEPARATOR, max_lines=None):
+    """
+    Returns the formatted text block of one file, as shown in the Files and Context tabs.
+
+    With max_lines, longer files have their middle elided (see elide_middle) to fit a token budget.
+    """
+    if max_lines is not None:
+        file_content = elide_middle(file_content, max_lines, line_numbers, line_number_width, line_number_separator)
+        return format_file_text(os.path.basename(file_path), file_content, output_type)
+    if line_numbers:
+        file_content = number_lines(file_content, width=line_number_width, separator=line_number_separator)
+    return format_file_text(os.path.basename(file_path), file_content, output_type)
+
+
+def join_blocks(blocks):
+    """
+    Joins rendered blocks into the text a QPlainTextEdit would hold after one
+    appendPlainText call per block (each append starts a new paragraph).
+    """
+    return "\n".join(blocks)
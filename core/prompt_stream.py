@@ -0,0 +1,105 @@
+# core/prompt_stream.py
+# Qt-free streaming compilation: the prompt is produced as chunks and written to a sink, never joined whole.
+
+PROMPTS_OPENING = "<prompts>\n"
+PROMPTS_CLOSING = "\n</prompts>"
+# Larger prompts are written to a file instead of being built in memory for the clipboard.
+MAX_CLIPBOARD_CHARS = 8_000_000
+# The compiled prompt editor shows at most this many characters of a larger prompt.
+PREVIEW_MAX_CHARS = 1_000_000
+
+
+def prompt_section_tags(tab_text):
+    """Returns the text wrapped around a tab's content in the compiled prompt."""
+    return f'<prompt type="{tab_text}">\n', "\n</prompt>"
+
+
+def iter_joined_blocks(blocks):
+    """
+    Yields chunks whose concatenation is join_blocks(blocks).strip(), without building the joined string.
+
+    blocks may be a lazy iterator, e.g. files rendered as they are read, so only one block is held at a time.
+    """
+    previous = None
+    for block in blocks:
+        if previous is None:
+            previous = block.lstrip()
+            continue
+        yield previous
+        yield "\n"
+        previous = block
+    if previous is not None:
+        yield previous.rstrip()
+
+
+def joined_block_chunks(blocks):
+    """iter_joined_blocks as a list, for a section that is compiled more than once."""
+    return list(iter_joined_blocks(blocks))
+
+
+def iter_prompt_chunks(sections):
+    """
+    Yields the compiled prompt piece by piece.
+
+    Args:
+        sections (list): (tab name, content) pairs; content is a string or a sequence of chunks
+            (e.g. joined_block_chunks of the Files tab), so one file at a time is handled.
+
+    Yields:
+        str: Chunks whose concatenation is the compiled prompt.
+    """
+    yield PROMPTS_OPENING
+    for index, (tab_text, content) in enumerate(sections):
+        opening, closing = prompt_section_tags(tab_text)
+        yield f"\n{opening}" if index else opening
+        if isinstance(content, str):
+            yield content
+        else:
+            yield from content
+        yield closing
+    yield PROMPTS_CLOSING
+
+
+def prompt_length(sections):
+    """Length in characters of the compiled prompt, without building it."""
+    return sum(len(chunk) for chunk in iter_prompt_chunks(sections))
+
+
+def write_prompt(chunks, sink):
+    """
+    Writes chunks to a text sink such as an open file or sys.stdout.
+
+    Returns:
+        int: Number of characters written.
+    """
+    written = 0
+    for chunk in chunks:
+        sink.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def prompt_preview(chunks, max_chars):
+    """
+    Keeps the first max_chars characters of the chunks while counting all of them.
+
+    Returns:
+        tuple: (preview text, total characters, total lines, whether the preview is truncated)
+    """
+    preview = []
+    kept = 0
+    total_chars = 0
+    newlines = 0
+    last_chunk = ""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if kept < max_chars:
+            piece = chunk[:max_chars - kept]
+            preview.append(piece)
+            kept += len(piece)
+        total_chars += len(chunk)
+        newlines += chunk.count("\n")
+        last_chunk = chunk
+    total_lines = newlines + (not last_chunk.endswith("\n")) if total_chars else 0
+    return "".join(preview), total_chars, total_lines, total_chars > kept
@@ -1,4 +1,5 @@
 # main.py
+import multiprocessing
 import sys
 from PySide6.QtWidgets import QApplication
 from ui.main_window import MainWindow  # Import UI
@@ -6,6 +7,7 @@ from ui.main_window import MainWindow  # Import UI
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Import graph workers in frozen Windows builds
     app = QApplication(sys.argv)
     main_window = MainWindow() # Instantiate the UI class
     # project_manager = ProjectManager() # Instantiate the core project manager class
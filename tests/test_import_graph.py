@@ -0,0 +1,50 @@
+# tests/test_import_graph.py
+import os
+import tempfile
+import threading
+import unittest
+
+from core.dependency_analyzer import DependencyAnalyzer
+from core.import_graph import ImportGraph
+
+
+class ImportGraphBuildTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        self.paths = {}
+        for name, content in (("a.py", "import b\n"), ("b.py", "x = 1\n")):
+            self.paths[name] = os.path.join(self.root, name)
+            with open(self.paths[name], "w") as f:
+                f.write(content)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _build_with_timeout(self, analyzer, file_paths, timeout=10):
+        result = {}
+        thread = threading.Thread(
+            target=lambda: result.setdefault("graph", ImportGraph.build(analyzer, file_paths, max_workers=1)),
+            daemon=True,
+        )
+        thread.start()
+        thread.join(timeout)
+        self.assertFalse(thread.is_alive(), "ImportGraph.build did not finish")
+        return result["graph"]
+
+    def test_file_deleted_after_listing(self):
+        analyzer = DependencyAnalyzer(self.root)
+        file_paths = sorted(self.paths.values())
+        analyzer.list_files(self.root)  # b.py is listed, so a.py's import still resolves to it
+        os.remove(self.paths["b.py"])
+
+        graph = self._build_with_timeout(analyzer, file_paths)
+
+        self.assertEqual(graph.imports(self.paths["a.py"]), {self.paths["b.py"]})
+        self.assertEqual(graph.imports(self.paths["b.py"]), set())
+        distances, _ = graph.find_dependents(self.paths["b.py"])
+        self.assertEqual(distances, {self.paths["b.py"]: 0, self.paths["a.py"]: 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
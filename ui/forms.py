@@ -0,0 +1,97 @@
+# ui/forms.py
+"""
+Precompiled Qt Designer forms.
+
+Parsing a .ui file and running uic on every launch is a large part of startup, so
+forms are compiled to Python modules ahead of time:
+    python -m ui.forms
+Each generated module records the hash of the .ui file it was built from. When the
+module is missing or the .ui file has changed since, load_form falls back to compiling
+the form at runtime with loadUiType, so an edited form is never silently ignored.
+"""
+import importlib
+import os
+import sys
+import zlib
+
+# (.ui file, generated module) pairs, relative to the application folder.
+FORMS = [
+    ("ui/ui_main_window.ui", "ui.ui_main_window"),
+]
+_HASH_TEMPLATE = '\n\n# CRC-32 of the .ui file this module was generated from, see ui/forms.py\nUI_SOURCE_HASH = "{}"\n'
+
+
+def ui_source_hash(ui_path):
+    """
+    Checksum of a .ui file, independent of its line endings (git may convert them on checkout).
+
+    Only detects edits, so a CRC is enough and keeps hashlib out of startup.
+    """
+    with open(ui_path, "rb") as f:
+        content = f.read().replace(b"\r\n", b"\n")
+    return f"{zlib.crc32(content):08x}"
+
+
+def load_form(ui_path, module_name, form_class_name, base_class):
+    """
+    Returns (form class, base class) like PySide6.QtUiTools.loadUiType, preferring the generated module.
+
+    Args:
+        ui_path (str): The Qt Designer file.
+        module_name (str): Module generated from it by compile_form.
+        form_class_name (str): Ui_<object name> class in that module.
+        base_class (type): Widget class of the form's top-level object.
+    """
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        reason = "missing"
+    else:
+        try:
+            if getattr(module, "UI_SOURCE_HASH", None) == ui_source_hash(ui_path):
+                return getattr(module, form_class_name), base_class
+            reason = "out of date"
+        except OSError:  # No .ui file shipped: the generated module is all there is
+            return getattr(module, form_class_name), base_class
+    print(
+        f"Warning: {module_name} is {reason}, compiling {ui_path} at startup. Run 'python -m ui.forms' to fix.",
+        file=sys.stderr,
+    )
+    from PySide6.QtUiTools import loadUiType
+
+    return loadUiType(ui_path)
+
+
+def _find_uic():
+    import shutil
+
+    uic = shutil.which("pyside6-uic")
+    if uic:
+        return uic
+    # Virtual environments that are not activated: the tool sits next to the interpreter.
+    scripts_dir = os.path.dirname(sys.executable)
+    for name in ("pyside6-uic", "pyside6-uic.exe"):
+        candidate = os.path.join(scripts_dir, name)
+        if os.path.exists(candidate):
+            return candidate
+    raise FileNotFoundError("pyside6-uic not found; install PySide6 or add its scripts folder to PATH")
+
+
+def compile_form(ui_path, module_name):
+    """Runs pyside6-uic on ui_path and writes the module with the .ui hash appended."""
+    import subprocess
+
+    module_path = os.path.join(*module_name.split(".")) + ".py"
+    result = subprocess.run([_find_uic(), ui_path], capture_output=True, text=True, check=True)
+    with open(module_path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(result.stdout.rstrip("\n") + _HASH_TEMPLATE.format(ui_source_hash(ui_path)))
+    return module_path
+
+
+def main():
+    for ui_path, module_name in FORMS:
+        print(f"{ui_path} -> {compile_form(ui_path, module_name)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,54 @@
 # ui/main_window.py
 import os
-from PySide6.QtUiTools import loadUiType
-from PySide6.QtWidgets import QFileDialog, QMessageBox, QPlainTextEdit, QLabel, QDialog, QVBoxLayout
+from PySide6.QtWidgets import (
+    QFileDialog, QMainWindow, QMessageBox, QPlainTextEdit, QLabel, QDialog, QVBoxLayout
+)
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon
+from ui.forms import load_form
 from ui.utils.dialogs import WarningBox
-from core.project_tree_view import update_tree_view, populate_comboboxes
+from core.project_tree_view import (
+    update_tree_view,
+    cancel_project_scan,
+    expand_tree_item,
+    populate_comboboxes,
+    apply_project_changes,
+    start_project_watcher,
+    stop_project_watcher,
+)
+from core.project_index import ProjectIndex
 from ui.utils.text_processor import TextProcessor
-from core.dependency_analyzer import DependencyAnalyzer
+from core.dependency_analyzer import BYTES_PER_TOKEN, DependencyAnalyzer
+from core.language_analyzers import language_for
+from core.dynamic_import_rules import DEFAULT_DYNAMIC_IMPORT_RULES, parse_dynamic_import_rules
+from core.import_cache import ImportCache
+from core.import_graph_builder import ImportGraphBuilder
+from core.block_cache import RenderedBlockCache
 from core.file_handler import FileHandler
-from core.prompt_builder import PromptBuilder
+from core.ignore_matcher import IgnoreMatcher
+from core.prompt_builder import PromptBuilder, set_plain_text_bulk
+from core.prompt_stream import (
+    MAX_CLIPBOARD_CHARS,
+    PREVIEW_MAX_CHARS,
+    iter_prompt_chunks,
+    joined_block_chunks,
+    prompt_preview,
+    write_prompt,
+)
+from core.prompt_budget import TRIM_STRATEGIES, budget_prompt_sections
+from core.tokenizer import load_tokenizer
+from core.prompt_renderer import LINE_NUMBER_SEPARATOR, join_blocks, render_file_block
 from core.project_manager import ProjectManager
 from core.llm_handler import LLMHandler
+from core.llm_worker import LLMRequest
 from ui.utils.review_dialog import ReviewDialog
 from ui.utils.about import show_about_info, show_about_pyside, show_about_googleaistudio
 
 
-Ui_MainWindow, QMainWindow = loadUiType("ui/ui_main_window.ui")
+# Precompiled by "python -m ui.forms"; compiled at startup only if that module is missing or stale.
+Ui_MainWindow, QMainWindow = load_form("ui/ui_main_window.ui", "ui.ui_main_window", "Ui_MainWindow", QMainWindow)
+
+COMPILED_PROMPT_KEY = "<compiled prompt>"  # TextProcessor section key of the compiled prompt; tabs use their names
 
 
 class MainWindow(Ui_MainWindow, QMainWindow):
@@ -31,14 +63,46 @@ class MainWindow(Ui_MainWindow, QMainWindow):
         self.project_manager = ProjectManager(self.warning_message)
         self.text_processor = TextProcessor()
         self.llm_handler = LLMHandler(self.warning_message)
+        self.llm_request = None  # LLMRequest while an enhancement call runs; pb_enhance cancels it
+        self.review_dialog = None  # ReviewDialog of the current call until it is closed
         self.api_key_path = ""
         self.output_type = "xml"
+        self.line_number_width = 0  # Pad line numbers to this width when the Line Enumerator is on (0: no padding)
+        self.line_number_separator = LINE_NUMBER_SEPARATOR
         self.files_added_to_files_tab = set()  # Master set of normalized absolute paths for tedit_tab5
+        self.files_tab_cache = RenderedBlockCache()  # Formatted tedit_tab5 blocks, keyed by path/stat/format
+        self.files_tab_blocks = []  # (path, cache key, block) as last shown in tedit_tab5, for the token budget
+        self.files_tab_chunks = []  # files_tab_blocks as compile chunks, used while tedit_tab5 is unedited
+        self.files_tab_distances = {}  # path -> import distance from the file it was added with (0 if added directly)
         self.patches = []
 
         self.project_data = {}
         self.ignore_patterns = []
+        self.ignore_matcher = IgnoreMatcher(self.ignore_patterns)  # Rebuilt from ignore_patterns on each scan
         self.loaded_ignore = ""
+        self.project_scanner = None  # Background scan feeding treeView, see core.project_tree_view
+        self.project_index = ProjectIndex()  # Full file listing of the project, independent of treeView
+        self.tree_items = {}  # path -> QTreeWidgetItem for the items created so far
+        self.project_watcher = None  # Set while "Watch Project Files" is enabled
+        self.import_cache = None  # Persistent import cache, opened on the first dependency analysis
+        self.dynamic_import_rules = list(DEFAULT_DYNAMIC_IMPORT_RULES)  # Saved with the project
+        # Limits of "Add with dependencies" (None = unlimited); exclusions are gitignore-style globs.
+        self.dependency_max_depth = None
+        self.dependency_max_tokens = None
+        self.dependency_exclude = []
+        self.tokenizer_vocab_path = ""  # tiktoken-format vocab; empty uses the default file or the estimate
+        self._loaded_tokenizer_vocab_path = ""
+        self.context_token_limit = 0  # Model context size for compile_prompt (0: report only, never trim)
+        self.prompt_trim_strategies = list(TRIM_STRATEGIES)
+        self.max_clipboard_chars = MAX_CLIPBOARD_CHARS
+        self.prompt_preview_max_chars = PREVIEW_MAX_CHARS
+        self.compiled_prompt_counts = None  # (preview, tokens, characters, lines) while plainTextEdit_12 is truncated
+        self.dependency_analyzer = None  # Reused while the watcher keeps its filesystem memo current
+        self._dependency_analyzer_watcher = None
+        self.import_graph = None  # Whole-project graph, built on demand in "Full Import Graph" mode
+        self.import_graph_builder = None  # ImportGraphBuilder while the graph is built in the background
+        self._import_graph_watcher = None  # Watcher that has kept import_graph current since its build
+        self._import_graph_settings = None  # (project root, parsed dynamic import rules) import_graph was built with
         # self.output_type = "xml" # Already defined above
 
         self.button_actions()
@@ -53,6 +117,7 @@ class MainWindow(Ui_MainWindow, QMainWindow):
         self.actionNew_Project.triggered.connect(self.new_project)
         self.actionOpen_Project.triggered.connect(self.open_project)
         self.actionSave_Project.triggered.connect(self.save_project)
+        self.actionCompile_to_File.triggered.connect(self.compile_prompt_to_file)
         self.actionExport_Project.triggered.connect(self.save_project)
         self.actionAbout.triggered.connect(show_about_info)
         self.actionAbout_PySide.triggered.connect(show_about_pyside)
@@ -61,6 +126,11 @@ class MainWindow(Ui_MainWindow, QMainWindow):
             lambda: self.warning_message.mute(self.actionMute_Warnings.isChecked())
         )
         self.actionXML_JSON_Formatting.triggered.connect(self.toggle_output_format)
+        self.actionLazy_Tree_Loading.triggered.connect(
+            lambda: self.list_project_content(self.project_path_lineedit.text().strip())
+        )
+        self.actionWatch_Project_Files.triggered.connect(self.toggle_project_watcher)
+        self.actionFull_Import_Graph.triggered.connect(self.toggle_full_import_graph)
 
     def button_actions(self):
         self.compile_button.clicked.connect(self.compile_prompt)
@@ -99,6 +169,7 @@ class MainWindow(Ui_MainWindow, QMainWindow):
         )
         if confirmation:
             self.files_added_to_files_tab.clear()
+            self.files_tab_distances.clear()
             self._rebuild_files_tab_content() # This will clear tedit_tab5
             
     def populate_comboboxes(self):
@@ -128,15 +199,28 @@ class MainWindow(Ui_MainWindow, QMainWindow):
 
         if confirmation:
             self.prompt_builder.clear_all_text_fields()  # This clears tedit_tab5 as well
+            cancel_project_scan(self)
+            stop_project_watcher(self)
             self.treeView.clear()
+            self.project_index = ProjectIndex()
+            self.tree_items = {}
             self.project_path_lineedit.clear()
             self.ignore_patterns = []
+            self.dynamic_import_rules = list(DEFAULT_DYNAMIC_IMPORT_RULES)
+            self.dependency_max_depth = None
+            self.dependency_max_tokens = None
+            self.dependency_exclude = []
+            self.context_token_limit = 0
+            self.prompt_trim_strategies = list(TRIM_STRATEGIES)
             self.label_char_count.setText("Characters: 0")
             self.label_token_count.setText("Tokens: 0")
             self.label_line_count.setText("Lines: 0")
             self.api_key_path = ""
             self.project_data = {}
             self.files_added_to_files_tab.clear()
+            self.files_tab_distances.clear()
+            self.files_tab_blocks = []
+            self.files_tab_chunks = []
             self.patches.clear()
             self.patch_list.clear()
             # tedit_tab5 is already cleared by prompt_builder.clear_all_text_fields()
@@ -164,14 +248,31 @@ class MainWindow(Ui_MainWindow, QMainWindow):
     def choose_directory(self, line_edit):
         selected_folder = QFileDialog.getExistingDirectory(self, "Select Folder")
         if selected_folder:
+            cancel_project_scan(self)  # Stop scanning the previous folder right away
             line_edit.setText(selected_folder)
             self.project_data["project_path"] = selected_folder
-            self.load_default_ignore(silent=False)
-            self.list_project_content(selected_folder)
+            self.load_default_ignore(silent=False)  # Also lists the new folder content
+
+    def closeEvent(self, event):
+        scanner = self.project_scanner
+        cancel_project_scan(self)
+        stop_project_watcher(self)
+        if scanner is not None:
+            scanner.wait()
+        for builder in self.findChildren(ImportGraphBuilder):  # Also cancelled ones still finishing a round
+            builder.cancel()
+            builder.wait()
+        if self.import_cache is not None:
+            self.import_cache.close()
+        if self.llm_request is not None:
+            self.llm_request.cancel()
+        self.llm_handler.shutdown()
+        super().closeEvent(event)
 
     def setup_tree_view(self):
         self.treeView.setHeaderHidden(True)
         self.treeView.setColumnCount(1)
+        self.treeView.itemExpanded.connect(lambda item: expand_tree_item(self, item))
 
     def load_default_ignore(self, silent=False):
         project_path = self.project_path_lineedit.text().strip()
@@ -192,44 +293,179 @@ class MainWindow(Ui_MainWindow, QMainWindow):
             self.list_project_content(self.project_path_lineedit.text())
             self.loaded_ignore = os.path.dirname(file_path)
 
+    def _project_scan_ready(self):
+        """Warns and returns False while the project index is still being filled by the scanner."""
+        if self.project_scanner is not None:
+            self.warning_message.message_box(
+                "Info", "The project folder is still being scanned. Please try again when it completes."
+            )
+            return False
+        return True
+
     def copy_file_tree_to_tab(self):
         project_path = self.project_path_lineedit.text().strip()
-        if project_path:
+        if project_path and self._project_scan_ready():
             file_tree_str = f"Project Folder: {project_path}\nProject Content: \n"
-            file_tree_str += self.file_handler.get_file_tree_string(self.treeView.invisibleRootItem(), 0)
+            file_tree_str += self.file_handler.get_file_tree_string(self.project_index)
             self.tedit_tab4.setPlainText(file_tree_str)
 
     def _collect_files_from_tree_item_recursive(self, tree_item, collected_files_set):
-        for i in range(tree_item.childCount()):
-            child = tree_item.child(i)
-            child_path = child.data(0, Qt.ItemDataRole.UserRole)
-            if os.path.isfile(child_path):
-                collected_files_set.add(os.path.normpath(os.path.abspath(child_path)))
-            elif os.path.isdir(child_path):
-                self._collect_files_from_tree_item_recursive(child, collected_files_set)
+        # Queries the project index, so folders not yet expanded in lazy mode are included.
+        item_path = tree_item.data(0, Qt.ItemDataRole.UserRole)
+        for file_path in self.project_index.iter_files(item_path):
+            collected_files_set.add(os.path.normpath(os.path.abspath(file_path)))
+
+    def file_render_options(self):
+        """Keyword arguments for core.prompt_renderer.render_file_block matching the current settings."""
+        return {
+            "output_type": self.output_type,
+            "line_numbers": self.actionLine_Enumerator.isChecked(),
+            "line_number_width": self.line_number_width,
+            "line_number_separator": self.line_number_separator,
+        }
 
     def _rebuild_files_tab_content(self):
-        output_tab_text_edit = self.tedit_tab5
-        output_tab_text_edit.clear()
-
         sorted_files_for_display = sorted(
             list(self.files_added_to_files_tab), key=lambda x: (os.path.dirname(x).lower(), os.path.basename(x).lower())
         )
 
-        for f_path in sorted_files_for_display:
-            file_content = self.file_handler.read_file_content(f_path)
+        render_options = self.file_render_options()
+        blocks = [None] * len(sorted_files_for_display)
+        cache_keys = [None] * len(sorted_files_for_display)
+        misses = []  # (position, path, cache key) of the files that need to be read
+        for position, f_path in enumerate(sorted_files_for_display):
+            # Unchanged files are served from the cache: one stat instead of a read and a format.
+            cache_key = cache_keys[position] = self.files_tab_cache.make_key(f_path, *render_options.values())
+            blocks[position] = self.files_tab_cache.get(cache_key) if cache_key else None
+            if blocks[position] is None:
+                misses.append((position, f_path, cache_key))
+
+        contents = self.file_handler.read_many([f_path for _, f_path, _ in misses])
+        for (position, f_path, cache_key), file_content in zip(misses, contents):
             if file_content:
-                if self.actionLine_Enumerator.isChecked():
-                    self.prompt_builder._add_file_content_with_line_numbers(
-                        output_tab_text_edit, f_path, file_content, output_type=self.output_type, silent=True
-                    )
-                else:
-                    self.prompt_builder._add_file_content_without_line_numbers(
-                        output_tab_text_edit, f_path, file_content, output_type=self.output_type, silent=True
-                    )
+                blocks[position] = render_file_block(f_path, file_content, **render_options)
+                self.files_tab_cache.put(cache_key, blocks[position])
+        self.files_tab_blocks = [
+            (f_path, key, block)
+            for f_path, key, block in zip(sorted_files_for_display, cache_keys, blocks)
+            if block is not None
+        ]
+        files_text = join_blocks([block for _, _, block in self.files_tab_blocks])
+        # One widget update for the whole selection instead of one appendPlainText per file
+        set_plain_text_bulk(self.tedit_tab5, files_text)
+        self.tedit_tab5.document().setModified(False)  # Edits from here on make compile use the widget text
+        self.files_tab_chunks = joined_block_chunks([block for _, _, block in self.files_tab_blocks])
         self.update_text_counts(self.plainTextEdit_12.toPlainText())  # Update counts for compiled prompt
         # Potentially update counts for tedit_tab5 if needed
 
+    def _get_dependency_analyzer(self, project_root):
+        """Returns the project's analyzer, keeping its directory listings only while the watcher reports changes."""
+        analyzer = self.dependency_analyzer
+        if (
+            analyzer is None
+            or analyzer.project_root != os.path.normpath(os.path.abspath(project_root))
+            or analyzer.dynamic_import_rules != parse_dynamic_import_rules(self.dynamic_import_rules)
+        ):
+            if self.import_cache is None:
+                self.import_cache = ImportCache()
+            analyzer = self.dependency_analyzer = DependencyAnalyzer(
+                project_root, import_cache=self.import_cache, dynamic_import_rules=self.dynamic_import_rules
+            )
+            if self._import_graph_settings != (analyzer.project_root, analyzer.dynamic_import_rules):
+                self._discard_import_graph()
+        elif self.project_watcher is None or self.project_watcher is not self._dependency_analyzer_watcher:
+            analyzer.clear_caches()  # Changes may have gone unnoticed since the last analysis
+            if self.project_watcher is None or self.project_watcher is not self._import_graph_watcher:
+                self._discard_import_graph()
+        self._dependency_analyzer_watcher = self.project_watcher
+        return analyzer
+
+    def toggle_full_import_graph(self):
+        if self.actionFull_Import_Graph.isChecked():
+            self.start_import_graph_build()
+        else:
+            self._discard_import_graph()
+
+    def start_import_graph_build(self):
+        """
+        Builds the whole-project import graph in the background, unless it is built or being built.
+
+        The graph is only kept while the project watcher reports changes (a change discards and
+        rebuilds it); without the watcher nothing would tell when it goes stale, so imports are
+        walked from each file instead.
+        """
+        if self.import_graph is not None or self.import_graph_builder is not None:
+            return
+        if not self.project_index.root_path or not self.project_index.complete:
+            return  # Started again by the next dependency request once the scan is done
+        if self.project_watcher is None:
+            self.statusbar.showMessage(
+                "Full Import Graph needs Watch Project Files to keep the graph current; walking imports instead.",
+                8000,
+            )
+            return
+        builder = ImportGraphBuilder(
+            self.project_index.root_path,
+            self.project_index.iter_files(),
+            dynamic_import_rules=self.dynamic_import_rules,
+            cache_path=self.import_cache.db_path if self.import_cache is not None else None,
+            parent=self,
+        )
+        builder.graph_ready.connect(lambda graph, cycles: self._import_graph_built(builder, graph, cycles))
+        builder.finished.connect(builder.deleteLater)
+        self.import_graph_builder = builder
+        self._import_graph_watcher = self.project_watcher
+        self._import_graph_settings = (
+            os.path.normpath(os.path.abspath(self.project_index.root_path)),
+            parse_dynamic_import_rules(self.dynamic_import_rules),
+        )
+        self.statusbar.showMessage("Building import graph in the background...")
+        builder.start()
+
+    def _import_graph_built(self, builder, graph, cycles):
+        if builder is not self.import_graph_builder:
+            return  # Discarded while it was running
+        self.import_graph_builder = None
+        self.import_graph = graph
+        self.statusbar.showMessage(f"Import graph: {len(graph)} file(s), {len(cycles)} import cycle(s).", 5000)
+
+    def _discard_import_graph(self):
+        self.import_graph = None
+        if self.import_graph_builder is not None:
+            self.import_graph_builder.cancel()  # Deleted by its finished signal
+            self.import_graph_builder = None
+
+    def _find_dependencies(self, analyzer, file_path):
+        """
+        Returns the dependency closure of file_path within the configured depth, token budget and exclusions.
+
+        Uses the whole-project import graph in "Full Import Graph" mode, else walks imports from file_path.
+        """
+        max_bytes = None
+        if self.dependency_max_tokens is not None:
+            max_bytes = self.dependency_max_tokens * BYTES_PER_TOKEN
+        use_graph = self.actionFull_Import_Graph.isChecked() and self.project_scanner is None
+        if use_graph and self.import_graph is None:
+            self.start_import_graph_build()  # Walk the imports from file_path until the graph is ready
+        if use_graph and self.import_graph is not None:
+            distances, omitted = self.import_graph.find_dependencies(
+                file_path,
+                max_depth=self.dependency_max_depth,
+                max_bytes=max_bytes,
+                is_excluded=analyzer.exclusion_matcher(self.dependency_exclude),
+            )
+        else:
+            distances, omitted = analyzer.find_dependencies(
+                file_path, max_depth=self.dependency_max_depth, max_bytes=max_bytes, exclude=self.dependency_exclude
+            )
+        if omitted:
+            self.statusbar.showMessage(
+                f"Added {len(distances)} file(s) up to distance {max(distances.values())}; "
+                f"{len(omitted)} dependency file(s) left out by the token budget.",
+                8000,
+            )
+        return distances
+
     def add_selected_item_and_dependencies_to_prompt(self):
         selected_items = self.treeView.selectedItems()
         if not selected_items:
@@ -244,15 +480,17 @@ class MainWindow(Ui_MainWindow, QMainWindow):
         project_root = self.project_path_lineedit.text().strip()
 
         files_to_process_for_this_click = set()
+        distances = {}  # Import distances of this click's files; files without one were added directly
 
-        if os.path.isfile(item_path_from_tree):
+        if self.project_index.is_file(item_path_from_tree):
             abs_item_path = os.path.normpath(os.path.abspath(item_path_from_tree))
-            if item_path_from_tree.endswith(".py") and project_root:
+            if language_for(item_path_from_tree) is not None and project_root:
                 try:
-                    analyzer = DependencyAnalyzer(project_root)
-                    dependencies = analyzer.find_all_dependencies(item_path_from_tree)  # Expects non-normalized?
+                    analyzer = self._get_dependency_analyzer(project_root)
+                    dependencies = self._find_dependencies(analyzer, item_path_from_tree)
                     # Ensure dependencies are normalized absolute paths
-                    files_to_process_for_this_click.update(os.path.normpath(os.path.abspath(p)) for p in dependencies)
+                    distances = {os.path.normpath(os.path.abspath(p)): d for p, d in dependencies.items()}
+                    files_to_process_for_this_click.update(distances)
                 except Exception as e:
                     self.warning_message.message_box(
                         "Error", f"Error analyzing dependencies for {os.path.basename(item_path_from_tree)}: {e}"
@@ -260,19 +498,22 @@ class MainWindow(Ui_MainWindow, QMainWindow):
                     files_to_process_for_this_click.add(abs_item_path)
             else:
                 files_to_process_for_this_click.add(abs_item_path)
-        elif os.path.isdir(item_path_from_tree):
+        elif self.project_index.is_dir(item_path_from_tree):
+            if not self._project_scan_ready():
+                return
             self._collect_files_from_tree_item_recursive(selected_item, files_to_process_for_this_click)
 
         if not files_to_process_for_this_click:
             self.warning_message.message_box("Info", "No files found to add for the selected item.")
             return
 
-        newly_added_to_master_set_count = 0
-        for f_path in files_to_process_for_this_click:
-            # Paths should already be normalized absolute from collection logic
-            if f_path not in self.files_added_to_files_tab:
-                self.files_added_to_files_tab.add(f_path)
-                newly_added_to_master_set_count += 1
+        # Paths should already be normalized absolute from collection logic
+        new_files = self._filter_new_files(files_to_process_for_this_click)
+        self.files_added_to_files_tab.update(new_files)
+        newly_added_to_master_set_count = len(new_files)
+        for f_path in files_to_process_for_this_click & self.files_added_to_files_tab:
+            distance = distances.get(f_path, 0)
+            self.files_tab_distances[f_path] = min(self.files_tab_distances.get(f_path, distance), distance)
 
         self._rebuild_files_tab_content()
 
@@ -290,15 +531,24 @@ class MainWindow(Ui_MainWindow, QMainWindow):
             message = "'Files' tab refreshed."
         self.warning_message.message_box("Success", message)
 
+    def _filter_new_files(self, normalized_paths):
+        """
+        Returns the paths not yet in the Files tab that pass the binary and size checks,
+        reporting the skipped ones in a single message.
+        """
+        candidates = sorted(set(normalized_paths) - self.files_added_to_files_tab)
+        accepted, skipped = self.file_handler.filter_prompt_files(candidates)
+        self.file_handler.report_skipped(skipped)
+        return accepted
+
     def add_all_files_content_to_prompt(self):
+        if not self._project_scan_ready():
+            return
         paths_from_builder = self.prompt_builder.get_all_project_files_for_prompt()
 
-        newly_added_to_master_set_count = 0
-        for f_path in paths_from_builder:
-            normalized_f_path = os.path.normpath(os.path.abspath(f_path))
-            if normalized_f_path not in self.files_added_to_files_tab:
-                self.files_added_to_files_tab.add(normalized_f_path)
-                newly_added_to_master_set_count += 1
+        new_files = self._filter_new_files(os.path.normpath(os.path.abspath(p)) for p in paths_from_builder)
+        self.files_added_to_files_tab.update(new_files)
+        newly_added_to_master_set_count = len(new_files)
 
         self._rebuild_files_tab_content()
 
@@ -320,13 +570,93 @@ class MainWindow(Ui_MainWindow, QMainWindow):
             self.prompt_builder.add_folder_files_content_to_prompt(selected_folder)
 
     def compile_prompt(self):
-        final_prompt = self.prompt_builder.compile_prompt()
-        self.plainTextEdit_12.setPlainText(final_prompt)
-        self.update_text_counts(final_prompt)
+        sections = self.prompt_builder.collect_prompt_sections()
+        sections, report = self._budget_prompt_sections(sections)
+        final_prompt = self.prompt_builder.compile_prompt(sections, report.format_summary(), self.max_clipboard_chars)
+        if final_prompt is not None and len(final_prompt) <= self.prompt_preview_max_chars:
+            preview = final_prompt
+            self.compiled_prompt_counts = None
+            self.text_processor.remember_tokens(COMPILED_PROMPT_KEY, final_prompt, report.total)
+        else:
+            # Only the start of a huge prompt goes into the editor; the counts still describe all of it.
+            preview, char_count, line_count, _ = prompt_preview(
+                iter_prompt_chunks(sections), self.prompt_preview_max_chars
+            )
+            preview += (
+                f"\n... [preview truncated to {len(preview)} of {char_count} characters; "
+                "use File > Compile Prompt to File for the full prompt]"
+            )
+            self.compiled_prompt_counts = (preview, report.total, char_count, line_count)
+        set_plain_text_bulk(self.plainTextEdit_12, preview)
+        self.update_text_counts(preview)
+        if report.over_budget:
+            self.statusbar.showMessage(
+                f"Compiled prompt is {report.total - report.limit} token(s) over the {report.limit} token limit.", 8000
+            )
+
+    def compile_prompt_to_file(self):
+        """Streams the compiled prompt to a file chunk by chunk, for prompts too large for the clipboard."""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Compile Prompt to File", "", "Text Files (*.txt *.md *.xml);;All Files (*)"
+        )
+        if not file_path:
+            return
+        sections, report = self._budget_prompt_sections(self.prompt_builder.collect_prompt_sections())
+        try:
+            with open(file_path, "w", encoding="utf-8", newline="") as f:
+                written = write_prompt(iter_prompt_chunks(sections), f)
+        except OSError as e:
+            self.warning_message.message_box("Error", f"Could not write the prompt to {file_path}: {e}")
+            return
+        self.warning_message.message_box(
+            "Prompt Saved", f"Wrote {written} characters to {file_path}.\n\n{report.format_summary()}"
+        )
+
+    def _budget_prompt_sections(self, sections):
+        """
+        Counts the prompt per tab, per Files tab file and per patch, trimming the Files tab to context_token_limit.
+
+        Per-file counts come from the block cache, so unchanged files are not tokenized again. Only the
+        compiled copy is trimmed (see core.prompt_budget); the Files tab keeps every file. A Files tab
+        edited by hand is counted, and kept, as a whole.
+
+        Returns:
+            tuple: (sections with the Files tab trimmed if needed, PromptBudgetReport)
+        """
+        files_index = next(
+            (index for index, (_, content) in enumerate(sections) if content is self.files_tab_chunks), None
+        )
+        files = []
+        if files_index is not None:
+            files = [
+                (
+                    f_path,
+                    block,
+                    self.text_processor.count_block_tokens(key, block),
+                    self.files_tab_distances.get(f_path, 0),
+                )
+                for f_path, key, block in self.files_tab_blocks
+            ]
+        # Tab texts are cached under their tab names; tags, patches and elided blocks are counted as they come.
+        section_keys = {id(content): tab_text for tab_text, content in sections if isinstance(content, str)}
+        return budget_prompt_sections(
+            sections,
+            files_index,
+            files,
+            lambda text: self.text_processor.count_tokens(text, key=section_keys.get(id(text))),
+            self.file_handler.read_many,
+            self.file_render_options(),
+            limit=self.context_token_limit,
+            strategies=self.prompt_trim_strategies,
+            patches=self.patches,
+        )
 
     def update_text_counts(self, text):
-        word_count, char_count, line_count = self.text_processor.count_text_properties(text)
-        self.label_token_count.setText(f"Tokens: {word_count}")
+        if self.compiled_prompt_counts is not None and self.compiled_prompt_counts[0] == text:
+            _, token_count, char_count, line_count = self.compiled_prompt_counts  # Counts of the whole prompt
+        else:
+            token_count, char_count, line_count = self.text_processor.count_text_properties(text, COMPILED_PROMPT_KEY)
+        self.label_token_count.setText(f"Tokens: {token_count}")
         self.label_char_count.setText(f"Characters: {char_count}")
         self.label_line_count.setText(f"Lines: {line_count}")
 
@@ -335,6 +665,9 @@ class MainWindow(Ui_MainWindow, QMainWindow):
 
     def open_project(self):
         self.project_manager.open_project(self)
+        if self.tokenizer_vocab_path != self._loaded_tokenizer_vocab_path:
+            self.text_processor.set_tokenizer(load_tokenizer(self.tokenizer_vocab_path))
+            self._loaded_tokenizer_vocab_path = self.tokenizer_vocab_path
         # After project data is loaded, including self.files_added_to_files_tab,
         # rebuild the "Files" tab content.
         self._rebuild_files_tab_content()
@@ -355,7 +688,34 @@ class MainWindow(Ui_MainWindow, QMainWindow):
     def refresh_file_tree(self):
         self.load_default_ignore(silent=True)
 
+    def toggle_project_watcher(self):
+        if self.actionWatch_Project_Files.isChecked():
+            start_project_watcher(self)
+        else:
+            stop_project_watcher(self)
+
+    def apply_project_changes(self, paths):
+        """Applies watcher changes to the tree and re-renders only the affected blocks of the Files tab."""
+        if self.dependency_analyzer is not None:
+            self.dependency_analyzer.invalidate(paths)
+        self._discard_import_graph()
+        if self.actionFull_Import_Graph.isChecked():
+            self.start_import_graph_build()  # Unchanged files come from the import cache
+        modified, removed = apply_project_changes(self, paths)
+        modified = {os.path.normpath(os.path.abspath(p)) for p in modified} & self.files_added_to_files_tab
+        removed = {os.path.normpath(os.path.abspath(p)) for p in removed} & self.files_added_to_files_tab
+        if modified or removed:
+            # Modified files miss the block cache through their new mtime; the others are reused.
+            self.files_added_to_files_tab.difference_update(removed)
+            for f_path in removed:
+                self.files_tab_distances.pop(f_path, None)
+            self._rebuild_files_tab_content()
+
     def call_llm_api(self, text_box: QPlainTextEdit):
+        """Starts an enhancement call in the background; while it runs, pb_enhance cancels it."""
+        if self.llm_request is not None:
+            self.llm_request.cancel()
+            return
         user_input = text_box.toPlainText().strip()
         # Ensure role_data and structure_data paths are correct or handle errors
         try:
@@ -376,9 +736,41 @@ class MainWindow(Ui_MainWindow, QMainWindow):
             else:
                 if not self.llm_handler.load_api_key(api=selected_api, key=self.api_key_path):
                     return
-            self.warning_message.message_box("Info", "Calling the LLM API, please wait")
-            thought_process, response = self.llm_handler.call_api(user_input, role_data, structure_data)
-
+        except Exception as e:
+            self.warning_message.message_box("Error", f"Error during the LLM API Call: {e}")
+            return
+        # The dialog opens right away and shows the response as it streams in; Decline cancels the call.
+        request = LLMRequest(self)
+        review_dialog = ReviewDialog("", self, streaming=True)
+        review_dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        request.text_received.connect(review_dialog.append_text)
+        request.finished.connect(lambda result: self._llm_call_finished(user_input, result))
+        request.failed.connect(self._llm_call_failed)
+        request.cancelled.connect(self._llm_call_cancelled)
+        review_dialog.finished.connect(lambda _: self._review_dialog_closed(text_box, request, review_dialog))
+        self.llm_request = request
+        self.review_dialog = review_dialog
+        request.start(
+            self.llm_handler.submit_api_call(user_input, role_data, structure_data, on_text=request.add_text)
+        )
+        self.pb_enhance.setText("Cancel")
+        self.statusbar.showMessage(f"Calling the {selected_api} API... (click Cancel to stop)")
+        review_dialog.open()
+
+    def _end_llm_call(self):
+        self.llm_request.deleteLater()  # Called from its own signals, so not deleted right away
+        self.llm_request = None
+        self.pb_enhance.setText("Enhance Prompt")
+        self.statusbar.clearMessage()
+
+    def _close_review_dialog(self):
+        if self.review_dialog is not None:
+            self.review_dialog.close()
+
+    def _llm_call_finished(self, user_input, result):
+        self._end_llm_call()
+        thought_process, response = result
+        try:
             self.llm_handler.log_output(
                 {
                     "user_input": user_input,
@@ -390,11 +782,27 @@ class MainWindow(Ui_MainWindow, QMainWindow):
                 self.llm_handler.LOG_FILE,
             )
             self.llm_handler.save_output(response, self.llm_handler.LOG_FILE)  # This probably should be unique name
-
-            review_dialog = ReviewDialog(response["enhanced_prompt"], self)
-            review_dialog.exec()
-
-            if review_dialog.get_accepted():
-                text_box.setPlainText(response["enhanced_prompt"])
+            if self.review_dialog is not None:  # Else closed just as the result came in
+                self.review_dialog.finish_streaming(response["enhanced_prompt"])
         except Exception as e:
+            self._close_review_dialog()
             self.warning_message.message_box("Error", f"Error during the LLM API Call: {e}")
+
+    def _llm_call_failed(self, error):
+        self._end_llm_call()
+        self._close_review_dialog()
+        self.llm_handler.log_api_error(error)
+        self.warning_message.message_box("Error", f"Error during the LLM API Call: {error}")
+
+    def _llm_call_cancelled(self):
+        self._end_llm_call()
+        self._close_review_dialog()
+        self.statusbar.showMessage("LLM API call cancelled.", 5000)
+
+    def _review_dialog_closed(self, text_box, request, review_dialog):
+        # The dialog deletes itself once closed; results that arrive later only get logged.
+        self.review_dialog = None
+        if request is self.llm_request and request.is_running():  # Declined while the response streamed in
+            request.cancel()
+        elif review_dialog.get_accepted():
+            text_box.setPlainText(review_dialog.enhanced_prompt)
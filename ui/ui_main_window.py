@@ -0,0 +1,614 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'ui_main_window.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
+    QCursor, QFont, QFontDatabase, QGradient,
+    QIcon, QImage, QKeySequence, QLinearGradient,
+    QPainter, QPalette, QPixmap, QRadialGradient,
+    QTransform)
+from PySide6.QtWidgets import (QApplication, QComboBox, QHBoxLayout, QHeaderView,
+    QLabel, QLayout, QLineEdit, QListWidget,
+    QListWidgetItem, QMainWindow, QMenu, QMenuBar,
+    QPlainTextEdit, QPushButton, QSizePolicy, QSpacerItem,
+    QStatusBar, QTabWidget, QToolButton, QTreeWidget,
+    QTreeWidgetItem, QVBoxLayout, QWidget)
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(1280, 720)
+        MainWindow.setMinimumSize(QSize(1080, 720))
+        self.actionOpen_Project = QAction(MainWindow)
+        self.actionOpen_Project.setObjectName(u"actionOpen_Project")
+        self.actionSave_Project = QAction(MainWindow)
+        self.actionSave_Project.setObjectName(u"actionSave_Project")
+        self.actionCompile_to_File = QAction(MainWindow)
+        self.actionCompile_to_File.setObjectName(u"actionCompile_to_File")
+        self.actionExport_Project = QAction(MainWindow)
+        self.actionExport_Project.setObjectName(u"actionExport_Project")
+        self.actionLine_Enumerator = QAction(MainWindow)
+        self.actionLine_Enumerator.setObjectName(u"actionLine_Enumerator")
+        self.actionLine_Enumerator.setCheckable(True)
+        self.actionLine_Enumerator.setChecked(False)
+        self.actionAbout = QAction(MainWindow)
+        self.actionAbout.setObjectName(u"actionAbout")
+        self.actionNew_Project = QAction(MainWindow)
+        self.actionNew_Project.setObjectName(u"actionNew_Project")
+        self.actionMute_Warnings = QAction(MainWindow)
+        self.actionMute_Warnings.setObjectName(u"actionMute_Warnings")
+        self.actionMute_Warnings.setCheckable(True)
+        self.actionAbout_PySide = QAction(MainWindow)
+        self.actionAbout_PySide.setObjectName(u"actionAbout_PySide")
+        self.actionAbout_Google_AI_Studio = QAction(MainWindow)
+        self.actionAbout_Google_AI_Studio.setObjectName(u"actionAbout_Google_AI_Studio")
+        self.actionXML_JSON_Formatting = QAction(MainWindow)
+        self.actionXML_JSON_Formatting.setObjectName(u"actionXML_JSON_Formatting")
+        self.actionXML_JSON_Formatting.setCheckable(True)
+        self.actionLazy_Tree_Loading = QAction(MainWindow)
+        self.actionLazy_Tree_Loading.setObjectName(u"actionLazy_Tree_Loading")
+        self.actionLazy_Tree_Loading.setCheckable(True)
+        self.actionWatch_Project_Files = QAction(MainWindow)
+        self.actionWatch_Project_Files.setObjectName(u"actionWatch_Project_Files")
+        self.actionWatch_Project_Files.setCheckable(True)
+        self.actionFull_Import_Graph = QAction(MainWindow)
+        self.actionFull_Import_Graph.setObjectName(u"actionFull_Import_Graph")
+        self.actionFull_Import_Graph.setCheckable(True)
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        self.verticalLayout_10 = QVBoxLayout(self.centralwidget)
+        self.verticalLayout_10.setObjectName(u"verticalLayout_10")
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setContentsMargins(9, -1, 6, -1)
+        self.pb_projectnew = QPushButton(self.centralwidget)
+        self.pb_projectnew.setObjectName(u"pb_projectnew")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.pb_projectnew.sizePolicy().hasHeightForWidth())
+        self.pb_projectnew.setSizePolicy(sizePolicy)
+        self.pb_projectnew.setMinimumSize(QSize(60, 25))
+        self.pb_projectnew.setMaximumSize(QSize(80, 25))
+
+        self.horizontalLayout.addWidget(self.pb_projectnew)
+
+        self.pb_projectopen = QPushButton(self.centralwidget)
+        self.pb_projectopen.setObjectName(u"pb_projectopen")
+        sizePolicy.setHeightForWidth(self.pb_projectopen.sizePolicy().hasHeightForWidth())
+        self.pb_projectopen.setSizePolicy(sizePolicy)
+        self.pb_projectopen.setMinimumSize(QSize(60, 25))
+        self.pb_projectopen.setMaximumSize(QSize(80, 25))
+
+        self.horizontalLayout.addWidget(self.pb_projectopen)
+
+        self.pb_projectsave = QPushButton(self.centralwidget)
+        self.pb_projectsave.setObjectName(u"pb_projectsave")
+        sizePolicy.setHeightForWidth(self.pb_projectsave.sizePolicy().hasHeightForWidth())
+        self.pb_projectsave.setSizePolicy(sizePolicy)
+        self.pb_projectsave.setMinimumSize(QSize(60, 25))
+        self.pb_projectsave.setMaximumSize(QSize(80, 25))
+
+        self.horizontalLayout.addWidget(self.pb_projectsave)
+
+        self.tb_toolbox = QToolButton(self.centralwidget)
+        self.tb_toolbox.setObjectName(u"tb_toolbox")
+        self.tb_toolbox.setMinimumSize(QSize(0, 25))
+        self.tb_toolbox.setMaximumSize(QSize(16777215, 25))
+
+        self.horizontalLayout.addWidget(self.tb_toolbox)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.horizontalLayout_5 = QHBoxLayout()
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+
+        self.horizontalLayout.addLayout(self.horizontalLayout_5)
+
+        self.horizontalSpacer_6 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer_6)
+
+        self.cb_api = QComboBox(self.centralwidget)
+        self.cb_api.addItem("")
+        self.cb_api.addItem("")
+        self.cb_api.addItem("")
+        self.cb_api.addItem("")
+        self.cb_api.addItem("")
+        self.cb_api.setObjectName(u"cb_api")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.cb_api.sizePolicy().hasHeightForWidth())
+        self.cb_api.setSizePolicy(sizePolicy1)
+        self.cb_api.setMinimumSize(QSize(150, 0))
+
+        self.horizontalLayout.addWidget(self.cb_api)
+
+
+        self.verticalLayout_10.addLayout(self.horizontalLayout)
+
+        self.horizontalLayout_4 = QHBoxLayout()
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.widget_3 = QWidget(self.centralwidget)
+        self.widget_3.setObjectName(u"widget_3")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Preferred)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.widget_3.sizePolicy().hasHeightForWidth())
+        self.widget_3.setSizePolicy(sizePolicy2)
+        self.widget_3.setMinimumSize(QSize(300, 626))
+        self.widget_3.setMaximumSize(QSize(300, 16777215))
+        self.verticalLayout_6 = QVBoxLayout(self.widget_3)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.label_project = QLabel(self.widget_3)
+        self.label_project.setObjectName(u"label_project")
+        self.label_project.setStyleSheet(u"font: 75 10pt \"MS Shell Dlg 2\";")
+
+        self.verticalLayout_6.addWidget(self.label_project)
+
+        self.horizontalLayout_3 = QHBoxLayout()
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setSizeConstraint(QLayout.SetFixedSize)
+        self.horizontalLayout_3.setContentsMargins(-1, 3, -1, 3)
+        self.project_path_lineedit = QLineEdit(self.widget_3)
+        self.project_path_lineedit.setObjectName(u"project_path_lineedit")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.project_path_lineedit.sizePolicy().hasHeightForWidth())
+        self.project_path_lineedit.setSizePolicy(sizePolicy3)
+        self.project_path_lineedit.setMaximumSize(QSize(200, 16777215))
+
+        self.horizontalLayout_3.addWidget(self.project_path_lineedit)
+
+        self.pb_choose_folder = QPushButton(self.widget_3)
+        self.pb_choose_folder.setObjectName(u"pb_choose_folder")
+        sizePolicy4 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        sizePolicy4.setHorizontalStretch(0)
+        sizePolicy4.setVerticalStretch(3)
+        sizePolicy4.setHeightForWidth(self.pb_choose_folder.sizePolicy().hasHeightForWidth())
+        self.pb_choose_folder.setSizePolicy(sizePolicy4)
+        self.pb_choose_folder.setMaximumSize(QSize(100, 16777215))
+
+        self.horizontalLayout_3.addWidget(self.pb_choose_folder)
+
+
+        self.verticalLayout_6.addLayout(self.horizontalLayout_3)
+
+        self.pb_refresh = QPushButton(self.widget_3)
+        self.pb_refresh.setObjectName(u"pb_refresh")
+        self.pb_refresh.setMaximumSize(QSize(300, 16777215))
+
+        self.verticalLayout_6.addWidget(self.pb_refresh)
+
+        self.pb_loadgitignore = QPushButton(self.widget_3)
+        self.pb_loadgitignore.setObjectName(u"pb_loadgitignore")
+        self.pb_loadgitignore.setMaximumSize(QSize(300, 16777215))
+
+        self.verticalLayout_6.addWidget(self.pb_loadgitignore)
+
+        self.le_search = QLineEdit(self.widget_3)
+        self.le_search.setObjectName(u"le_search")
+        self.le_search.setMaximumSize(QSize(300, 16777215))
+
+        self.verticalLayout_6.addWidget(self.le_search)
+
+        self.treeView = QTreeWidget(self.widget_3)
+        __qtreewidgetitem = QTreeWidgetItem()
+        __qtreewidgetitem.setText(0, u"1")
+        self.treeView.setHeaderItem(__qtreewidgetitem)
+        self.treeView.setObjectName(u"treeView")
+        self.treeView.setMaximumSize(QSize(300, 16777215))
+
+        self.verticalLayout_6.addWidget(self.treeView)
+
+
+        self.horizontalLayout_4.addWidget(self.widget_3)
+
+        self.verticalLayout_20 = QVBoxLayout()
+        self.verticalLayout_20.setObjectName(u"verticalLayout_20")
+        self.prompt_tab = QTabWidget(self.centralwidget)
+        self.prompt_tab.setObjectName(u"prompt_tab")
+        self.prompt_tab.setMouseTracking(False)
+        self.tab = QWidget()
+        self.tab.setObjectName(u"tab")
+        self.verticalLayout_5 = QVBoxLayout(self.tab)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.widget = QWidget(self.tab)
+        self.widget.setObjectName(u"widget")
+        self.verticalLayout_3 = QVBoxLayout(self.widget)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.tedit_tab1 = QPlainTextEdit(self.widget)
+        self.tedit_tab1.setObjectName(u"tedit_tab1")
+
+        self.verticalLayout_3.addWidget(self.tedit_tab1)
+
+        self.horizontalLayout_11 = QHBoxLayout()
+        self.horizontalLayout_11.setObjectName(u"horizontalLayout_11")
+        self.pb_enhance = QPushButton(self.widget)
+        self.pb_enhance.setObjectName(u"pb_enhance")
+
+        self.horizontalLayout_11.addWidget(self.pb_enhance)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_11)
+
+
+        self.verticalLayout_5.addWidget(self.widget)
+
+        self.prompt_tab.addTab(self.tab, "")
+        self.tab_thinking = QWidget()
+        self.tab_thinking.setObjectName(u"tab_thinking")
+        self.verticalLayout_14 = QVBoxLayout(self.tab_thinking)
+        self.verticalLayout_14.setObjectName(u"verticalLayout_14")
+        self.widget_8 = QWidget(self.tab_thinking)
+        self.widget_8.setObjectName(u"widget_8")
+        self.verticalLayout_13 = QVBoxLayout(self.widget_8)
+        self.verticalLayout_13.setObjectName(u"verticalLayout_13")
+        self.tedit_tab_toughts = QPlainTextEdit(self.widget_8)
+        self.tedit_tab_toughts.setObjectName(u"tedit_tab_toughts")
+
+        self.verticalLayout_13.addWidget(self.tedit_tab_toughts)
+
+        self.horizontalLayout_13 = QHBoxLayout()
+        self.horizontalLayout_13.setObjectName(u"horizontalLayout_13")
+        self.pb_thoughts = QPushButton(self.widget_8)
+        self.pb_thoughts.setObjectName(u"pb_thoughts")
+
+        self.horizontalLayout_13.addWidget(self.pb_thoughts)
+
+
+        self.verticalLayout_13.addLayout(self.horizontalLayout_13)
+
+
+        self.verticalLayout_14.addWidget(self.widget_8)
+
+        self.prompt_tab.addTab(self.tab_thinking, "")
+        self.tab_2 = QWidget()
+        self.tab_2.setObjectName(u"tab_2")
+        self.verticalLayout = QVBoxLayout(self.tab_2)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.widget_2 = QWidget(self.tab_2)
+        self.widget_2.setObjectName(u"widget_2")
+        self.verticalLayout_4 = QVBoxLayout(self.widget_2)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.horizontalLayout_8 = QHBoxLayout()
+        self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
+        self.cb_tab2_load_example = QComboBox(self.widget_2)
+        self.cb_tab2_load_example.addItem("")
+        self.cb_tab2_load_example.setObjectName(u"cb_tab2_load_example")
+        self.cb_tab2_load_example.setMaxVisibleItems(12)
+
+        self.horizontalLayout_8.addWidget(self.cb_tab2_load_example)
+
+        self.pb_tab2_load_example = QPushButton(self.widget_2)
+        self.pb_tab2_load_example.setObjectName(u"pb_tab2_load_example")
+
+        self.horizontalLayout_8.addWidget(self.pb_tab2_load_example)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_8)
+
+        self.tedit_tab2 = QPlainTextEdit(self.widget_2)
+        self.tedit_tab2.setObjectName(u"tedit_tab2")
+
+        self.verticalLayout_4.addWidget(self.tedit_tab2)
+
+
+        self.verticalLayout.addWidget(self.widget_2)
+
+        self.prompt_tab.addTab(self.tab_2, "")
+        self.patch_tab = QWidget()
+        self.patch_tab.setObjectName(u"patch_tab")
+        self.horizontalLayout_patch = QHBoxLayout(self.patch_tab)
+        self.horizontalLayout_patch.setObjectName(u"horizontalLayout_patch")
+        self.verticalLayout_patch_input = QVBoxLayout()
+        self.verticalLayout_patch_input.setObjectName(u"verticalLayout_patch_input")
+        self.patch_input = QPlainTextEdit(self.patch_tab)
+        self.patch_input.setObjectName(u"patch_input")
+
+        self.verticalLayout_patch_input.addWidget(self.patch_input)
+
+        self.pb_add_patch = QPushButton(self.patch_tab)
+        self.pb_add_patch.setObjectName(u"pb_add_patch")
+
+        self.verticalLayout_patch_input.addWidget(self.pb_add_patch)
+
+
+        self.horizontalLayout_patch.addLayout(self.verticalLayout_patch_input)
+
+        self.verticalLayout_patch_list = QVBoxLayout()
+        self.verticalLayout_patch_list.setObjectName(u"verticalLayout_patch_list")
+        self.patch_list = QListWidget(self.patch_tab)
+        self.patch_list.setObjectName(u"patch_list")
+
+        self.verticalLayout_patch_list.addWidget(self.patch_list)
+
+        self.pb_remove_patch = QPushButton(self.patch_tab)
+        self.pb_remove_patch.setObjectName(u"pb_remove_patch")
+
+        self.verticalLayout_patch_list.addWidget(self.pb_remove_patch)
+
+
+        self.horizontalLayout_patch.addLayout(self.verticalLayout_patch_list)
+
+        self.prompt_tab.addTab(self.patch_tab, "")
+        self.tab_6 = QWidget()
+        self.tab_6.setObjectName(u"tab_6")
+        self.verticalLayout_12 = QVBoxLayout(self.tab_6)
+        self.verticalLayout_12.setObjectName(u"verticalLayout_12")
+        self.widget_7 = QWidget(self.tab_6)
+        self.widget_7.setObjectName(u"widget_7")
+        self.verticalLayout_11 = QVBoxLayout(self.widget_7)
+        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
+        self.horizontalLayout_12 = QHBoxLayout()
+        self.horizontalLayout_12.setObjectName(u"horizontalLayout_12")
+        self.pb_add_files_context = QPushButton(self.widget_7)
+        self.pb_add_files_context.setObjectName(u"pb_add_files_context")
+
+        self.horizontalLayout_12.addWidget(self.pb_add_files_context)
+
+        self.pb_add_folder_context = QPushButton(self.widget_7)
+        self.pb_add_folder_context.setObjectName(u"pb_add_folder_context")
+
+        self.horizontalLayout_12.addWidget(self.pb_add_folder_context)
+
+
+        self.verticalLayout_11.addLayout(self.horizontalLayout_12)
+
+        self.tab_context = QPlainTextEdit(self.widget_7)
+        self.tab_context.setObjectName(u"tab_context")
+
+        self.verticalLayout_11.addWidget(self.tab_context)
+
+
+        self.verticalLayout_12.addWidget(self.widget_7)
+
+        self.prompt_tab.addTab(self.tab_6, "")
+        self.tab_4 = QWidget()
+        self.tab_4.setObjectName(u"tab_4")
+        self.verticalLayout_19 = QVBoxLayout(self.tab_4)
+        self.verticalLayout_19.setObjectName(u"verticalLayout_19")
+        self.widget_4 = QWidget(self.tab_4)
+        self.widget_4.setObjectName(u"widget_4")
+        self.verticalLayout_7 = QVBoxLayout(self.widget_4)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.pb_copyfiletree = QPushButton(self.widget_4)
+        self.pb_copyfiletree.setObjectName(u"pb_copyfiletree")
+
+        self.verticalLayout_7.addWidget(self.pb_copyfiletree)
+
+        self.tedit_tab4 = QPlainTextEdit(self.widget_4)
+        self.tedit_tab4.setObjectName(u"tedit_tab4")
+
+        self.verticalLayout_7.addWidget(self.tedit_tab4)
+
+
+        self.verticalLayout_19.addWidget(self.widget_4)
+
+        self.prompt_tab.addTab(self.tab_4, "")
+        self.tab_5 = QWidget()
+        self.tab_5.setObjectName(u"tab_5")
+        self.verticalLayout_9 = QVBoxLayout(self.tab_5)
+        self.verticalLayout_9.setObjectName(u"verticalLayout_9")
+        self.widget_6 = QWidget(self.tab_5)
+        self.widget_6.setObjectName(u"widget_6")
+        self.verticalLayout_8 = QVBoxLayout(self.widget_6)
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.horizontalLayout_7 = QHBoxLayout()
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.pb_add_file_content = QPushButton(self.widget_6)
+        self.pb_add_file_content.setObjectName(u"pb_add_file_content")
+
+        self.horizontalLayout_7.addWidget(self.pb_add_file_content)
+
+        self.pb_add_file_content_all = QPushButton(self.widget_6)
+        self.pb_add_file_content_all.setObjectName(u"pb_add_file_content_all")
+
+        self.horizontalLayout_7.addWidget(self.pb_add_file_content_all)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_7)
+
+        self.tedit_tab5 = QPlainTextEdit(self.widget_6)
+        self.tedit_tab5.setObjectName(u"tedit_tab5")
+
+        self.verticalLayout_8.addWidget(self.tedit_tab5)
+
+        self.pb_clear_files_selection = QPushButton(self.widget_6)
+        self.pb_clear_files_selection.setObjectName(u"pb_clear_files_selection")
+
+        self.verticalLayout_8.addWidget(self.pb_clear_files_selection)
+
+
+        self.verticalLayout_9.addWidget(self.widget_6)
+
+        self.prompt_tab.addTab(self.tab_5, "")
+
+        self.verticalLayout_20.addWidget(self.prompt_tab)
+
+        self.widget_10 = QWidget(self.centralwidget)
+        self.widget_10.setObjectName(u"widget_10")
+        self.verticalLayout_17 = QVBoxLayout(self.widget_10)
+        self.verticalLayout_17.setObjectName(u"verticalLayout_17")
+        self.label = QLabel(self.widget_10)
+        self.label.setObjectName(u"label")
+
+        self.verticalLayout_17.addWidget(self.label)
+
+        self.plainTextEdit_12 = QPlainTextEdit(self.widget_10)
+        self.plainTextEdit_12.setObjectName(u"plainTextEdit_12")
+        self.plainTextEdit_12.setReadOnly(True)
+
+        self.verticalLayout_17.addWidget(self.plainTextEdit_12)
+
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(6, -1, 6, -1)
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_3)
+
+        self.label_token_count = QLabel(self.widget_10)
+        self.label_token_count.setObjectName(u"label_token_count")
+
+        self.horizontalLayout_2.addWidget(self.label_token_count)
+
+        self.horizontalSpacer_4 = QSpacerItem(20, 20, QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_4)
+
+        self.label_char_count = QLabel(self.widget_10)
+        self.label_char_count.setObjectName(u"label_char_count")
+
+        self.horizontalLayout_2.addWidget(self.label_char_count)
+
+        self.horizontalSpacer_5 = QSpacerItem(20, 20, QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_5)
+
+        self.label_line_count = QLabel(self.widget_10)
+        self.label_line_count.setObjectName(u"label_line_count")
+
+        self.horizontalLayout_2.addWidget(self.label_line_count)
+
+
+        self.verticalLayout_17.addLayout(self.horizontalLayout_2)
+
+
+        self.verticalLayout_20.addWidget(self.widget_10)
+
+        self.compile_button = QPushButton(self.centralwidget)
+        self.compile_button.setObjectName(u"compile_button")
+
+        self.verticalLayout_20.addWidget(self.compile_button)
+
+        self.horizontalSpacer_2 = QSpacerItem(800, 20, QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.Minimum)
+
+        self.verticalLayout_20.addItem(self.horizontalSpacer_2)
+
+
+        self.horizontalLayout_4.addLayout(self.verticalLayout_20)
+
+
+        self.verticalLayout_10.addLayout(self.horizontalLayout_4)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QMenuBar(MainWindow)
+        self.menubar.setObjectName(u"menubar")
+        self.menubar.setGeometry(QRect(0, 0, 1280, 21))
+        self.menuFile = QMenu(self.menubar)
+        self.menuFile.setObjectName(u"menuFile")
+        self.menuHelp = QMenu(self.menubar)
+        self.menuHelp.setObjectName(u"menuHelp")
+        self.menuSettings = QMenu(self.menubar)
+        self.menuSettings.setObjectName(u"menuSettings")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QStatusBar(MainWindow)
+        self.statusbar.setObjectName(u"statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuSettings.menuAction())
+        self.menubar.addAction(self.menuHelp.menuAction())
+        self.menuFile.addAction(self.actionNew_Project)
+        self.menuFile.addAction(self.actionOpen_Project)
+        self.menuFile.addAction(self.actionSave_Project)
+        self.menuFile.addAction(self.actionCompile_to_File)
+        self.menuFile.addAction(self.actionExport_Project)
+        self.menuHelp.addAction(self.actionAbout)
+        self.menuHelp.addAction(self.actionAbout_PySide)
+        self.menuHelp.addAction(self.actionAbout_Google_AI_Studio)
+        self.menuSettings.addAction(self.actionLine_Enumerator)
+        self.menuSettings.addAction(self.actionMute_Warnings)
+        self.menuSettings.addAction(self.actionXML_JSON_Formatting)
+        self.menuSettings.addAction(self.actionLazy_Tree_Loading)
+        self.menuSettings.addAction(self.actionWatch_Project_Files)
+        self.menuSettings.addAction(self.actionFull_Import_Graph)
+
+        self.retranslateUi(MainWindow)
+
+        self.prompt_tab.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"Isolate Prompt Composer", None))
+        self.actionOpen_Project.setText(QCoreApplication.translate("MainWindow", u"Open Project", None))
+        self.actionSave_Project.setText(QCoreApplication.translate("MainWindow", u"Save Project", None))
+        self.actionCompile_to_File.setText(QCoreApplication.translate("MainWindow", u"Compile Prompt to File...", None))
+        self.actionExport_Project.setText(QCoreApplication.translate("MainWindow", u"Export Project", None))
+        self.actionLine_Enumerator.setText(QCoreApplication.translate("MainWindow", u"Line Enumerator", None))
+        self.actionAbout.setText(QCoreApplication.translate("MainWindow", u"About", None))
+        self.actionNew_Project.setText(QCoreApplication.translate("MainWindow", u"New Project", None))
+        self.actionMute_Warnings.setText(QCoreApplication.translate("MainWindow", u"Mute Warnings", None))
+        self.actionAbout_PySide.setText(QCoreApplication.translate("MainWindow", u"About PySide", None))
+        self.actionAbout_Google_AI_Studio.setText(QCoreApplication.translate("MainWindow", u"About Google AI Studio", None))
+        self.actionXML_JSON_Formatting.setText(QCoreApplication.translate("MainWindow", u"XML-JSON Formatting", None))
+        self.actionLazy_Tree_Loading.setText(QCoreApplication.translate("MainWindow", u"Lazy Tree Loading", None))
+        self.actionWatch_Project_Files.setText(QCoreApplication.translate("MainWindow", u"Watch Project Files", None))
+        self.actionFull_Import_Graph.setText(QCoreApplication.translate("MainWindow", u"Full Import Graph", None))
+        self.pb_projectnew.setText(QCoreApplication.translate("MainWindow", u"New Project", None))
+        self.pb_projectopen.setText(QCoreApplication.translate("MainWindow", u"Open Project", None))
+        self.pb_projectsave.setText(QCoreApplication.translate("MainWindow", u"Save Project", None))
+        self.tb_toolbox.setText(QCoreApplication.translate("MainWindow", u"...", None))
+        self.cb_api.setItemText(0, QCoreApplication.translate("MainWindow", u"Choose API...", None))
+        self.cb_api.setItemText(1, QCoreApplication.translate("MainWindow", u"openai", None))
+        self.cb_api.setItemText(2, QCoreApplication.translate("MainWindow", u"google", None))
+        self.cb_api.setItemText(3, QCoreApplication.translate("MainWindow", u"deepseek", None))
+        self.cb_api.setItemText(4, QCoreApplication.translate("MainWindow", u"alibaba-qwen", None))
+
+        self.label_project.setText(QCoreApplication.translate("MainWindow", u"Project:", None))
+        self.pb_choose_folder.setText(QCoreApplication.translate("MainWindow", u"Choose Folder", None))
+        self.pb_refresh.setText(QCoreApplication.translate("MainWindow", u"Refresh", None))
+        self.pb_loadgitignore.setText(QCoreApplication.translate("MainWindow", u"Add filter", None))
+        self.le_search.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Search Files", None))
+        self.pb_enhance.setText(QCoreApplication.translate("MainWindow", u"Enhance Prompt", None))
+        self.prompt_tab.setTabText(self.prompt_tab.indexOf(self.tab), QCoreApplication.translate("MainWindow", u"User Input", None))
+        self.pb_thoughts.setText(QCoreApplication.translate("MainWindow", u"Request Thoughts", None))
+        self.prompt_tab.setTabText(self.prompt_tab.indexOf(self.tab_thinking), QCoreApplication.translate("MainWindow", u"Thinking Prompt", None))
+        self.cb_tab2_load_example.setItemText(0, QCoreApplication.translate("MainWindow", u"Custom", None))
+
+        self.cb_tab2_load_example.setCurrentText(QCoreApplication.translate("MainWindow", u"Custom", None))
+        self.pb_tab2_load_example.setText(QCoreApplication.translate("MainWindow", u"Load Template", None))
+        self.prompt_tab.setTabText(self.prompt_tab.indexOf(self.tab_2), QCoreApplication.translate("MainWindow", u"Role Prompting", None))
+        self.pb_add_patch.setText(QCoreApplication.translate("MainWindow", u"Apply Patch", None))
+        self.pb_remove_patch.setText(QCoreApplication.translate("MainWindow", u"Delete Patch", None))
+        self.prompt_tab.setTabText(self.prompt_tab.indexOf(self.patch_tab), QCoreApplication.translate("MainWindow", u"Patch Comparison", None))
+        self.pb_add_files_context.setText(QCoreApplication.translate("MainWindow", u"Add Files to Context", None))
+        self.pb_add_folder_context.setText(QCoreApplication.translate("MainWindow", u"Add Folder to Context", None))
+        self.tab_context.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Insert information such as external libraries, scripts or other resources. Click \"Add Files to Context\" to load text files.", None))
+        self.prompt_tab.setTabText(self.prompt_tab.indexOf(self.tab_6), QCoreApplication.translate("MainWindow", u"Contextual Information", None))
+        self.pb_copyfiletree.setText(QCoreApplication.translate("MainWindow", u"Copy File Tree", None))
+        self.prompt_tab.setTabText(self.prompt_tab.indexOf(self.tab_4), QCoreApplication.translate("MainWindow", u"File Structure", None))
+        self.pb_add_file_content.setText(QCoreApplication.translate("MainWindow", u"Add File Content", None))
+        self.pb_add_file_content_all.setText(QCoreApplication.translate("MainWindow", u"Add All Project Files", None))
+        self.pb_clear_files_selection.setText(QCoreApplication.translate("MainWindow", u"Clear", None))
+        self.prompt_tab.setTabText(self.prompt_tab.indexOf(self.tab_5), QCoreApplication.translate("MainWindow", u"Files", None))
+        self.label.setText(QCoreApplication.translate("MainWindow", u"Preview", None))
+        self.label_token_count.setText(QCoreApplication.translate("MainWindow", u"Tokens: 0", None))
+        self.label_char_count.setText(QCoreApplication.translate("MainWindow", u"Characters: 0", None))
+        self.label_line_count.setText(QCoreApplication.translate("MainWindow", u"Line Count: 0", None))
+        self.compile_button.setText(QCoreApplication.translate("MainWindow", u"Compile Prompt", None))
+        self.menuFile.setTitle(QCoreApplication.translate("MainWindow", u"File", None))
+        self.menuHelp.setTitle(QCoreApplication.translate("MainWindow", u"Help", None))
+        self.menuSettings.setTitle(QCoreApplication.translate("MainWindow", u"Settings", None))
+    # retranslateUi
+
+# CRC-32 of the .ui file this module was generated from, see ui/forms.py
+UI_SOURCE_HASH = "0742edc5"
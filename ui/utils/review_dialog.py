@@ -1,19 +1,55 @@
 # ui/utils/review_dialog.py
+import time
 from PySide6.QtWidgets import QDialog
+from PySide6.QtGui import QTextCursor
 from ui.utils.ui_review_window import Ui_ReviewDialog
 
 class ReviewDialog(QDialog, Ui_ReviewDialog):
-    def __init__(self, enhanced_prompt, parent=None):
+    def __init__(self, enhanced_prompt, parent=None, streaming=False):
+        """
+        Shows an enhanced prompt to accept or decline.
+
+        In streaming mode the dialog opens before the response: append_text shows the text as
+        it arrives, Decline cancels, and Accept is enabled once finish_streaming sets the prompt.
+        """
         super().__init__(parent)
         self.setupUi(self)
+        self.enhanced_prompt = enhanced_prompt
         self.enhanced_text_edit.setPlainText(enhanced_prompt)
         self.accept_button.clicked.connect(self.accept)
         self.decline_button.clicked.connect(self.reject)
         self.accepted = False
-    
+        self.streaming = streaming
+        self._stream_started = time.perf_counter()
+        self._first_text_after = None  # Seconds until the first piece arrived
+        if streaming:
+            self.accept_button.setEnabled(False)
+            self.decline_button.setText("Cancel")
+            self.label.setText("Waiting for the response...")
+
+    def append_text(self, text):
+        """Adds a streamed piece at the end of the text, keeping it scrolled into view."""
+        if self._first_text_after is None:
+            self._first_text_after = time.perf_counter() - self._stream_started
+            self.label.setText(f"Receiving the response (first text after {self._first_text_after:.1f} s)...")
+        self.enhanced_text_edit.moveCursor(QTextCursor.MoveOperation.End)
+        self.enhanced_text_edit.insertPlainText(text)
+        self.enhanced_text_edit.ensureCursorVisible()
+
+    def finish_streaming(self, enhanced_prompt):
+        """Replaces the streamed response with the enhanced prompt taken from it, ready to be accepted."""
+        self.streaming = False
+        self.enhanced_prompt = enhanced_prompt
+        self.enhanced_text_edit.setPlainText(enhanced_prompt)
+        self.accept_button.setEnabled(True)
+        self.decline_button.setText("Decline")
+        self.label.setText("Accept Changes?")
+
     def accept(self):
+        if self.streaming:
+            return
         self.accepted = True
         self.close()
-    
+
     def get_accepted(self):
         return self.accepted
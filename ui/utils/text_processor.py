@@ -1,20 +1,84 @@
 # ui/utils/text_processor.py
+from collections import OrderedDict
+from core.tokenizer import load_tokenizer
+
 
 class TextProcessor:
-    def __init__(self):
-        pass
+    """
+    Token, character and line counts for the prompt editors.
+
+    Tokens come from a pluggable tokenizer (core.tokenizer: BPE for a local vocab file, a
+    size-based estimate otherwise). Counts are cached per rendered file block, keyed like
+    the Files tab block cache, and per named section (a prompt tab, the compiled prompt),
+    so adding or removing a file only tokenizes that file and recounting an unchanged
+    section costs a hash. Totals are sums of the parts; BPE merges across part boundaries
+    are ignored.
+    """
+
+    def __init__(self, tokenizer=None, max_cached_blocks=20000):
+        self.tokenizer = tokenizer or load_tokenizer()
+        self.max_cached_blocks = max_cached_blocks
+        # Section key -> ((length, hash) of its last text, tokens, lines); the texts themselves are not kept.
+        self._section_counts = {}
+        self._block_tokens = OrderedDict()  # Files tab block cache key -> token count
+
+    def set_tokenizer(self, tokenizer):
+        self.tokenizer = tokenizer
+        self._section_counts.clear()
+        self._block_tokens.clear()
+
+    def count_text_properties(self, text, key=None):
+        """
+        Returns (tokens, characters, lines) of text.
 
-    def count_text_properties(self, text):
-        tokens = len(text.split())
-        characters = len(text)
-        lines = len(text.splitlines())
+        With a key naming the text's section, the token and line counts are reused while the
+        section's text is unchanged.
+        """
+        tokens, lines = self._section_properties(text, key)
+        return tokens, self.count_characters(text), lines
 
-        return tokens, characters, lines
-    def count_tokens(self, text):
-         return len(text.split())
+    def count_tokens(self, text, key=None):
+        """Token count of text, cached under key like count_text_properties (None counts it every time)."""
+        if not text:
+            return 0
+        if key is None:
+            return self.tokenizer.count(text)
+        return self._section_properties(text, key)[0]
+
+    def remember_tokens(self, key, text, tokens):
+        """Records a section's count computed from parts, e.g. the compiled prompt from its budget report."""
+        self._section_counts[key] = ((len(text), hash(text)), tokens, self.count_lines(text))
+
+    def _section_properties(self, text, key):
+        if key is None:
+            return self.tokenizer.count(text) if text else 0, self.count_lines(text)
+        fingerprint = (len(text), hash(text))  # str caches its hash, so a text seen before is not rehashed
+        cached = self._section_counts.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1], cached[2]
+        tokens = self.tokenizer.count(text) if text else 0
+        lines = self.count_lines(text)
+        self._section_counts[key] = (fingerprint, tokens, lines)
+        return tokens, lines
+
+    def count_block_tokens(self, key, block):
+        """Token count of a rendered file block, cached under its block cache key (None disables caching)."""
+        if key is None:
+            return self.tokenizer.count(block)
+        tokens = self._block_tokens.get(key)
+        if tokens is None:
+            tokens = self._block_tokens[key] = self.tokenizer.count(block)
+            while len(self._block_tokens) > self.max_cached_blocks:
+                self._block_tokens.popitem(last=False)
+        else:
+            self._block_tokens.move_to_end(key)
+        return tokens
 
     def count_characters(self, text):
         return len(text)
-    
+
     def count_lines(self, text):
-        return len(text.splitlines())
\ No newline at end of file
+        # Same result as len(text.splitlines()) for '\n' and '\r\n' endings, without building the list.
+        if not text:
+            return 0
+        return text.count("\n") + (not text.endswith("\n"))